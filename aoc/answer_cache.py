@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Set
+
+from aoc.util.inputs import Input
+
+
+@functools.lru_cache(maxsize=None)
+def _module_file(module_name: str) -> Optional[Path]:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except ModuleNotFoundError:
+        return None
+    except ValueError:
+        # A day run as a script is __main__, which has no spec but still knows where it came from
+        file = getattr(sys.modules.get(module_name), '__file__', None)
+        if file is None or not file.endswith('.py'):
+            return None
+        return Path(file)
+
+    if spec is None or spec.origin is None or not spec.origin.endswith('.py'):
+        return None
+
+    return Path(spec.origin)
+
+
+def _aoc_imports(source: str) -> Set[str]:
+    result = set()
+
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module is not None:
+            # from aoc.util import grid imports a module, from aoc.util.grid import Grid imports a name
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+
+        result.update(name for name in names if name == 'aoc' or name.startswith('aoc.'))
+
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def source_hash(module_name: str) -> str:
+    """
+    sha256 over the source of a module and every aoc module it imports, transitively. Editing the day or any of the
+    utilities it leans on changes the hash.
+    """
+    seen: Set[str] = set()
+    to_check = [module_name]
+    digest = hashlib.sha256()
+
+    while to_check:
+        name = to_check.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+
+        file = _module_file(name)
+        if file is None:
+            continue
+
+        source = file.read_bytes()
+        to_check.extend(_aoc_imports(source.decode()))
+
+    for name in sorted(seen):
+        file = _module_file(name)
+        if file is None:
+            continue
+
+        digest.update(name.encode())
+        digest.update(b'\0')
+        digest.update(file.read_bytes())
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def input_hash(file_name: str) -> str:
+    return hashlib.sha256(Input(file_name).data()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedAnswer(object):
+    answer: Optional[str]
+    output: str  # Anything the part printed on its own
+
+
+class AnswerCache(object):
+    _cache_dir = Path(__file__).parent.parent / ".cache" / "answers"
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is not None:
+            self._cache_dir = Path(cache_dir)
+
+    def key(self, year: int, day: int, part: int, module_name: str, file_name: str) -> str:
+        return hashlib.sha256(
+            f"{year}:{day}:{part}:{input_hash(file_name)}:{source_hash(module_name)}".encode()
+        ).hexdigest()
+
+    def _path(self, year: int, day: int, part: int, key: str) -> Path:
+        return self._cache_dir / str(year) / str(day) / f"part{part}-{key}.json"
+
+    def get(self, year: int, day: int, part: int, key: str) -> Optional[CachedAnswer]:
+        path = self._path(year, day, part, key)
+
+        try:
+            with path.open('r') as fh:
+                data = json.load(fh)
+            return CachedAnswer(data['answer'], data['output'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, year: int, day: int, part: int, key: str, entry: CachedAnswer):
+        path = self._path(year, day, part, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Parallel runs can write the same entry, so write to a temp file and swap it in
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as fh:
+            json.dump({'year': year, 'day': day, 'part': part, 'answer': entry.answer, 'output': entry.output}, fh)
+        os.replace(temp_name, path)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from aoc.util.inputs import Input
+
+PHASES = ('init', 'part1', 'part2')
+_root = Path(__file__).parent.parent
+
+
+@dataclass(frozen=True)
+class AllocationSite(object):
+    location: str
+    size: int
+    count: int
+
+    def to_dict(self) -> Dict:
+        return {'location': self.location, 'size': self.size, 'count': self.count}
+
+
+class _PeakTracker(threading.Thread):
+    """
+    tracemalloc only tells us how high the peak was, not what was alive at the time. This polls the traced memory
+    in the background and grabs a fresh snapshot every time it grows noticeably, so the last snapshot taken is a
+    decent picture of the peak. Phases that finish before the first poll just get a snapshot at the end.
+    """
+
+    def __init__(self, interval: float = 0.01, growth: float = 1.1):
+        super().__init__(daemon=True)
+        self._interval = interval
+        self._growth = growth
+        self._stop_event = threading.Event()
+        self._baseline = tracemalloc.take_snapshot()
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_size = 0
+        self.peak = 0
+
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            self._maybe_snapshot()
+
+    def _maybe_snapshot(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if self._snapshot is None or current > self._snapshot_size * self._growth:
+            self._snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+    def __enter__(self) -> _PeakTracker:
+        tracemalloc.reset_peak()
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        _, self.peak = tracemalloc.get_traced_memory()
+        self._stop_event.set()
+        self.join()
+        self._maybe_snapshot()
+
+    def top(self, count: int) -> List[AllocationSite]:
+        snapshot = self._snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ])
+
+        result = []
+        for stat in snapshot.compare_to(self._baseline, 'lineno')[:count]:
+            if stat.size_diff <= 0:
+                break
+
+            frame = stat.traceback[0]
+            file_name = Path(frame.filename)
+            if file_name.is_relative_to(_root):
+                file_name = file_name.relative_to(_root)
+
+            result.append(AllocationSite(f"{file_name}:{frame.lineno}", stat.size_diff, stat.count_diff))
+
+        return result
+
+
+@dataclass
+class PhaseTiming(object):
+    year: int
+    day: int
+    phase: str
+    samples_ns: List[int] = field(default_factory=list)
+    answer: Optional[str] = None
+    peak_bytes: Optional[int] = None
+    top_allocations: List[AllocationSite] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        return len(self.samples_ns)
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.samples_ns)
+
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns)
+
+    @property
+    def p95_ns(self) -> int:
+        # Nearest-rank percentile, so with a handful of runs this is just the slowest one
+        ordered = sorted(self.samples_ns)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def to_dict(self) -> Dict:
+        return {
+            'year': self.year,
+            'day': self.day,
+            'phase': self.phase,
+            'runs': self.runs,
+            'min_ns': self.min_ns,
+            'median_ns': self.median_ns,
+            'p95_ns': self.p95_ns,
+            'samples_ns': self.samples_ns,
+            'answer': self.answer,
+            'peak_bytes': self.peak_bytes,
+            'top_allocations': [site.to_dict() for site in self.top_allocations],
+        }
+
+    @staticmethod
+    def from_dict(data: Dict) -> PhaseTiming:
+        return PhaseTiming(
+            year=data['year'],
+            day=data['day'],
+            phase=data['phase'],
+            samples_ns=list(data['samples_ns']),
+            answer=data.get('answer'),
+            peak_bytes=data.get('peak_bytes'),
+            top_allocations=[AllocationSite(**site) for site in data.get('top_allocations', [])],
+        )
+
+
+class Benchmark(object):
+    def __init__(self, repeat: int = 5, warmup: int = 1, memory: bool = False, top: int = 10):
+        if repeat < 1:
+            raise ValueError(f"Need at least 1 timed run per day, got {repeat}")
+        if warmup < 0:
+            raise ValueError(f"Warmup runs can't be negative, got {warmup}")
+
+        self.repeat = repeat
+        self.warmup = warmup
+        self.memory = memory
+        self.top = top
+        self.timings: List[PhaseTiming] = []
+        # (year, day) of every day whose run_day raised, those have no timings
+        self.failed: List[Tuple[int, int]] = []
+
+    def run_day(self, year: int, day: int, cls: Callable, file_name: str) -> List[PhaseTiming]:
+        """
+        Construct the day and run both parts warmup + repeat times. Each iteration gets a fresh instance and starts
+        with Input's file memo cleared, so that reading the input and the rest of __init__ is measured every time.
+        Anything the day prints is thrown away.
+        """
+        timings = {phase: PhaseTiming(year, day, phase) for phase in PHASES}
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for iteration in range(self.warmup + self.repeat):
+                Input.clear_cache()
+                start = time.perf_counter_ns()
+                instance = cls(file_name)
+                init_ns = time.perf_counter_ns() - start
+
+                start = time.perf_counter_ns()
+                answer1 = instance.part1()
+                part1_ns = time.perf_counter_ns() - start
+
+                start = time.perf_counter_ns()
+                answer2 = instance.part2()
+                part2_ns = time.perf_counter_ns() - start
+
+                timings['part1'].answer = None if answer1 is None else str(answer1)
+                timings['part2'].answer = None if answer2 is None else str(answer2)
+
+                if iteration < self.warmup:
+                    continue
+
+                timings['init'].samples_ns.append(init_ns)
+                timings['part1'].samples_ns.append(part1_ns)
+                timings['part2'].samples_ns.append(part2_ns)
+
+            if self.memory:
+                self._measure_memory(timings, cls, file_name)
+
+        result = [timings[phase] for phase in PHASES]
+        self.timings.extend(result)
+        return result
+
+    def _measure_memory(self, timings: Dict[str, PhaseTiming], cls: Callable, file_name: str):
+        """
+        One extra, untimed run under tracemalloc. Tracing slows everything down a lot, so it's kept away from the
+        timed runs. Peaks are of everything allocated since the instance started being constructed.
+        """
+        Input.clear_cache()
+        tracemalloc.start()
+        try:
+            with _PeakTracker() as tracker:
+                instance = cls(file_name)
+            timings['init'].peak_bytes = tracker.peak
+            timings['init'].top_allocations = tracker.top(self.top)
+
+            for phase in ('part1', 'part2'):
+                with _PeakTracker() as tracker:
+                    getattr(instance, phase)()
+                timings[phase].peak_bytes = tracker.peak
+                timings[phase].top_allocations = tracker.top(self.top)
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def _metadata() -> Dict:
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            'commit': commit,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+
+    def write_json(self, file_name: str):
+        with Path(file_name).open('w') as fh:
+            json.dump({
+                'metadata': self._metadata(),
+                'results': [timing.to_dict() for timing in self.timings],
+                'failed': [list(year_day) for year_day in self.failed],
+            }, fh, indent=2)
+
+    @staticmethod
+    def read_json(file_name: str) -> List[PhaseTiming]:
+        with Path(file_name).open('r') as fh:
+            return [PhaseTiming.from_dict(result) for result in json.load(fh)['results']]
+
+    def write_csv(self, file_name: str):
+        with Path(file_name).open('w', newline='') as fh:
+            writer = csv.writer(fh)
+            writer.writerow(['year', 'day', 'phase', 'runs', 'min_ns', 'median_ns', 'p95_ns', 'peak_bytes'])
+            for timing in self.timings:
+                writer.writerow([
+                    timing.year, timing.day, timing.phase, timing.runs,
+                    timing.min_ns, timing.median_ns, timing.p95_ns, timing.peak_bytes
+                ])
+
+    @staticmethod
+    def format(timings: List[PhaseTiming], unit: str = 'ms') -> str:
+        divisor = {'ns': 1, 'us': 1_000, 'ms': 1_000_000, 's': 1_000_000_000}[unit]
+        lines = []
+        for timing in timings:
+            line = (
+                f"{timing.phase:>6}: "
+                f"min {timing.min_ns / divisor:10.3f}{unit}  "
+                f"median {timing.median_ns / divisor:10.3f}{unit}  "
+                f"p95 {timing.p95_ns / divisor:10.3f}{unit}"
+            )
+            if timing.peak_bytes is not None:
+                line += f"  peak {timing.peak_bytes / 2 ** 20:9.2f}MiB"
+            lines.append(line)
+
+            for site in timing.top_allocations:
+                lines.append(f"{'':>8}{site.size / 2 ** 20:9.2f}MiB {site.count:>9} blocks  {site.location}")
+        return '\n'.join(lines)
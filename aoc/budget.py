@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+import re
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+_size_re = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$', re.IGNORECASE)
+_size_units = {'': 1, 'K': 2 ** 10, 'M': 2 ** 20, 'G': 2 ** 30, 'T': 2 ** 40}
+
+
+def parse_size(size: Union[str, int]) -> int:
+    """
+    Turn "512M", "2G", "1.5GiB" or a plain number of bytes into bytes.
+    """
+    if isinstance(size, int):
+        return size
+
+    matched = _size_re.match(size)
+    if matched is None:
+        raise ValueError(f"Can't parse size \"{size}\"")
+
+    return int(float(matched.group(1)) * _size_units[matched.group(2).upper()])
+
+
+def rss(pid: int) -> Optional[int]:
+    """
+    Resident set size of a process in bytes, or None if we can't tell (no /proc, or it's already gone).
+    """
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as fh:
+            return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass(frozen=True)
+class Budget(object):
+    timeout: Optional[float] = None
+    max_rss: Optional[int] = None
+
+    @property
+    def limited(self) -> bool:
+        return self.timeout is not None or self.max_rss is not None
+
+    def overridden_by(self, other: Budget) -> Budget:
+        return Budget(
+            timeout=other.timeout if other.timeout is not None else self.timeout,
+            max_rss=other.max_rss if other.max_rss is not None else self.max_rss,
+        )
+
+    @staticmethod
+    def from_dict(data: Dict) -> Budget:
+        max_rss = data.get('max_rss')
+        return Budget(
+            timeout=float(data['timeout']) if 'timeout' in data else None,
+            max_rss=parse_size(max_rss) if max_rss is not None else None,
+        )
+
+
+@dataclass
+class BudgetTable(object):
+    """
+    Budgets are looked up most specific first: a day's own entry, then its year, then the default. Each limit falls
+    through on its own, so a day can raise its timeout and still inherit the year's memory limit.
+    """
+    default: Budget = Budget()
+    years: Dict[int, Budget] = field(default_factory=dict)
+    days: Dict[Tuple[int, int], Budget] = field(default_factory=dict)
+
+    def for_day(self, year: int, day: int) -> Budget:
+        result = self.default
+        if year in self.years:
+            result = result.overridden_by(self.years[year])
+        if (year, day) in self.days:
+            result = result.overridden_by(self.days[(year, day)])
+        return result
+
+    @staticmethod
+    def load(file_name: Union[str, Path], default: Budget = Budget()) -> BudgetTable:
+        """
+        Reads a TOML file like:
+
+            [default]
+            timeout = 60
+            max_rss = "2G"
+
+            [2016]
+            timeout = 120
+
+            ["2016:14"]
+            timeout = 600
+
+        Anything in the file's [default] table wins over the default passed in (usually from the command line).
+        """
+        with Path(file_name).open('rb') as fh:
+            data = tomllib.load(fh)
+
+        result = BudgetTable(default=default)
+        for key, value in data.items():
+            if key == 'default':
+                result.default = default.overridden_by(Budget.from_dict(value))
+            elif ':' in key:
+                year, day = key.split(':')
+                result.days[(int(year), int(day))] = Budget.from_dict(value)
+            else:
+                result.years[int(key)] = Budget.from_dict(value)
+
+        return result
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import enum
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from aoc.benchmark import PHASES, PhaseTiming
+
+
+class Verdict(enum.Enum):
+    REGRESSED = enum.auto()
+    IMPROVED = enum.auto()
+    UNCHANGED = enum.auto()
+    NOISY = enum.auto()  # Moved past the threshold, but not by more than the runs disagree with each other
+    NEW = enum.auto()
+    MISSING = enum.auto()
+
+
+def mann_whitney_p(baseline: Sequence[int], current: Sequence[int]) -> float:
+    """
+    One sided Mann-Whitney U test: the chance of the current samples ranking at least this far above the baseline
+    samples if both came from the same distribution. Uses the normal approximation with a tie correction, which is
+    close enough for the 5-ish runs a benchmark takes and needs nothing outside the standard library.
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    ranks = [0.0] * len(combined)
+    ties = 0.0
+
+    start = 0
+    while start < len(combined):
+        end = start
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[start][0]:
+            end += 1
+
+        # Tied values all share the average of the ranks they cover
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+
+        tied = end - start + 1
+        ties += tied ** 3 - tied
+        start = end + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    # Continuity correction, since U only moves in steps of 0.5
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass(frozen=True)
+class Comparison(object):
+    year: int
+    day: int
+    phase: str
+    verdict: Verdict
+    baseline: Optional[PhaseTiming] = None
+    current: Optional[PhaseTiming] = None
+    p_value: Optional[float] = None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline is None or self.current is None or self.baseline.median_ns == 0:
+            return None
+        return self.current.median_ns / self.baseline.median_ns
+
+    def format(self, unit: str = 'ms') -> str:
+        divisor = {'ns': 1, 'us': 1_000, 'ms': 1_000_000, 's': 1_000_000_000}[unit]
+        line = f"{self.year} day {self.day:>2} {self.phase:>5}: {self.verdict.name:<9}"
+
+        if self.baseline is not None and self.current is not None:
+            line += (
+                f" median {self.baseline.median_ns / divisor:10.3f}{unit} -> "
+                f"{self.current.median_ns / divisor:10.3f}{unit}"
+            )
+            if self.ratio is not None:
+                line += f" ({(self.ratio - 1) * 100:+7.1f}%)"
+            if self.p_value is not None:
+                line += f"  p={self.p_value:.3f}"
+
+        return line
+
+
+def compare(baseline: List[PhaseTiming],
+            current: List[PhaseTiming],
+            threshold: float = 0.10,
+            alpha: float = 0.05,
+            min_delta_ns: int = 1_000_000) -> List[Comparison]:
+    """
+    Line up every (year, day, phase) in the two runs. A phase only counts as regressed (or improved) when all of these
+    hold:
+
+    - its median moved by more than threshold (0.10 is 10%)
+    - it moved by more than min_delta_ns, so a part going from 2us to 3us doesn't fail anything
+    - a Mann-Whitney test says the shift is unlikely to be noise, at significance alpha
+
+    Moves that pass the first two but not the test are NOISY: rerun with more --repeat to find out.
+    """
+    def by_key(timings: List[PhaseTiming]) -> Dict[Tuple[int, int, str], PhaseTiming]:
+        return {(timing.year, timing.day, timing.phase): timing for timing in timings}
+
+    baseline_by_key = by_key(baseline)
+    current_by_key = by_key(current)
+
+    def order(key: Tuple[int, int, str]):
+        year, day, phase = key
+        return year, day, PHASES.index(phase) if phase in PHASES else len(PHASES), phase
+
+    result = []
+    for key in sorted(baseline_by_key.keys() | current_by_key.keys(), key=order):
+        year, day, phase = key
+        before = baseline_by_key.get(key)
+        after = current_by_key.get(key)
+
+        if before is None or not before.samples_ns:
+            result.append(Comparison(year, day, phase, Verdict.NEW, current=after))
+            continue
+        if after is None or not after.samples_ns:
+            result.append(Comparison(year, day, phase, Verdict.MISSING, baseline=before))
+            continue
+
+        delta = after.median_ns - before.median_ns
+        if abs(delta) <= min_delta_ns or abs(delta) <= threshold * before.median_ns:
+            result.append(Comparison(year, day, phase, Verdict.UNCHANGED, before, after))
+            continue
+
+        if delta > 0:
+            p_value = mann_whitney_p(before.samples_ns, after.samples_ns)
+            verdict = Verdict.REGRESSED
+        else:
+            p_value = mann_whitney_p(after.samples_ns, before.samples_ns)
+            verdict = Verdict.IMPROVED
+
+        if p_value >= alpha:
+            verdict = Verdict.NOISY
+
+        result.append(Comparison(year, day, phase, verdict, before, after, p_value))
+
+    return result
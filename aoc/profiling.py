@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import cProfile
+import enum
+import os
+import pstats
+import re
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Callable, Counter, List, Optional
+
+_root = Path(__file__).parent.parent
+_import_time_re = re.compile(r'^import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S+)$')
+
+
+class ProfilerMode(enum.Enum):
+    CPROFILE = 'cprofile'
+    SAMPLE = 'sample'
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    file_name = Path(code.co_filename)
+    if file_name.is_relative_to(_root):
+        file_name = file_name.relative_to(_root)
+
+    # Collapsed stacks use ';' between frames and ' ' before the count, so neither can show up in a frame name
+    return f"{file_name}:{code.co_qualname}".replace(';', ':').replace(' ', '_')
+
+
+class SamplingProfiler(threading.Thread):
+    """
+    Every interval, look at what the profiled thread is doing and count the whole stack. Much cheaper than cProfile
+    on call-heavy code, and the counts feed straight into flamegraph.pl / speedscope / inferno as collapsed stacks.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: Optional[int] = None):
+        super().__init__(daemon=True)
+        self._interval = interval
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stop_event = threading.Event()
+        self._previous_switch_interval: Optional[float] = None
+        self._base_depth = 0
+        self.stacks: Counter[str] = collections.Counter()
+
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+
+            names: List[str] = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+
+            # Drop everything from the entry point down to whoever started profiling
+            names = names[:len(names) - self._base_depth]
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def __enter__(self) -> SamplingProfiler:
+        frame = sys._getframe(1)
+        while frame is not None:
+            self._base_depth += 1
+            frame = frame.f_back
+
+        # The profiled thread only gives up the GIL every switch interval, which would otherwise cap our sample rate
+        self._previous_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._previous_switch_interval, self._interval))
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop_event.set()
+        self.join()
+        sys.setswitchinterval(self._previous_switch_interval)
+
+    def write_collapsed(self, file_name: Path):
+        with Path(file_name).open('w') as fh:
+            for stack, count in sorted(self.stacks.items()):
+                fh.write(f"{stack} {count}\n")
+
+
+def profile_call(function: Callable[[], object], mode: ProfilerMode, output: Path, interval: float = 0.001):
+    """
+    Run function under the chosen profiler. output is the path without an extension: cProfile writes output.prof,
+    the sampling profiler writes output.collapsed. Anything function prints is thrown away.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        if mode == ProfilerMode.CPROFILE:
+            profiler = cProfile.Profile()
+            profiler.runcall(function)
+        else:
+            with SamplingProfiler(interval=interval) as sampler:
+                function()
+
+    if mode == ProfilerMode.CPROFILE:
+        path = output.with_suffix('.prof')
+        profiler.dump_stats(path)
+        pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(15)
+    else:
+        path = output.with_suffix('.collapsed')
+        sampler.write_collapsed(path)
+        leaves: Counter[str] = collections.Counter()
+        for stack, count in sampler.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        for leaf, count in leaves.most_common(15):
+            print(f"{count:>8} {leaf}")
+
+    print(f"Wrote {path}")
+
+
+@dataclass(frozen=True)
+class ImportTime(object):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def import_times(module_name: str) -> List[ImportTime]:
+    """
+    Import a module in a fresh interpreter under -X importtime, so nothing the current process already imported
+    hides the cost. Entries come back in the order Python reports them: children before their parent.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module_name}"],
+        capture_output=True, text=True, cwd=_root
+    )
+
+    result = []
+    for line in completed.stderr.splitlines():
+        matched = _import_time_re.match(line)
+        if matched is None:
+            continue
+
+        self_us, cumulative_us, indent, name = matched.groups()
+        result.append(ImportTime(name, int(self_us), int(cumulative_us), len(indent) // 2))
+
+    return result
+
+
+def direct_imports(times: List[ImportTime], module_name: str) -> List[ImportTime]:
+    """
+    The imports module_name itself triggered, heaviest first. Everything nested under a module is listed just before
+    it, so walk backwards from it until we climb back out to its own depth.
+    """
+    index = next(i for i, entry in enumerate(times) if entry.module == module_name)
+    depth = times[index].depth
+
+    result = []
+    for entry in reversed(times[:index]):
+        if entry.depth <= depth:
+            break
+        if entry.depth == depth + 1:
+            result.append(entry)
+
+    return sorted(result, key=lambda entry: entry.cumulative_us, reverse=True)
@@ -1,23 +1,213 @@
+import argparse
+import collections
+import contextlib
+import enum
 import importlib
+import io
+import itertools
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
+from aoc.answer_cache import AnswerCache, CachedAnswer
+from aoc.benchmark import Benchmark, PHASES
+from aoc.budget import Budget, BudgetTable, parse_size, rss
+from aoc.compare import Verdict, compare
+from aoc.profiling import ProfilerMode, direct_imports, import_times, profile_call
 from aoc.util.inputs import Input
 
 
+class DayStatus(enum.Enum):
+    OK = enum.auto()
+    CRASHED = enum.auto()
+    TIMEOUT = enum.auto()
+    OOM = enum.auto()
+
+
+@dataclass(frozen=True)
+class DayResult(object):
+    year: int
+    day: int
+    output: str
+    status: DayStatus = DayStatus.OK
+    timings_ns: Dict[str, int] = field(default_factory=dict)
+    running_phase: Optional[str] = None
+    running_ns: Optional[int] = None
+
+    def summary(self) -> str:
+        parts = [f"{phase} {elapsed / 1e9:.3f}s" for phase, elapsed in self.timings_ns.items()]
+        if self.running_phase is not None:
+            parts.append(f"{self.running_phase} still running after {self.running_ns / 1e9:.3f}s")
+
+        result = f"Day {self.day} {self.status.name}"
+        if parts:
+            result += f" ({', '.join(parts)})"
+        return result
+
+
+_year_package_re = re.compile(r'^y(\d{4})$')
+_day_module_re = re.compile(r'^d(\d+)\.py$')
+_selector_re = re.compile(r'^(\d{4})(?:-(\d{4}))?(?::(\d+)(?:-(\d+))?)?$')
+
+
+def discover_days(root: Path = Path(__file__).parent) -> List[Tuple[int, int]]:
+    """
+    Every (year, day) that has a module, found by looking for aoc/yYYYY/dN.py rather than trusting a hard-coded list.
+    """
+    result = []
+
+    for year_dir in root.iterdir():
+        year_matched = _year_package_re.match(year_dir.name)
+        if year_matched is None or not (year_dir / '__init__.py').exists():
+            continue
+
+        for module in year_dir.iterdir():
+            day_matched = _day_module_re.match(module.name)
+            if day_matched is not None:
+                result.append((int(year_matched.group(1)), int(day_matched.group(1))))
+
+    return sorted(result)
+
+
+def parse_selection(selection: str) -> Callable[[int, int], bool]:
+    """
+    Parses a comma separated list of selectors like "2019:1-10,2023:17". Each one is a year or a range of years
+    (2015-2017), optionally followed by a day or range of days. A year on its own selects all of its days.
+    """
+    ranges: List[Tuple[int, int, int, int]] = []
+
+    for selector in selection.split(','):
+        matched = _selector_re.match(selector.strip())
+        if matched is None:
+            raise ValueError(f"Can't parse day selector \"{selector}\"")
+
+        first_year, last_year, first_day, last_day = matched.groups()
+        first_year = int(first_year)
+        last_year = int(last_year) if last_year is not None else first_year
+        first_day = int(first_day) if first_day is not None else 1
+        last_day = int(last_day) if last_day is not None else (first_day if matched.group(3) is not None else 25)
+        ranges.append((first_year, last_year, first_day, last_day))
+
+    def selected(year: int, day: int) -> bool:
+        return any(
+            first_year <= year <= last_year and first_day <= day <= last_day
+            for first_year, last_year, first_day, last_day in ranges
+        )
+
+    return selected
+
+
 class AoCRunner(object):
-    years = [2015, 2016, 2017, 2018, 2019]
-    
-    def run(self):
-        for year in self.years:
-            self._run_year(year)
+    def __init__(self,
+                 cache: Optional[AnswerCache] = None,
+                 budgets: Optional[BudgetTable] = None,
+                 days: Optional[List[Tuple[int, int]]] = None):
+        self.days = days if days is not None else discover_days()
+        self.cache = cache
+        self.budgets = budgets if budgets is not None else BudgetTable()
+        # Called with (phase, elapsed ns) as each phase of a day finishes
+        self.on_phase: Optional[Callable[[str, int], None]] = None
+
+    def select(self, selection: str):
+        selected = parse_selection(selection)
+        self.days = [(year, day) for year, day in self.days if selected(year, day)]
+
+    def _by_year(self) -> Iterator[Tuple[int, List[int]]]:
+        for year, year_days in itertools.groupby(self.days, key=lambda year_day: year_day[0]):
+            yield year, [day for _, day in year_days]
+
+    def run(self, jobs: int = 1):
+        if jobs <= 1:
+            for year, days in self._by_year():
+                self._run_year(year, days)
+            return
+
+        current_year = None
+        for result in self._run_parallel(self.days, jobs):
+            if result.year != current_year:
+                current_year = result.year
+                print(f"=== Year {current_year} ===")
 
-    def _run_year(self, year):
+            self._print_result(result)
+
+    def _run_year(self, year, days):
         print(f"=== Year {year} ===")
-        for day in range(1, 26):
-            self._run_day(year, day)
-            print()
+        for day in days:
+            budget = self.budgets.for_day(year, day)
+            if budget.limited:
+                self._print_result(_run_day_supervised(self, year, day, budget))
+            else:
+                self._run_day(year, day)
+                print()
+
+    @staticmethod
+    def _print_result(result: DayResult):
+        print(result.output, end='')
+        if result.status != DayStatus.OK:
+            print(result.summary())
+        print()
+
+    @staticmethod
+    def _print_answer(part: int, answer):
+        if answer is not None:
+            print(f"Part {part}:", answer)
+
+    def _phase(self, phase: str, function: Callable, *args):
+        start = time.perf_counter_ns()
+        result = function(*args)
+
+        if self.on_phase is not None:
+            self.on_phase(phase, time.perf_counter_ns() - start)
+
+        return result
 
     def _run_day(self, year, day):
         print(f"=== Day {day} ===")
+        loaded = self._load_day(year, day)
+        if loaded is None:
+            return
+
+        cls, file_name = loaded
+        if self.cache is None:
+            instance = self._phase('init', cls, file_name)
+            self._print_answer(1, self._phase('part1', instance.part1))
+            self._print_answer(2, self._phase('part2', instance.part2))
+            return
+
+        keys = [self.cache.key(year, day, part, cls.__module__, file_name) for part in (1, 2)]
+        entries = [self.cache.get(year, day, part, key) for part, key in zip((1, 2), keys)]
+        if all(entry is not None for entry in entries):
+            for part, entry in zip((1, 2), entries):
+                print(entry.output, end='')
+                self._print_answer(part, entry.answer)
+            return
+
+        # Part 2 is allowed to depend on state part 1 left behind, so a miss on either part reruns the whole day
+        instance = self._phase('init', cls, file_name)
+        for part, key, phase in zip((1, 2), keys, ('part1', 'part2')):
+            # Parts whose answer has to be read off a drawing still print it themselves, so keep that too
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                answer = self._phase(phase, getattr(instance, phase))
+
+            print(output.getvalue(), end='')
+            self._print_answer(part, answer)
+            entry = CachedAnswer(None if answer is None else str(answer), output.getvalue())
+            self.cache.put(year, day, part, key, entry)
+
+    def _load_day(self, year, day) -> Optional[Tuple[Callable, str]]:
+        """
+        Find the solution class and input file for a day, printing why not and returning None if we can't.
+        """
         module_name = f"aoc.y{year}.d{day}"
         class_name = f"Y{year}D{day}"
         file_name = f"{year}/{day}.txt"
@@ -26,21 +216,334 @@ class AoCRunner(object):
             module = importlib.import_module(module_name)
         except ModuleNotFoundError:
             print(f"Module \"{module_name}\" not found")
-            return
+            return None
 
         if class_name not in module.__dict__:
             print(f"Class \"{class_name}\" not found")
-            return
+            return None
 
         if not Input(file_name).exists():
             print(f"File \"{file_name}\" does not exist")
+            return None
+
+        return module.__dict__[class_name], file_name
+
+    def benchmark(self, repeat: int = 5, warmup: int = 1, memory: bool = False, top: int = 10) -> Benchmark:
+        benchmark = Benchmark(repeat=repeat, warmup=warmup, memory=memory, top=top)
+
+        for year, days in self._by_year():
+            print(f"=== Year {year} ===")
+            for day in days:
+                print(f"=== Day {day} ===")
+                loaded = self._load_day(year, day)
+                if loaded is not None:
+                    cls, file_name = loaded
+                    try:
+                        print(Benchmark.format(benchmark.run_day(year, day, cls, file_name)))
+                    except Exception:
+                        # Same as a normal run, one broken day shouldn't cost the timings of all the others
+                        traceback.print_exc(file=sys.stdout)
+                        print(f"Day {day} {DayStatus.CRASHED.name}")
+                        benchmark.failed.append((year, day))
+                print()
+
+        if benchmark.failed:
+            print("Failed:", ', '.join(f"{year} day {day}" for year, day in benchmark.failed))
+
+        return benchmark
+
+    def profile(self, year: int, day: int, mode: ProfilerMode, phases=PHASES, output_dir: Path = Path('profiles'),
+                interval: float = 0.001):
+        """
+        Run a day with the selected phases under a profiler, one output file per phase. Phases before the last selected
+        one still run (unprofiled) since later parts can depend on what earlier ones did.
+        """
+        print(f"=== Day {day} ===")
+        loaded = self._load_day(year, day)
+        if loaded is None:
             return
 
-        cls = module.__dict__[class_name](file_name)
-        cls.part1()
-        cls.part2()
+        cls, file_name = loaded
+        instance = None
+
+        def construct():
+            nonlocal instance
+            instance = cls(file_name)
+
+        last_phase = max(PHASES.index(phase) for phase in phases)
+        for phase in PHASES[:last_phase + 1]:
+            function = construct if phase == 'init' else (lambda name=phase: getattr(instance, name)())
+
+            if phase in phases:
+                print(f"--- {phase} ---")
+                profile_call(function, mode, output_dir / f"{year}_{day}_{phase}", interval=interval)
+            else:
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    function()
+
+    def import_report(self, top: int = 5):
+        """
+        How long each day module takes to import from a cold interpreter, and which of its imports cost the most.
+        """
+        for year, days in self._by_year():
+            print(f"=== Year {year} ===")
+            for day in days:
+                module_name = f"aoc.y{year}.d{day}"
+                times = import_times(module_name)
+                if not any(entry.module == module_name for entry in times):
+                    continue
+
+                total = next(entry for entry in times if entry.module == module_name)
+                heaviest = ', '.join(
+                    f"{entry.module} {entry.cumulative_us / 1000:.1f}ms"
+                    for entry in direct_imports(times, module_name)[:top]
+                )
+                print(f"Day {day:>2}: {total.cumulative_us / 1000:8.1f}ms  ({heaviest})")
+
+    def _run_parallel(self, days: List[Tuple[int, int]], jobs: int) -> Iterator[DayResult]:
+        """
+        Results are yielded in the same order as days. Hung or bloated days are killed by their own budget, but if a
+        worker dies outright the pool is torn down, that day gets reported, and everything after it is resubmitted to
+        a fresh pool.
+        """
+        remaining = list(days)
+
+        while remaining:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            futures = [executor.submit(_run_day_captured, self, year, day) for year, day in remaining]
+            finished = 0
+            broken = False
+
+            for (year, day), future in zip(remaining, futures):
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    # Every running day fails when the pool breaks, so rerun this one alone to find out if it was us
+                    result = self._run_isolated(year, day)
+                    broken = True
+
+                yield result
+                finished += 1
+
+                if broken:
+                    break
+
+            executor.shutdown(wait=not broken, cancel_futures=broken)
+            remaining = remaining[finished:]
+
+    def _run_isolated(self, year: int, day: int) -> DayResult:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            try:
+                return executor.submit(_run_day_captured, self, year, day).result()
+            except BrokenProcessPool:
+                return DayResult(year, day, f"=== Day {day} ===\nWorker process died\n", DayStatus.CRASHED)
+
+
+def _run_day_captured(runner: AoCRunner, year: int, day: int) -> DayResult:
+    budget = runner.budgets.for_day(year, day)
+    if budget.limited:
+        return _run_day_supervised(runner, year, day, budget)
+
+    output = io.StringIO()
+    status = DayStatus.OK
+    timings_ns: Dict[str, int] = {}
+    runner.on_phase = timings_ns.__setitem__
+
+    with contextlib.redirect_stdout(output):
+        try:
+            runner._run_day(year, day)
+        except Exception:
+            traceback.print_exc(file=output)
+            status = DayStatus.CRASHED
+
+    return DayResult(year, day, output.getvalue(), status, timings_ns)
+
+
+class _ConnectionWriter(io.TextIOBase):
+    """
+    Forwards everything written to it over a pipe, so the supervisor has the output so far if it has to kill us.
+    """
+
+    def __init__(self, connection: Connection):
+        self._connection = connection
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._connection.send(('output', text))
+        return len(text)
+
+
+def _run_day_child(runner: AoCRunner, year: int, day: int, connection: Connection):
+    runner.on_phase = lambda phase, elapsed: connection.send(('phase', phase, elapsed))
+    writer = _ConnectionWriter(connection)
+    status = DayStatus.OK
+
+    with contextlib.redirect_stdout(writer):
+        try:
+            runner._run_day(year, day)
+        except Exception:
+            traceback.print_exc(file=writer)
+            status = DayStatus.CRASHED
+
+    connection.send(('done', status))
+    connection.close()
+
+
+def _run_day_supervised(runner: AoCRunner, year: int, day: int, budget: Budget, poll: float = 0.05) -> DayResult:
+    """
+    Run a day in its own process and kill it if it goes over its wall-clock or RSS budget. RSS is read from /proc,
+    so the memory limit is only enforced where that exists.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_day_child, args=(runner, year, day, sender), daemon=True)
+
+    start = time.monotonic_ns()
+    process.start()
+    sender.close()
+
+    output: List[str] = []
+    timings_ns: Dict[str, int] = {}
+    phase_start = start
+    status: Optional[DayStatus] = None
+
+    while status is None:
+        if receiver.poll(poll):
+            try:
+                message = receiver.recv()
+            except EOFError:
+                output.append("Day process died\n")
+                status = DayStatus.CRASHED
+                break
+
+            if message[0] == 'output':
+                output.append(message[1])
+            elif message[0] == 'phase':
+                timings_ns[message[1]] = message[2]
+                phase_start = time.monotonic_ns()
+            elif message[0] == 'done':
+                status = message[1]
+            continue
+
+        now = time.monotonic_ns()
+        if budget.timeout is not None and now - start > budget.timeout * 1e9:
+            status = DayStatus.TIMEOUT
+        elif budget.max_rss is not None and (rss(process.pid) or 0) > budget.max_rss:
+            status = DayStatus.OOM
+
+    running_phase = running_ns = None
+    if status in (DayStatus.TIMEOUT, DayStatus.OOM):
+        process.kill()
+        running_phase = next((phase for phase in PHASES if phase not in timings_ns), None)
+        running_ns = time.monotonic_ns() - phase_start
+
+    process.join()
+    receiver.close()
+
+    return DayResult(year, day, ''.join(output), status, timings_ns, running_phase, running_ns)
 
 
 if __name__ == '__main__':
-    runner = AoCRunner()
-    runner.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run Advent of Code solutions")
+    parser.add_argument('--days', '-d', default=None,
+                        help="Only these days, e.g. 2019:1-10,2023:17 or 2015-2017 (default: every day that exists)")
+    parser.add_argument('--jobs', '-j', type=int, default=1, help="Number of days to run in parallel")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="Default wall-clock budget per day in seconds, after which it's killed")
+    parser.add_argument('--max-rss', type=parse_size, default=None,
+                        help="Default memory budget per day (e.g. 2G), after which it's killed (needs /proc)")
+    parser.add_argument('--budgets', type=Path, default=None,
+                        help="TOML file with per year/day budgets that override --timeout and --max-rss")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Time __init__, part1 and part2 of each day instead of just running them")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per day when benchmarking")
+    parser.add_argument('--warmup', type=int, default=1, help="Untimed runs per day before benchmarking")
+    parser.add_argument('--memory', action='store_true',
+                        help="Also record tracemalloc peaks and top allocation sites per phase (implies --benchmark)")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Allocation sites per phase with --memory, or imports per day with --import-times")
+    parser.add_argument('--json', help="Write benchmark results to this JSON file")
+    parser.add_argument('--csv', help="Write benchmark results to this CSV file")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="Benchmark the selected days and compare against a previous --json file, "
+                             "exiting with 1 if anything got slower")
+    parser.add_argument('--against', metavar='CURRENT',
+                        help="With --compare, compare against this --json file instead of benchmarking again")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="Percent a median has to move by before --compare cares")
+    parser.add_argument('--min-delta', type=float, default=1.0,
+                        help="Milliseconds a median has to move by before --compare cares")
+    parser.add_argument('--alpha', type=float, default=0.05,
+                        help="Significance level for --compare's Mann-Whitney test")
+    parser.add_argument('--profile', choices=[mode.value for mode in ProfilerMode],
+                        help="Run the selected days under cProfile or the sampling profiler")
+    parser.add_argument('--part', choices=PHASES, action='append',
+                        help="Phase to profile, can be repeated (default: all of them)")
+    parser.add_argument('--profile-dir', type=Path, default=Path('profiles'),
+                        help="Where to write .prof / .collapsed files")
+    parser.add_argument('--interval', type=float, default=0.001, help="Seconds between samples for --profile sample")
+    parser.add_argument('--import-times', action='store_true',
+                        help="Report how long each day module takes to import and its --top heaviest imports")
+    parser.add_argument('--cache', action='store_true',
+                        help="Reuse answers from previous runs when neither the input nor the solution code changed")
+    args = parser.parse_args()
+
+    default_budget = Budget(timeout=args.timeout, max_rss=args.max_rss)
+    budgets = BudgetTable.load(args.budgets, default_budget) if args.budgets else BudgetTable(default_budget)
+
+    runner = AoCRunner(cache=AnswerCache() if args.cache else None, budgets=budgets)
+    if args.days is not None:
+        try:
+            runner.select(args.days)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.repeat < 1:
+        parser.error(f"--repeat has to be at least 1, got {args.repeat}")
+    if args.warmup < 0:
+        parser.error(f"--warmup can't be negative, got {args.warmup}")
+
+    if args.import_times:
+        runner.import_report(top=args.top)
+    elif args.profile:
+        for year, day in runner.days:
+            runner.profile(year, day, ProfilerMode(args.profile), phases=args.part or PHASES,
+                           output_dir=args.profile_dir, interval=args.interval)
+    elif args.compare:
+        baseline = Benchmark.read_json(args.compare)
+        if args.against:
+            current = Benchmark.read_json(args.against)
+        else:
+            # Only bother timing days the baseline knows about
+            baseline_days = {(timing.year, timing.day) for timing in baseline}
+            runner.days = [year_day for year_day in runner.days if year_day in baseline_days]
+            results = runner.benchmark(repeat=args.repeat, warmup=args.warmup)
+            if args.json:
+                results.write_json(args.json)
+            current = results.timings
+
+        if args.days is not None:
+            selected = set(runner.days)
+            baseline = [timing for timing in baseline if (timing.year, timing.day) in selected]
+            current = [timing for timing in current if (timing.year, timing.day) in selected]
+
+        comparisons = compare(baseline, current, threshold=args.threshold / 100, alpha=args.alpha,
+                              min_delta_ns=int(args.min_delta * 1_000_000))
+        print("=== Comparison ===")
+        for comparison in comparisons:
+            if comparison.verdict != Verdict.UNCHANGED:
+                print(comparison.format())
+
+        counts = collections.Counter(comparison.verdict for comparison in comparisons)
+        print(', '.join(f"{counts[verdict]} {verdict.name.lower()}" for verdict in Verdict))
+        if counts[Verdict.REGRESSED]:
+            sys.exit(1)
+    elif args.benchmark or args.memory:
+        results = runner.benchmark(repeat=args.repeat, warmup=args.warmup, memory=args.memory, top=args.top)
+        if args.json:
+            results.write_json(args.json)
+        if args.csv:
+            results.write_csv(args.csv)
+    else:
+        runner.run(jobs=args.jobs)
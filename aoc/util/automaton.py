@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import itertools
+import operator
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Generic, Hashable, Iterable, List, Sequence, Tuple, TypeVar, Union
+
+from aoc.util.grid import Grid
+
+Cell = TypeVar('Cell', bound=Hashable)
+Offset = Tuple[int, ...]
+
+# Neighborhoods as offsets, in X_RIGHT_Y_DOWN (dx, dy) for the 2D ones
+VON_NEUMANN: Tuple[Offset, ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+MOORE: Tuple[Offset, ...] = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+# Axial hex coordinates, where the six neighbors are the two on the same row and two on each of the rows above and below
+HEX: Tuple[Offset, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, -1), (-1, 1))
+
+
+def moore(dimensions: int) -> Tuple[Offset, ...]:
+    """
+    Everything within one step on every axis: 8 neighbors in 2D, 26 in 3D, 80 in 4D.
+    """
+    return tuple(offset for offset in itertools.product((-1, 0, 1), repeat=dimensions) if any(offset))
+
+
+def von_neumann(dimensions: int) -> Tuple[Offset, ...]:
+    """
+    One step along a single axis: 4 neighbors in 2D, 6 in 3D.
+    """
+    result = []
+    for axis in range(dimensions):
+        for step in (-1, 1):
+            result.append(tuple(step if i == axis else 0 for i in range(dimensions)))
+    return tuple(result)
+
+
+@dataclass(frozen=True)
+class LifeRule(object):
+    """
+    A dead cell comes alive with a neighbor count in born, a live one stays alive with a count in survive. Conway's
+    Game of Life is LifeRule(born={3}, survive={2, 3}).
+    """
+    born: FrozenSet[int]
+    survive: FrozenSet[int]
+
+    def __init__(self, born: Iterable[int], survive: Iterable[int]):
+        object.__setattr__(self, 'born', frozenset(born))
+        object.__setattr__(self, 'survive', frozenset(survive))
+
+
+class _Automaton(object):
+    generation: int
+
+    def step(self):
+        raise NotImplementedError()
+
+    def state_key(self) -> Hashable:
+        raise NotImplementedError()
+
+    def run(self, generations: int):
+        for _ in range(generations):
+            self.step()
+
+    def find_cycle(self) -> Tuple[int, int]:
+        """
+        Step until a state shows up a second time, and stop there. Returns the generation it was first seen in and
+        how long the cycle is.
+        """
+        seen: Dict[Hashable, int] = {}
+        key = self.state_key()
+        while key not in seen:
+            seen[key] = self.generation
+            self.step()
+            key = self.state_key()
+
+        return seen[key], self.generation - seen[key]
+
+    def advance_to(self, generation: int):
+        """
+        Get to the given generation, skipping whole cycles once the states start repeating.
+        """
+        seen: Dict[Hashable, int] = {}
+        while self.generation < generation:
+            key = self.state_key()
+            if key in seen:
+                cycle = self.generation - seen[key]
+                self.run((generation - self.generation) % cycle)
+                self.generation = generation
+                return
+
+            seen[key] = self.generation
+            self.step()
+
+
+class SparseAutomaton(_Automaton, Generic[Cell]):
+    """
+    A two state automaton over any cells at all: N-dimensional tuples, hex coordinates, or whatever the neighbors
+    function knows how to walk. Only the live cells are kept. Each step every live cell adds one to each of its
+    neighbors in a Counter, so nothing ever looks at a dead cell that isn't next to a live one.
+
+    neighborhood is either offsets to add to tuple cells (VON_NEUMANN, MOORE, HEX, moore(4), ...) or a function from
+    a cell to its neighbors.
+    """
+
+    def __init__(self,
+                 live: Iterable[Cell],
+                 rule: LifeRule,
+                 neighborhood: Union[Sequence[Offset], Callable[[Cell], Iterable[Cell]]] = MOORE):
+        self.live: FrozenSet[Cell] = frozenset(live)
+        self.rule = rule
+        self.generation = 0
+
+        if callable(neighborhood):
+            self._neighbors = neighborhood
+        else:
+            offsets = tuple(neighborhood)
+
+            if all(len(offset) == 2 for offset in offsets):
+                # 2D is the common case, and skipping map/tuple there is noticeably faster
+                def neighbors(cell):
+                    x, y = cell
+                    return [(x + dx, y + dy) for dx, dy in offsets]
+            else:
+                def neighbors(cell):
+                    return [tuple(map(operator.add, cell, offset)) for offset in offsets]
+
+            self._neighbors = neighbors
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def __contains__(self, cell: Cell) -> bool:
+        return cell in self.live
+
+    def step(self):
+        born = self.rule.born
+        survive = self.rule.survive
+        live = self.live
+
+        counts = Counter(itertools.chain.from_iterable(map(self._neighbors, live)))
+        result = {cell for cell, count in counts.items() if (count in survive if cell in live else count in born)}
+        if 0 in survive:
+            # Live cells with no live neighbors never got counted
+            result.update(cell for cell in live if cell not in counts)
+
+        self.live = frozenset(result)
+        self.generation += 1
+
+    def state_key(self) -> FrozenSet[Cell]:
+        return self.live
+
+
+class DenseAutomaton(_Automaton):
+    """
+    A width x height automaton with any number of states, stored as small ints in a flat list with a border of
+    outside cells around it. The rule is called once per (state, neighbor counts) up front to build a table, and
+    each step is then a handful of list-wide map()s: one shifted add per neighbor offset, one table lookup per cell.
+    Two buffers are swapped between steps instead of building a new grid every time.
+
+    rule(state, counts) gets counts[s] = how many neighbors are in state s, for every state other than 0. counts[0] is
+    whatever is left over. Cells off the edge are in state outside and counted as that state, so they only end up in
+    counts[0] when outside is 0.
+    """
+
+    def __init__(self,
+                 width: int,
+                 height: int,
+                 cells: Sequence[int],
+                 states: int,
+                 rule: Callable[[int, Tuple[int, ...]], int],
+                 neighborhood: Sequence[Offset] = MOORE,
+                 outside: int = 0):
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+
+        self.width = width
+        self.height = height
+        self.states = states
+        self.generation = 0
+        self._outside = outside
+
+        pad = max(1, max(max(abs(dx), abs(dy)) for dx, dy in neighborhood))
+        self._pad = pad
+        self._row = width + 2 * pad
+        self._offsets = [dy * self._row + dx for dx, dy in neighborhood]
+        self._start = pad * self._row + pad
+        self._end = (pad + height) * self._row - pad
+
+        # Give every state but 0 its own digit in base (neighbors + 1), then the sum of a cell's neighbors says exactly
+        # how many of each there are
+        size = len(neighborhood)
+        base = size + 1
+        self._codes = [0] + [base ** (state - 1) for state in range(1, states)]
+        stride = base ** (states - 1)
+        self._state_codes = [state * stride for state in range(states)]
+
+        self._table: List[int] = [outside] * (states * stride)
+        for state in range(states):
+            for counts in itertools.product(range(base), repeat=states - 1):
+                if sum(counts) > size:
+                    continue
+                total = sum(count * code for count, code in zip(counts, self._codes[1:]))
+                self._table[state * stride + total] = rule(state, (size - sum(counts),) + counts)
+
+        self._current = [outside] * (self._row * (height + 2 * pad))
+        self._next = self._current.copy()
+        for row in range(height):
+            start = (row + pad) * self._row + pad
+            self._current[start:start + width] = cells[row * width:(row + 1) * width]
+
+    @staticmethod
+    def from_grid(grid: Grid[str],
+                  states: str,
+                  rule: Callable[[int, Tuple[int, ...]], int],
+                  neighborhood: Sequence[Offset] = MOORE) -> DenseAutomaton:
+        """
+        states is the characters in the grid in state order, so '.|#' makes '.' 0, '|' 1 and '#' 2. Empty cells are 0.
+        """
+        cells = [states.index(grid[col, row]) if grid[col, row] is not None else 0
+                 for row in range(grid.height) for col in range(grid.width)]
+        return DenseAutomaton(grid.width, grid.height, cells, len(states), rule, neighborhood)
+
+    @property
+    def cells(self) -> List[int]:
+        result = []
+        for row in range(self.height):
+            start = (row + self._pad) * self._row + self._pad
+            result.extend(self._current[start:start + self.width])
+        return result
+
+    def __getitem__(self, position: Tuple[int, int]) -> int:
+        x, y = position
+        return self._current[(y + self._pad) * self._row + x + self._pad]
+
+    def count(self, state: int) -> int:
+        # The border is all outside, so take it back out if that's what's being counted
+        border = len(self._current) - self.width * self.height
+        return self._current.count(state) - (border if state == self._outside else 0)
+
+    def to_grid(self, states: str) -> Grid[str]:
+        result = Grid[str](self.width, self.height)
+        for index, state in enumerate(self.cells):
+            result[index % self.width, index // self.width] = states[state]
+        return result
+
+    def step(self):
+        current = self._current
+        start = self._start
+        end = self._end
+
+        totals = map(self._state_codes.__getitem__, current[start:end])
+        coded = list(map(self._codes.__getitem__, current))
+        for offset in self._offsets:
+            totals = map(operator.add, totals, coded[start + offset:end + offset])
+
+        result = self._next
+        result[start:end] = map(self._table.__getitem__, totals)
+
+        # The slice also ran over the left and right borders, put them back
+        outside = [self._outside] * (2 * self._pad)
+        for row in range(self._pad, self._pad + self.height - 1):
+            border = (row + 1) * self._row - self._pad
+            result[border:border + 2 * self._pad] = outside
+
+        self._current, self._next = result, current
+        self.generation += 1
+
+    def state_key(self) -> bytes:
+        if self.states <= 256:
+            return bytes(self._current)
+        return tuple(self._current)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, FrozenInstanceError
 from enum import Enum, auto
 from typing import Iterator, Tuple
 
@@ -23,26 +23,68 @@ class CoordinateSystem(Enum):
         self.dy = dy
 
 
-@dataclass(frozen=True)
 class Coordinate(object):
+    """
+    Acts like a frozen dataclass of (x, y, system), but this gets created more than anything else in the project so
+    it's hand rolled: slots instead of a __dict__, the hash worked out once up front, and equality that doesn't build
+    tuples. The hash leaves out the system, since hashing an Enum is slow and coordinates in different systems rarely
+    share a dictionary. They still aren't equal.
+    """
+    __slots__ = ('x', 'y', 'system', '_hash')
+    __match_args__ = ('x', 'y', 'system')
+
     x: int
     y: int
-    system: CoordinateSystem = CoordinateSystem.X_RIGHT_Y_UP
+    system: CoordinateSystem
+
+    def __init__(self, x: int, y: int, system: CoordinateSystem = CoordinateSystem.X_RIGHT_Y_UP):
+        # Straight to the slots, our own __setattr__ refuses
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_system(self, system)
+        _set_hash(self, hash((x, y)))
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if other.__class__ is not Coordinate:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.system is other.system
+
+    def __reduce__(self):
+        return Coordinate, (self.x, self.y, self.system)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return f"({self.x}, {self.y})"
 
     def right(self, count=1) -> Coordinate:
-        return Coordinate(self.x + self.system.dx * count, self.y, system=self.system)
+        system = self.system
+        return Coordinate(self.x + system.dx * count, self.y, system)
 
     def left(self, count=1) -> Coordinate:
-        return Coordinate(self.x - self.system.dx * count, self.y, system=self.system)
+        system = self.system
+        return Coordinate(self.x - system.dx * count, self.y, system)
 
     def up(self, count=1) -> Coordinate:
-        return Coordinate(self.x, self.y + self.system.dy * count, system=self.system)
+        system = self.system
+        return Coordinate(self.x, self.y + system.dy * count, system)
 
     def down(self, count=1) -> Coordinate:
-        return Coordinate(self.x, self.y - self.system.dy * count, system=self.system)
+        system = self.system
+        return Coordinate(self.x, self.y - system.dy * count, system)
 
     def move(self, character) -> Coordinate:
         if character in 'R>':
@@ -57,18 +99,33 @@ class Coordinate(object):
             raise ValueError()
 
     def neighbors(self):
-        return [self.up(), self.down(), self.left(), self.right()]
+        x = self.x
+        y = self.y
+        system = self.system
+        dx = system.dx
+        dy = system.dy
+        return [
+            Coordinate(x, y + dy, system),  # up
+            Coordinate(x, y - dy, system),  # down
+            Coordinate(x - dx, y, system),  # left
+            Coordinate(x + dx, y, system),  # right
+        ]
 
     def neighbors8(self):
+        x = self.x
+        y = self.y
+        system = self.system
+        dx = system.dx
+        dy = system.dy
         return [
-            self.up(),
-            self.down(),
-            self.left(),
-            self.right(),
-            self.up().left(),
-            self.up().right(),
-            self.down().left(),
-            self.down().right(),
+            Coordinate(x, y + dy, system),  # up
+            Coordinate(x, y - dy, system),  # down
+            Coordinate(x - dx, y, system),  # left
+            Coordinate(x + dx, y, system),  # right
+            Coordinate(x - dx, y + dy, system),  # up left
+            Coordinate(x + dx, y + dy, system),  # up right
+            Coordinate(x - dx, y - dy, system),  # down left
+            Coordinate(x + dx, y - dy, system),  # down right
         ]
 
     def manhattan(self, other: Coordinate):
@@ -129,6 +186,12 @@ class Coordinate(object):
         return Coordinate(self.x - other, self.y - other, system=self.system)
 
 
+_set_x = Coordinate.x.__set__
+_set_y = Coordinate.y.__set__
+_set_system = Coordinate.system.__set__
+_set_hash = Coordinate._hash.__set__
+
+
 @dataclass(frozen=True)
 class BoundingBox(object):
     min_x: int = 2 ** 32
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import enum
+import heapq
+from array import array
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from queue import Queue
-from typing import TypeVar, Generic, Dict, Optional, Set, List, Callable, FrozenSet
+from typing import TypeVar, Generic, Any, Dict, Optional, Set, List, Callable, Iterable, Iterator, Sequence, Tuple
 
 from aoc.util.coordinate import Coordinate, Turtle
-from aoc.util.queue import PriorityQueue
+from aoc.util.pathfinding import IndexedHeap, ShortestPath, shortest_path
+from aoc.util.queue import TuplePriorityQueue
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -43,20 +47,200 @@ class WithSteps(Generic[T]):
     path: List[T]
 
 
-@dataclass(frozen=True)
-class SearchAttempt(object):
-    total_weight: int
-    start: str
-    current: str
-    visited: FrozenSet[str]
-
-
 class CompressionWhatToKeep(enum.Enum):
     LOWEST = enum.auto()
     HIGHEST = enum.auto()
     ALL = enum.auto()
 
 
+class CompiledGraph(Generic[T]):
+    """
+    A read only snapshot of a Graph for searching. Nodes are numbered 0 to n - 1 in nodes/index, and the edges are laid
+    out in compressed sparse row form: the edges out of node i go to targets[offsets[i]:offsets[i + 1]], with the
+    same slice of weights. Searches keep their state in lists indexed by node number instead of sets and dicts.
+    """
+
+    def __init__(self, nodes: Iterable[T], forward: Dict[T, Iterable[Edge[T]]]):
+        self.nodes: List[T] = list(nodes)
+        self.index: Dict[T, int] = {node: i for i, node in enumerate(self.nodes)}
+
+        offsets = [0]
+        targets = []
+        weights = []
+        for node in self.nodes:
+            for edge in forward.get(node, ()):
+                targets.append(self.index[edge.end])
+                weights.append(edge.weight)
+            offsets.append(len(targets))
+
+        self.offsets = array('q', offsets)
+        self.targets = array('q', targets)
+        try:
+            self.weights: Sequence = array('q', weights)
+        except TypeError:
+            # Some days label their edges with something other than a number, those still get a snapshot
+            self.weights = weights
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def neighbors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def edges(self, node: int) -> Iterator[Tuple[int, int]]:
+        start = self.offsets[node]
+        end = self.offsets[node + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def _path(self, came_from: List[int], end: int) -> List[T]:
+        result = []
+        current = end
+        while current != -1:
+            result.append(self.nodes[current])
+            current = came_from[current]
+
+        result.reverse()
+        return result
+
+    def shortest_path(self,
+                      start: T,
+                      end: T,
+                      heuristic: Optional[Heuristic[T]] = None,
+                      queue: Callable[[], Any] = IndexedHeap
+                      ) -> Optional[ShortestPath[T]]:
+        if start not in self.index or end not in self.index:
+            return ShortestPath(0, [start]) if start == end else None
+
+        nodes = self.nodes
+        node_heuristic = None
+        if heuristic is not None:
+            def node_heuristic(node: int) -> int:
+                return heuristic(nodes[node], end)
+
+        result = shortest_path(self.index[start], self.index[end], self.edges, node_heuristic, queue)
+        if result is None:
+            return None
+
+        return ShortestPath(result.cost, [nodes[node] for node in result.path])
+
+    def flood_find(self, start: T, end: T) -> Optional[List[T]]:
+        if start == end:
+            return [start]
+        if start not in self.index or end not in self.index:
+            return None
+
+        end_index = self.index[end]
+        came_from = [-1] * len(self.nodes)
+        seen = [False] * len(self.nodes)
+        seen[self.index[start]] = True
+
+        queue = deque([self.index[start]])
+        while queue:
+            current = queue.popleft()
+
+            for neighbor in self.neighbors(current):
+                if seen[neighbor]:
+                    continue
+
+                seen[neighbor] = True
+                came_from[neighbor] = current
+                if neighbor == end_index:
+                    return self._path(came_from, end_index)
+
+                queue.append(neighbor)
+
+        return None
+
+    def distances(self, start: T) -> Dict[T, int]:
+        """
+        Lowest total weight from start to every node it can reach, start itself included.
+        """
+        cost_so_far: List[Optional[int]] = [None] * len(self.nodes)
+        start_index = self.index[start]
+        cost_so_far[start_index] = 0
+
+        frontier = [(0, start_index)]
+        while frontier:
+            cost, current = heapq.heappop(frontier)
+            if cost > cost_so_far[current]:
+                continue  # Already found a cheaper way here
+
+            for neighbor, weight in self.edges(current):
+                new_cost = cost + weight
+                old_cost = cost_so_far[neighbor]
+                if old_cost is None or new_cost < old_cost:
+                    cost_so_far[neighbor] = new_cost
+                    heapq.heappush(frontier, (new_cost, neighbor))
+
+        return {self.nodes[i]: cost for i, cost in enumerate(cost_so_far) if cost is not None}
+
+    def _held_karp(self, sign: int, loop: bool, start: Optional[T]) -> Optional[int]:
+        """
+        Bitmask DP over every path that visits each node once, O(2^n * n^2). Weights are multiplied by sign and the
+        lowest total kept, so sign=-1 finds the highest. Paths begin at start, or anywhere if it's None. A loop has to
+        get back to where it began, and which node that is doesn't change the answer.
+        """
+        n = len(self.nodes)
+        if n == 0:
+            return None
+        if n == 1:
+            return 0
+
+        # Only the best of any parallel edges matters, and a self loop can never be part of a path
+        best_edges: List[Dict[int, int]] = [{} for _ in range(n)]
+        for node in range(n):
+            row = best_edges[node]
+            for neighbor, weight in self.edges(node):
+                weight *= sign
+                if neighbor != node and (neighbor not in row or weight < row[neighbor]):
+                    row[neighbor] = weight
+        adjacency = [[(neighbor, 1 << neighbor, weight) for neighbor, weight in row.items()] for row in best_edges]
+
+        everything = (1 << n) - 1
+        # cost[mask * n + node] is the best path through exactly the nodes in mask that ends at node
+        cost: List[Optional[int]] = [None] * ((everything + 1) * n)
+        first = 0 if start is None else self.index[start]
+        for node in ([first] if loop or start is not None else range(n)):
+            cost[(1 << node) * n + node] = 0
+
+        # Every mask comes after all of its subsets, so each entry is final by the time it's extended
+        for mask in range(1, everything):
+            base = mask * n
+            for node in range(n):
+                current = cost[base + node]
+                if current is None:
+                    continue
+
+                for neighbor, bit, weight in adjacency[node]:
+                    if mask & bit:
+                        continue
+
+                    index = (mask | bit) * n + neighbor
+                    new_cost = current + weight
+                    old_cost = cost[index]
+                    if old_cost is None or new_cost < old_cost:
+                        cost[index] = new_cost
+
+        full = everything * n
+        if loop:
+            totals = [cost[full + node] + best_edges[node][first]
+                      for node in range(n)
+                      if cost[full + node] is not None and first in best_edges[node]]
+        else:
+            totals = [total for total in cost[full:full + n] if total is not None]
+
+        if len(totals) == 0:
+            return None
+        return min(totals) * sign
+
+    def tsp(self, loop=False, start: Optional[T] = None) -> Optional[int]:
+        return self._held_karp(1, loop, start)
+
+    def highest_tsp(self, loop=False, start: Optional[T] = None) -> int:
+        result = self._held_karp(-1, loop, start)
+        return 0 if result is None else result
+
+
 class Graph(Generic[T]):
     def __init__(self, directional=False):
         self._all_nodes = set()
@@ -64,6 +248,7 @@ class Graph(Generic[T]):
         self._forward_nodes: dict[T, set[Edge[T]]] = {}
         self._back_nodes: dict[T, set[Edge[T]]] = {}
         self._directional: bool = directional
+        self._compiled: Optional[CompiledGraph[T]] = None
 
     @property
     def all_nodes(self) -> Set[T]:
@@ -73,7 +258,18 @@ class Graph(Generic[T]):
     def all_edges(self) -> Set[Edge[T]]:
         return set(self._edges)
 
+    def compile(self) -> CompiledGraph[T]:
+        """
+        The CSR snapshot the searches run on. It's kept until the graph changes, so repeated searches on the same
+        graph only build it once.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledGraph[T](self._all_nodes, self._forward_nodes)
+
+        return self._compiled
+
     def add(self, start: T, end: T, weight=1):
+        self._compiled = None
         self._all_nodes.add(start)
         self._all_nodes.add(end)
 
@@ -103,6 +299,7 @@ class Graph(Generic[T]):
         self._murder_edges(edges_to_murder)
 
     def remove(self, node: T):
+        self._compiled = None
         if node in self._all_nodes:
             self._all_nodes.remove(node)
 
@@ -118,6 +315,7 @@ class Graph(Generic[T]):
         self._murder_edges(edges_to_murder)
 
     def _murder_edges(self, edges_to_murder):
+        self._compiled = None
         for edge in edges_to_murder:
             self._edges.remove(edge)
             if edge.start in self._forward_nodes:
@@ -201,68 +399,23 @@ class Graph(Generic[T]):
 
         return result
 
-    def find_path(self, start: T, end: T, heuristic: Heuristic[T]):
-        frontier: PriorityQueue[T] = PriorityQueue[T]()
-        frontier.push(start, 0)
-        came_from: Dict[T, Optional[T]] = {}
-        cost_so_far: Dict[T, int] = {}
-
-        came_from[start] = None
-        cost_so_far[start] = 0
-
-        while frontier:
-            current: T = frontier.pop()
-
-            if current == end:
-                source = end
-                result = []
-
-                while source is not None:
-                    result.insert(0, source)
-                    source = came_from[source]
+    def shortest_path(self,
+                      start: T,
+                      end: T,
+                      heuristic: Optional[Heuristic[T]] = None,
+                      queue: Callable[[], Any] = IndexedHeap
+                      ) -> Optional[ShortestPath[T]]:
+        return self.compile().shortest_path(start, end, heuristic, queue)
 
-                return result
-
-            edge: Edge[T]
-            for edge in self._forward_nodes.setdefault(current, set()):
-                neighbor = edge.end
-                new_cost = cost_so_far[current] + edge.weight
-
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost + heuristic(neighbor, end)
-
-                    frontier.push(neighbor, priority)
-                    came_from[neighbor] = current
-
-        return None
+    def find_path(self, start: T, end: T, heuristic: Heuristic[T]):
+        result = self.shortest_path(start, end, heuristic)
+        return None if result is None else result.path
 
     def flood_find(self, start: T, end: T):
-        queue: PriorityQueue[WithSteps[T]] = PriorityQueue[WithSteps[T]]()
-        seen: Set[T] = set()
-        queue.push(WithSteps(value=start, steps=0, path=[start]), 0)
-
-        while queue:
-            item: WithSteps[T] = queue.pop()
-
-            if item.value == end:
-                return item.path
-
-            for edge in self._forward_nodes.setdefault(item.value, set()):
-                neighbor: T = edge.end
-                if neighbor in seen:
-                    continue
-
-                seen.add(neighbor)
-                new_path = item.path.copy()
-                new_path.append(neighbor)
-                new_steps = item.steps + 1
-                queue.push(WithSteps(value=neighbor, steps=new_steps, path=new_path), new_steps)
-
-        return None
+        return self.compile().flood_find(start, end)
 
     def flood_find_all(self, start: T, end: T) -> set[tuple[T, ...]]:
-        queue: PriorityQueue[WithSteps[T]] = PriorityQueue[WithSteps[T]]()
+        queue: TuplePriorityQueue[WithSteps[T]] = TuplePriorityQueue[WithSteps[T]]()
         queue.push(WithSteps(value=start, steps=0, path=[start]), 0)
 
         result: set[tuple[T, ...]] = set()
@@ -346,66 +499,11 @@ class Graph(Generic[T]):
                 if len([x for x in edges if x.end == edge.end]) == 0:
                     no_incoming.add(edge.end)
 
-    def tsp(self) -> int:
-        queue: PriorityQueue[SearchAttempt] = PriorityQueue[SearchAttempt]()
-
-        for node in self._all_nodes:
-            queue.push(SearchAttempt(0, node, node, frozenset({node})), 0)
-
-        while not queue.empty:
-            search: SearchAttempt = queue.pop()
-
-            if search.visited == self._all_nodes:
-                return search.total_weight
-
-            for edge in self.edges_from(search.current):
-                if edge.end in search.visited:
-                    continue
-
-                new_distance = search.total_weight + edge.weight
-                new_visited = frozenset(search.visited.union({edge.end}))
-                new_search = SearchAttempt(new_distance, search.start, edge.end, new_visited)
-
-                queue.push(new_search, new_distance)
-
-    def highest_tsp(self, loop=False):
-        queue = Queue()
-
-        starting_nodes = list(self._all_nodes)
-
-        # If this is a loop, then just pick one to start with
-        if loop:
-            starting_nodes = [starting_nodes.pop()]
-
-        for node in starting_nodes:
-            queue.put(SearchAttempt(0, node, node, frozenset({node})))
-
-        result = 0
-
-        while not queue.empty():
-            search: SearchAttempt = queue.get()
-
-            if search.visited == self._all_nodes:
-                if loop and search.start != search.current:
-                    edges = [e for e in self.edges_from(search.current) if e.end == search.start]
+    def tsp(self, loop=False, start: Optional[T] = None) -> Optional[int]:
+        return self.compile().tsp(loop, start)
 
-                    if len(edges) > 0:
-                        weight = edges.pop().weight
-                        result = max(search.total_weight + weight, result)
-                else:
-                    result = max(search.total_weight, result)
-
-            for edge in self.edges_from(search.current):
-                if edge.end in search.visited:
-                    continue
-
-                new_distance = search.total_weight + edge.weight
-                new_visited = frozenset(search.visited.union({edge.end}))
-                new_search = SearchAttempt(new_distance, search.start, edge.end, new_visited)
-
-                queue.put(new_search)
-
-        return result
+    def highest_tsp(self, loop=False, start: Optional[T] = None):
+        return self.compile().highest_tsp(loop, start)
 
     def compress(self, *what_to_keep: T, keep_logic: CompressionWhatToKeep = CompressionWhatToKeep.LOWEST):
         what_to_keep = set(what_to_keep)
@@ -449,38 +547,13 @@ class Graph(Generic[T]):
             self.remove(node)
 
     def interconnect(self):
-        @dataclass
-        class InterconnectResult(Generic[T]):
-            node: T
-            current_weight: int
-
-        for node in set(self._all_nodes):
-            q = Queue()
-            weight_map: Dict[str, int] = {
-                node: 0
-            }
-            for edge in self.edges_from(node):
-                q.put(InterconnectResult(
-                    node=edge.end,
-                    current_weight=edge.weight
-                ))
-                weight_map[edge.end] = edge.weight
-
-            while not q.empty():
-                result: InterconnectResult = q.get()
-                for edge in self.edges_from(result.node):
-                    new_weight = result.current_weight + edge.weight
-                    if edge.end in weight_map and weight_map[edge.end] <= new_weight:
-                        continue
-
-                    weight_map[edge.end] = new_weight
-                    q.put(InterconnectResult(
-                        node=edge.end,
-                        current_weight=new_weight
-                    ))
+        # Every distance comes from the graph as it was, the edges added along the way are never shorter anyway
+        compiled = self.compile()
+        all_distances = {node: compiled.distances(node) for node in compiled.nodes}
 
+        for node, distances in all_distances.items():
             nodes_from = self.nodes_from(node)
-            for end, weight in weight_map.items():
+            for end, weight in distances.items():
                 if end == node:
                     continue  # This is us
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import functools
+from collections import deque
 from dataclasses import dataclass
 from itertools import permutations, combinations
 from queue import Queue
-from typing import TypeVar, Generic, Union, List, Callable, Dict, Optional, Set, Iterator
+from typing import TypeVar, Generic, Union, List, Callable, Dict, Optional, Set, Iterator, Tuple
 
 from aoc.util.coordinate import Coordinate, CoordinateSystem, BoundingBox
 from aoc.util.graph import Graph
-from aoc.util.queue import PriorityQueue
+from aoc.util.pathfinding import ShortestPath, shortest_path
+from aoc.util.queue import TuplePriorityQueue
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -28,19 +31,60 @@ class CoordinateSteps(object):
 class InfiniteGrid(Generic[T]):
     def __init__(self):
         self._data: Dict[Coordinate, T] = {}
+        # [min_x, max_x, min_y, max_y], kept up to date as things are added. None means we don't know and have to look
+        # at every key again, which only happens when something on the edge gets deleted.
+        self._bounds: Optional[List[int]] = None
 
     def clear(self):
         self._data = {}
+        self._bounds = None
 
     def copy(self) -> InfiniteGrid[T]:
         result: InfiniteGrid[T] = InfiniteGrid[T]()
         result._data = self._data.copy()
+        result._bounds = None if self._bounds is None else self._bounds.copy()
         return result
 
+    def _expand_bounds(self, position: Coordinate):
+        bounds = self._bounds
+        if bounds is None:
+            return
+
+        x = position.x
+        y = position.y
+        if x < bounds[0]:
+            bounds[0] = x
+        if x > bounds[1]:
+            bounds[1] = x
+        if y < bounds[2]:
+            bounds[2] = y
+        if y > bounds[3]:
+            bounds[3] = y
+
+    def _shrink_bounds(self, position: Coordinate):
+        bounds = self._bounds
+        if bounds is None:
+            return
+
+        if position.x == bounds[0] or position.x == bounds[1] or position.y == bounds[2] or position.y == bounds[3]:
+            self._bounds = None
+
+    def _get_bounds(self) -> List[int]:
+        if self._bounds is None:
+            keys = self.keys()
+            # Same ValueError as before if there's nothing in the grid
+            self._bounds = [
+                min(map(lambda coord: coord.x, keys)),
+                max(map(lambda coord: coord.x, keys)),
+                min(map(lambda coord: coord.y, keys)),
+                max(map(lambda coord: coord.y, keys)),
+            ]
+        return self._bounds
+
     def map(self, func: Callable[[T], U]) -> InfiniteGrid[U]:
         result = InfiniteGrid[U]()
 
-        for coordinate, value in self._data.items():
+        for coordinate, value in self.items():
             result[coordinate] = func(value)
 
         return result
@@ -71,19 +115,19 @@ class InfiniteGrid(Generic[T]):
 
     @property
     def max_x(self):
-        return max(map(lambda coord: coord.x, self._data.keys()))
+        return self._get_bounds()[1]
 
     @property
     def min_x(self):
-        return min(map(lambda coord: coord.x, self._data.keys()))
+        return self._get_bounds()[0]
 
     @property
     def max_y(self):
-        return max(map(lambda coord: coord.y, self._data.keys()))
+        return self._get_bounds()[3]
 
     @property
     def min_y(self):
-        return min(map(lambda coord: coord.y, self._data.keys()))
+        return self._get_bounds()[2]
 
     def to_grid(self) -> Grid[T]:
         data = {}
@@ -91,7 +135,7 @@ class InfiniteGrid(Generic[T]):
         min_x = min_y = 4294967296
         max_x = max_y = -4294967296
 
-        for coordinate, item in self._data.items():
+        for coordinate, item in self.items():
             x = coordinate.x
             y = coordinate.y
             if coordinate.system == CoordinateSystem.X_RIGHT_Y_DOWN:
@@ -159,44 +203,17 @@ class InfiniteGrid(Generic[T]):
 
         return graph
 
-    def find_path(self, start: Coordinate, end: Coordinate, *walkable: T):
-        frontier: PriorityQueue[Coordinate] = PriorityQueue[Coordinate]()
-        frontier.push(start, 0)
-        came_from: Dict[Coordinate, Optional[Coordinate]] = {}
-        cost_so_far: Dict[Coordinate, int] = {}
-
-        came_from[start] = None
-        cost_so_far[start] = 0
-
-        while frontier:
-            current: Coordinate = frontier.pop()
-
-            if current == end:
-                source = end
-                result = []
-
-                while source is not None:
-                    result.insert(0, source)
-                    source = came_from[source]
-
-                return result
-
+    def shortest_path(self, start: Coordinate, end: Coordinate, *walkable: T) -> Optional[ShortestPath[Coordinate]]:
+        def neighbors(current: Coordinate):
             for neighbor in current.neighbors():
-                if neighbor not in self:
-                    continue
-
-                if self[neighbor] not in walkable:
-                    continue
-
-                new_cost = cost_so_far[current] + 1
+                if neighbor in self and self[neighbor] in walkable:
+                    yield neighbor, 1
 
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    heuristic_cost = abs(end.y - neighbor.y) + (end.x - neighbor.x)
-                    priority = new_cost + heuristic_cost
+        return shortest_path(start, end, neighbors, lambda neighbor: neighbor.manhattan(end))
 
-                    frontier.push(neighbor, priority)
-                    came_from[neighbor] = current
+    def find_path(self, start: Coordinate, end: Coordinate, *walkable: T):
+        result = self.shortest_path(start, end, *walkable)
+        return None if result is None else result.path
 
     def flood_fill(self, starting_coordinate: Coordinate, current_item: T, new_item: T):
         q = Queue()
@@ -207,6 +224,7 @@ class InfiniteGrid(Generic[T]):
         while not q.empty():
             coordinate = q.get()
             self._data[coordinate] = new_item
+            self._expand_bounds(coordinate)
 
             for neighbor in coordinate.neighbors():
                 if neighbor in seen:
@@ -231,7 +249,7 @@ class InfiniteGrid(Generic[T]):
         if self[start] in walkable:
             result[start] = 0
 
-        queue: PriorityQueue[CoordinateSteps] = PriorityQueue[CoordinateSteps]()
+        queue: TuplePriorityQueue[CoordinateSteps] = TuplePriorityQueue[CoordinateSteps]()
         queue.push(CoordinateSteps(coordinate=start, steps=0), 0)
 
         while queue:
@@ -267,12 +285,14 @@ class InfiniteGrid(Generic[T]):
         position = self._to_coordinate(position)
 
         self._data[position] = item
+        self._expand_bounds(position)
 
     def __delitem__(self, position):
         position = self._to_coordinate(position)
 
         if position in self:
             del self._data[position]
+            self._shrink_bounds(position)
 
     def __contains__(self, position):
         position = self._to_coordinate(position)
@@ -281,12 +301,17 @@ class InfiniteGrid(Generic[T]):
 
     @property
     def bounding_box(self) -> BoundingBox:
-        return BoundingBox().expand(*self._data.keys())
+        try:
+            min_x, max_x, min_y, max_y = self._get_bounds()
+        except ValueError:
+            return BoundingBox()  # Nothing in the grid
+
+        return BoundingBox(min_x, min_y, max_x, max_y)
 
     def find(self, test: Union[T, Callable]) -> List[Coordinate]:
         result = []
 
-        for coordinate, item in self._data.items():
+        for coordinate, item in self.items():
             if callable(test):
                 if test(item):
                     result.append(coordinate)
@@ -311,18 +336,375 @@ class InfiniteGrid(Generic[T]):
         return result
 
 
-# TODO Add constraints for setting/getting position to be in bounds
-class Grid(InfiniteGrid[T]):
+class _CellGrid(InfiniteGrid[T]):
+    """
+    For grids that keep their cells somewhere other than _data, so anything that walks around them has to go through
+    __getitem__ and __contains__.
+    """
+
+    def flood_fill(self, starting_coordinate: Coordinate, current_item: T, new_item: T):
+        q = Queue()
+        seen: set[Coordinate] = set()
+        q.put(starting_coordinate)
+        seen.add(starting_coordinate)
+
+        while not q.empty():
+            coordinate = q.get()
+            self[coordinate] = new_item
+
+            for neighbor in coordinate.neighbors():
+                if neighbor in seen:
+                    continue  # We've already seen it
+
+                if neighbor not in self:
+                    continue  # We don't have it in our grid
+
+                if self[neighbor] != current_item:
+                    continue  # It's not the item we're looking for
+
+                q.put(neighbor)
+                seen.add(neighbor)
+
+    def neighbor_count(self, coordinate: Coordinate, test: Union[T, Callable]) -> int:
+        result = 0
+
+        for neighbor in coordinate.neighbors():
+            if neighbor not in self:
+                continue
+            item = self[neighbor]
+            if callable(test):
+                if test(item):
+                    result += 1
+            elif item == test:
+                result += 1
+
+        return result
+
+
+class _Empty(object):
+    """
+    Marks a cell of a Grid or ChunkedGrid that was never set (or was deleted). Pickles as a reference to the one
+    instance, so copies still recognize it.
+    """
+
+    def __reduce__(self):
+        return '_empty'
+
+    def __repr__(self):
+        return '_empty'
+
+
+_empty = _Empty()
+
+
+# A day only uses a few grid sizes, but a 1000x1000 grid's worth of these is over 100MB, so only keep the recent ones
+@functools.lru_cache(maxsize=8)
+def _grid_coordinates(width: int, height: int) -> Tuple[Coordinate, ...]:
+    # Coordinates are immutable, so every grid of the same size can hand out the same ones
+    return tuple(
+        Coordinate(col, row, system=CoordinateSystem.X_RIGHT_Y_DOWN) for row in range(height) for col in range(width)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_neighbors(width: int, height: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    For every cell index, the indexes of the cells next to it that are inside the grid. Same order as
+    Coordinate.neighbors() gives for X_RIGHT_Y_DOWN: up, down, left, right.
+    """
+    result = []
+    for row in range(height):
+        for col in range(width):
+            index = row * width + col
+            neighbors = []
+            if row > 0:
+                neighbors.append(index - width)
+            if row < height - 1:
+                neighbors.append(index + width)
+            if col > 0:
+                neighbors.append(index - 1)
+            if col < width - 1:
+                neighbors.append(index + 1)
+            result.append(tuple(neighbors))
+    return tuple(result)
+
+
+class Grid(_CellGrid[T]):
+    """
+    Cells inside width x height live in a flat list indexed by y * width + x, so looking one up is a bounds check and
+    a list index instead of hashing a Coordinate. Anything outside of that (or using an X_RIGHT_Y_UP coordinate) still
+    works and goes to the dictionary InfiniteGrid uses, since nothing ever stopped anyone from putting it there.
+    """
+
     def __init__(self, width, height):
         super().__init__()
         self.width = width
         self.height = height
+        self._cells: List = [_empty] * (width * height)
+
+    def _index(self, position) -> Optional[int]:
+        if isinstance(position, tuple):
+            x, y = position
+            x = int(x)
+            y = int(y)
+        elif position.system is CoordinateSystem.X_RIGHT_Y_DOWN:
+            x = position.x
+            y = position.y
+        else:
+            return None
+
+        width = self.width
+        if 0 <= x < width and 0 <= y < self.height:
+            return y * width + x
+        return None
+
+    def clear(self):
+        super().clear()
+        self._cells = [_empty] * (self.width * self.height)
 
     def copy(self) -> Grid[T]:
         result: Grid[T] = Grid[T](self.width, self.height)
+        result._cells = self._cells.copy()
         result._data = self._data.copy()
+        result._bounds = None if self._bounds is None else self._bounds.copy()
+        return result
+
+    def map(self, func: Callable[[T], U]) -> Grid[U]:
+        result = Grid[U](self.width, self.height)
+        result._cells = [item if item is _empty else func(item) for item in self._cells]
+        for coordinate, value in self._data.items():
+            result._data[coordinate] = func(value)
+
+        return result
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        coordinates = _grid_coordinates(self.width, self.height)
+        for index, item in enumerate(self._cells):
+            if item is not _empty:
+                yield coordinates[index]
+
+        yield from self._data
+
+    def keys(self) -> List[Coordinate]:
+        return list(self)
+
+    def items(self) -> List[Tuple[Coordinate, T]]:
+        coordinates = _grid_coordinates(self.width, self.height)
+        result = [(coordinates[index], item) for index, item in enumerate(self._cells) if item is not _empty]
+        result.extend(self._data.items())
+        return result
+
+    def values(self) -> List[T]:
+        result = [item for item in self._cells if item is not _empty]
+        result.extend(self._data.values())
+        return result
+
+    def __getitem__(self, position) -> Optional[T]:
+        # _index inlined for the common case, this gets called a lot
+        if position.__class__ is Coordinate and position.system is CoordinateSystem.X_RIGHT_Y_DOWN:
+            x = position.x
+            y = position.y
+            width = self.width
+            if 0 <= x < width and 0 <= y < self.height:
+                item = self._cells[y * width + x]
+                return None if item is _empty else item
+
+        index = self._index(position)
+        if index is None:
+            return super().__getitem__(position)
+
+        item = self._cells[index]
+        return None if item is _empty else item
+
+    def __setitem__(self, position, item):
+        index = self._index(position)
+        if index is None:
+            super().__setitem__(position, item)
+        else:
+            self._cells[index] = item
+            if self._bounds is not None:
+                self._expand_bounds(self.unpack(index))
+
+    def __delitem__(self, position):
+        index = self._index(position)
+        if index is None:
+            super().__delitem__(position)
+        elif self._cells[index] is not _empty:
+            self._cells[index] = _empty
+            self._shrink_bounds(self.unpack(index))
+
+    def __contains__(self, position):
+        if position.__class__ is Coordinate and position.system is CoordinateSystem.X_RIGHT_Y_DOWN:
+            x = position.x
+            y = position.y
+            width = self.width
+            if 0 <= x < width and 0 <= y < self.height:
+                return self._cells[y * width + x] is not _empty
+
+        index = self._index(position)
+        if index is None:
+            return super().__contains__(position)
+
+        return self._cells[index] is not _empty
+
+    def find(self, test: Union[T, Callable]) -> List[Coordinate]:
+        coordinates = _grid_coordinates(self.width, self.height)
+
+        if callable(test):
+            result = [
+                coordinates[index] for index, item in enumerate(self._cells) if item is not _empty and test(item)
+            ]
+            result.extend(coordinate for coordinate, item in self._data.items() if test(item))
+        else:
+            result = [
+                coordinates[index] for index, item in enumerate(self._cells) if item is not _empty and item == test
+            ]
+            result.extend(coordinate for coordinate, item in self._data.items() if item == test)
+
+        return result
+
+    def pack(self, position) -> int:
+        """
+        The cell's index, y * width + x. Searches can use these instead of Coordinates: they're small ints that hash
+        for free, and neighbor_indexes() gives you the cells around one without building anything.
+        """
+        index = self._index(position)
+        if index is None:
+            raise IndexError(f"{position} is not inside a {self.width}x{self.height} grid")
+        return index
+
+    def unpack(self, index: int) -> Coordinate:
+        y, x = divmod(index, self.width)
+        return Coordinate(x, y, system=CoordinateSystem.X_RIGHT_Y_DOWN)
+
+    def neighbor_indexes(self, index: int) -> Tuple[int, ...]:
+        return _grid_neighbors(self.width, self.height)[index]
+
+    def _packable(self, *positions) -> bool:
+        # Anything stored outside of the cells could be walked onto, so the packed searches can't see everything
+        return not self._data and all(self._index(position) is not None for position in positions)
+
+    def to_graph(self,
+                 *walkable: T,
+                 test: Optional[Callable[[T, T], bool]] = None,
+                 directional: bool = False,
+                 packed: bool = False) -> Graph:
+        """
+        With packed, the graph's nodes are cell indexes (see pack) instead of Coordinates.
+        """
+        if not packed:
+            return super().to_graph(*walkable, test=test, directional=directional)
+
+        cells = self._cells
+        all_neighbors = _grid_neighbors(self.width, self.height)
+        graph: Graph[int] = Graph[int](directional=directional)
+
+        for index, item in enumerate(cells):
+            if item is _empty or item not in walkable:
+                continue
+
+            for neighbor in all_neighbors[index]:
+                neighbor_item = cells[neighbor]
+                if neighbor_item is _empty or neighbor_item not in walkable:
+                    continue
+
+                if test is not None and not test(item, neighbor_item):
+                    continue  # Failed our test, sad day.
+
+                graph.add(index, neighbor)
+                if not directional:
+                    graph.add(neighbor, index)
+
+        return graph
+
+    def shortest_path_packed(self, start: int, end: int, *walkable: T) -> Optional[ShortestPath[int]]:
+        """
+        shortest_path, but on cell indexes.
+        """
+        cells = self._cells
+        width = self.width
+        all_neighbors = _grid_neighbors(width, self.height)
+        end_y, end_x = divmod(end, width)
+
+        def neighbors(index: int):
+            for neighbor in all_neighbors[index]:
+                item = cells[neighbor]
+                if item is not _empty and item in walkable:
+                    yield neighbor, 1
+
+        def heuristic(index: int) -> int:
+            # Manhattan distance like InfiniteGrid.shortest_path, so both pick the same path
+            y, x = divmod(index, width)
+            return abs(end_y - y) + abs(end_x - x)
+
+        return shortest_path(start, end, neighbors, heuristic)
+
+    def find_path_packed(self, start: int, end: int, *walkable: T) -> Optional[List[int]]:
+        """
+        find_path, but on cell indexes.
+        """
+        result = self.shortest_path_packed(start, end, *walkable)
+        return None if result is None else result.path
+
+    def shortest_path(self, start: Coordinate, end: Coordinate, *walkable: T) -> Optional[ShortestPath[Coordinate]]:
+        if not self._packable(start, end):
+            return super().shortest_path(start, end, *walkable)
+
+        result = self.shortest_path_packed(self._index(start), self._index(end), *walkable)
+        if result is None:
+            return None
+
+        coordinates = _grid_coordinates(self.width, self.height)
+        return ShortestPath(result.cost, [coordinates[index] for index in result.path])
+
+    def flood_map_packed(self, start: int, *walkable, max_value: Optional[int] = None) -> Dict[int, int]:
+        """
+        flood_map, but on cell indexes.
+        """
+        cells = self._cells
+        all_neighbors = _grid_neighbors(self.width, self.height)
+        result: Dict[int, int] = {}
+
+        if cells[start] is not _empty and cells[start] in walkable:
+            result[start] = 0
+
+        # Every step costs the same, so a plain FIFO queue visits things in the same order flood_map's priority
+        # queue does
+        queue = deque([(start, 0)])
+        while queue:
+            index, steps = queue.popleft()
+
+            new_steps = steps + 1
+            if max_value is not None and new_steps > max_value:
+                continue
+
+            for neighbor in all_neighbors[index]:
+                if neighbor in result:
+                    continue
+
+                item = cells[neighbor]
+                if item is _empty or item not in walkable:
+                    continue
+
+                queue.append((neighbor, new_steps))
+                result[neighbor] = new_steps
+
         return result
 
+    def flood_map(self,
+                  start: Coordinate,
+                  *walkable,
+                  max_value: Optional[int] = None
+                  ) -> Dict[Coordinate, int]:
+        if not self._packable(start):
+            return super().flood_map(start, *walkable, max_value=max_value)
+
+        coordinates = _grid_coordinates(self.width, self.height)
+        return {
+            coordinates[index]: steps
+            for index, steps in self.flood_map_packed(self._index(start), *walkable, max_value=max_value).items()
+        }
+
     def cut(self, bounding_box: BoundingBox) -> Grid[T]:
         new_width = bounding_box.max_x - bounding_box.min_x + 1
         new_height = bounding_box.max_y - bounding_box.min_y + 1
@@ -351,27 +733,20 @@ class Grid(InfiniteGrid[T]):
 
         grid: Grid[str] = Grid[str](width, height)
 
+        cells = grid._cells
         for row in range(len(lines)):
             line = lines[row]
-            for col in range(len(line)):
-                grid[col, row] = line[col]
+            cells[row * width:row * width + len(line)] = line
 
         return grid
 
     def fill(self, item: T):
-        for row in range(self.height):
-            for col in range(self.width):
-                coordinate = Coordinate(col, row, system=CoordinateSystem.X_RIGHT_Y_DOWN)
-
-                self._data[coordinate] = item
+        self._cells = [item] * (self.width * self.height)
+        self._bounds = None
 
     def fill_empty(self, item: T):
-        for row in range(self.height):
-            for col in range(self.width):
-                coordinate = Coordinate(col, row, system=CoordinateSystem.X_RIGHT_Y_DOWN)
-
-                if coordinate not in self._data:
-                    self._data[coordinate] = item
+        self._cells = [item if cell is _empty else cell for cell in self._cells]
+        self._bounds = None
 
     def fill_from_edges(self, to_replace: T, new_item: T):
         for coordinate in self.find(to_replace):
@@ -397,11 +772,9 @@ class Grid(InfiniteGrid[T]):
 
         for row in range(self.height):
             line = ""
-            for col in range(self.width):
-                coordinate = Coordinate(col, row, system=CoordinateSystem.X_RIGHT_Y_DOWN)
-
-                if coordinate in self._data:
-                    line += key(self._data[coordinate])
+            for item in self._cells[row * self.width:(row + 1) * self.width]:
+                if item is not _empty:
+                    line += key(item)
                 else:
                     line += not_found
 
@@ -435,6 +808,263 @@ class Grid(InfiniteGrid[T]):
         return result
 
 
+class ChunkedGrid(_CellGrid[T]):
+    """
+    An InfiniteGrid for big, sparse or unbounded worlds. Cells live in chunk_size x chunk_size tiles, each a flat list
+    like Grid uses, kept in a dictionary keyed by which tile they are. Tuples go straight to their tile without ever
+    becoming a Coordinate, and a tile that empties out is dropped. Every cell is in one coordinate system (the one
+    InfiniteGrid assumes for tuples by default), anything else ends up in the plain dictionary.
+    """
+
+    def __init__(self, chunk_size: int = 64, system: CoordinateSystem = CoordinateSystem.X_RIGHT_Y_DOWN):
+        super().__init__()
+        if chunk_size <= 0 or chunk_size & (chunk_size - 1) != 0:
+            raise ValueError(f"Chunk size has to be a power of 2, not {chunk_size}")
+
+        self.chunk_size = chunk_size
+        self.system = system
+        self._shift = chunk_size.bit_length() - 1
+        self._mask = chunk_size - 1
+        self._chunks: Dict[Tuple[int, int], List] = {}
+        self._counts: Dict[Tuple[int, int], int] = {}  # How many cells in each chunk are set
+
+    def _split(self, position) -> Optional[Tuple[Tuple[int, int], int]]:
+        # Which chunk, and where in it
+        if isinstance(position, tuple):
+            x, y = position
+            x = int(x)
+            y = int(y)
+        elif position.system is self.system:
+            x = position.x
+            y = position.y
+        else:
+            return None
+
+        shift = self._shift
+        mask = self._mask
+        return (x >> shift, y >> shift), ((y & mask) << shift) | (x & mask)
+
+    def _coordinate(self, chunk: Tuple[int, int], offset: int) -> Coordinate:
+        chunk_x, chunk_y = chunk
+        shift = self._shift
+        return Coordinate(
+            (chunk_x << shift) | (offset & self._mask),
+            (chunk_y << shift) | (offset >> shift),
+            system=self.system
+        )
+
+    def clear(self):
+        super().clear()
+        self._chunks = {}
+        self._counts = {}
+
+    def copy(self) -> ChunkedGrid[T]:
+        result: ChunkedGrid[T] = ChunkedGrid[T](self.chunk_size, self.system)
+        result._chunks = {chunk: cells.copy() for chunk, cells in self._chunks.items()}
+        result._counts = self._counts.copy()
+        result._data = self._data.copy()
+        result._bounds = None if self._bounds is None else self._bounds.copy()
+        return result
+
+    def map(self, func: Callable[[T], U]) -> ChunkedGrid[U]:
+        result: ChunkedGrid[U] = ChunkedGrid[U](self.chunk_size, self.system)
+        result._chunks = {
+            chunk: [item if item is _empty else func(item) for item in cells] for chunk, cells in self._chunks.items()
+        }
+        result._counts = self._counts.copy()
+        for coordinate, value in self._data.items():
+            result._data[coordinate] = func(value)
+
+        return result
+
+    def chunks(self) -> Iterator[BoundingBox]:
+        """
+        The area each chunk with anything in it covers.
+        """
+        shift = self._shift
+        for chunk_x, chunk_y in self._chunks:
+            yield BoundingBox(
+                chunk_x << shift,
+                chunk_y << shift,
+                ((chunk_x + 1) << shift) - 1,
+                ((chunk_y + 1) << shift) - 1
+            )
+
+    def _cells(self) -> Iterator[Tuple[int, int, T]]:
+        # Every set cell as x, y, item, a chunk at a time
+        shift = self._shift
+        mask = self._mask
+        for (chunk_x, chunk_y), cells in self._chunks.items():
+            base_x = chunk_x << shift
+            base_y = chunk_y << shift
+            for offset, item in enumerate(cells):
+                if item is not _empty:
+                    yield base_x | (offset & mask), base_y | (offset >> shift), item
+
+    def items(self) -> List[Tuple[Coordinate, T]]:
+        system = self.system
+        result = [(Coordinate(x, y, system), item) for x, y, item in self._cells()]
+        result.extend(self._data.items())
+        return result
+
+    def find(self, test: Union[T, Callable]) -> List[Coordinate]:
+        system = self.system
+        if callable(test):
+            result = [Coordinate(x, y, system) for x, y, item in self._cells() if test(item)]
+            result.extend(coordinate for coordinate, item in self._data.items() if test(item))
+        else:
+            result = [Coordinate(x, y, system) for x, y, item in self._cells() if item == test]
+            result.extend(coordinate for coordinate, item in self._data.items() if item == test)
+
+        return result
+
+    def _get_bounds(self) -> List[int]:
+        if self._bounds is None:
+            xs = [x for x, _, _ in self._cells()] + [coordinate.x for coordinate in self._data]
+            ys = [y for _, y, _ in self._cells()] + [coordinate.y for coordinate in self._data]
+            # Same ValueError as InfiniteGrid if there's nothing in the grid
+            self._bounds = [min(xs), max(xs), min(ys), max(ys)]
+        return self._bounds
+
+    def __iter__(self) -> Iterator[Coordinate]:
+        for coordinate, _ in self.items():
+            yield coordinate
+
+    def keys(self) -> List[Coordinate]:
+        return [coordinate for coordinate, _ in self.items()]
+
+    def values(self) -> List[T]:
+        result = [item for cells in self._chunks.values() for item in cells if item is not _empty]
+        result.extend(self._data.values())
+        return result
+
+    def __len__(self) -> int:
+        return sum(self._counts.values()) + len(self._data)
+
+    def __getitem__(self, position) -> Optional[T]:
+        # _split inlined for the common case, this gets called a lot
+        if position.__class__ is tuple:
+            x, y = position
+            if x.__class__ is int and y.__class__ is int:
+                shift = self._shift
+                mask = self._mask
+                cells = self._chunks.get((x >> shift, y >> shift))
+                if cells is None:
+                    return None
+                item = cells[((y & mask) << shift) | (x & mask)]
+                return None if item is _empty else item
+
+        split = self._split(position)
+        if split is None:
+            return super().__getitem__(position)
+
+        chunk, offset = split
+        cells = self._chunks.get(chunk)
+        if cells is None:
+            return None
+
+        item = cells[offset]
+        return None if item is _empty else item
+
+    def __setitem__(self, position, item):
+        split = self._split(position)
+        if split is None:
+            super().__setitem__(position, item)
+            return
+
+        chunk, offset = split
+        cells = self._chunks.get(chunk)
+        if cells is None:
+            cells = self._chunks[chunk] = [_empty] * (self.chunk_size * self.chunk_size)
+            self._counts[chunk] = 0
+
+        if cells[offset] is _empty:
+            self._counts[chunk] += 1
+            if self._bounds is not None:
+                self._expand_bounds(self._coordinate(chunk, offset))
+        cells[offset] = item
+
+    def __delitem__(self, position):
+        split = self._split(position)
+        if split is None:
+            super().__delitem__(position)
+            return
+
+        chunk, offset = split
+        cells = self._chunks.get(chunk)
+        if cells is None or cells[offset] is _empty:
+            return
+
+        cells[offset] = _empty
+        self._counts[chunk] -= 1
+        if self._counts[chunk] == 0:
+            del self._chunks[chunk]
+            del self._counts[chunk]
+        self._shrink_bounds(self._coordinate(chunk, offset))
+
+    def __contains__(self, position):
+        split = self._split(position)
+        if split is None:
+            return super().__contains__(position)
+
+        chunk, offset = split
+        cells = self._chunks.get(chunk)
+        return cells is not None and cells[offset] is not _empty
+
+    def fill(self, item: T, bounding_box: BoundingBox):
+        """
+        Set everything inside the bounding box (edges included) to item, a row of a chunk at a time.
+        """
+        self._fill(item, bounding_box)
+
+    def clear_area(self, bounding_box: BoundingBox):
+        """
+        Remove everything inside the bounding box (edges included). Chunks that end up empty are dropped.
+        """
+        self._fill(_empty, bounding_box)
+
+    def _fill(self, item, bounding_box: BoundingBox):
+        shift = self._shift
+        mask = self._mask
+        size = self.chunk_size
+
+        for chunk_y in range(bounding_box.min_y >> shift, (bounding_box.max_y >> shift) + 1):
+            for chunk_x in range(bounding_box.min_x >> shift, (bounding_box.max_x >> shift) + 1):
+                chunk = (chunk_x, chunk_y)
+                cells = self._chunks.get(chunk)
+                if cells is None:
+                    if item is _empty:
+                        continue
+                    cells = self._chunks[chunk] = [_empty] * (size * size)
+
+                # Which part of this chunk the box covers
+                start_x = max(bounding_box.min_x, chunk_x << shift) & mask
+                end_x = min(bounding_box.max_x, ((chunk_x + 1) << shift) - 1) & mask
+                start_y = max(bounding_box.min_y, chunk_y << shift) & mask
+                end_y = min(bounding_box.max_y, ((chunk_y + 1) << shift) - 1) & mask
+
+                row = [item] * (end_x - start_x + 1)
+                filled = 0 if item is _empty else len(row)
+                count = self._counts.get(chunk, 0)
+                for offset_y in range(start_y, end_y + 1):
+                    start = (offset_y << shift) + start_x
+                    end = (offset_y << shift) + end_x + 1
+                    count += filled - (len(row) - cells[start:end].count(_empty))
+                    cells[start:end] = row
+
+                if count == 0:
+                    del self._chunks[chunk]
+                    self._counts.pop(chunk, None)
+                else:
+                    self._counts[chunk] = count
+
+        if item is _empty:
+            self._bounds = None
+        else:
+            self._expand_bounds(Coordinate(bounding_box.min_x, bounding_box.min_y, self.system))
+            self._expand_bounds(Coordinate(bounding_box.max_x, bounding_box.max_y, self.system))
+
+
 class MagicGrid(InfiniteGrid[T]):
     def __init__(self, magic_function: Callable[[MagicGrid[T], Coordinate], T]):
         super().__init__()
@@ -449,6 +1079,7 @@ class MagicGrid(InfiniteGrid[T]):
         result = self._magic_function(self, position)
         if result is not None:
             self._data[position] = result
+            self._expand_bounds(position)
             return result
 
         return None
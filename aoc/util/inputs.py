@@ -1,15 +1,136 @@
+import functools
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from array import array
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from aoc.util.grid import Grid
 
+T = TypeVar('T')
+
+_int_re = re.compile(r'-?\d+')
+_int_or_newline_re = re.compile(r'-?\d+|\n')
+
+
+class _InputFile(object):
+    """
+    One read of an input file, shared by every Input for it in this process. The views are built from that one buffer
+    the first time someone asks for them and kept around, so they're tuples and callers get copies.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.parsed: Dict[str, bytes] = {}  # parser key -> pickled result
+
+    @functools.cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(self.data).hexdigest()
+
+    @functools.cached_property
+    def text(self) -> str:
+        # Same thing text mode open() would give us, universal newlines and all
+        return self.data.decode().replace('\r\n', '\n').replace('\r', '\n')
+
+    @functools.cached_property
+    def lines(self) -> Tuple[str, ...]:
+        if self.text == "":
+            return ()
+
+        lines = self.text.split('\n')
+        if lines[-1] == "":
+            lines.pop()
+        return tuple(lines)
+
+    def iter_lines(self) -> Iterator[str]:
+        if 'lines' in self.__dict__:
+            yield from self.lines
+            return
+
+        # Walk the text one newline at a time instead of splitting it all up front
+        text = self.text
+        start = 0
+        while start < len(text):
+            end = text.find('\n', start)
+            if end == -1:
+                yield text[start:]
+                return
+            yield text[start:end]
+            start = end + 1
+
+    @functools.cached_property
+    def ints(self) -> Tuple[int, ...]:
+        return tuple(int(x.strip()) for x in self.lines)
+
+    @functools.cached_property
+    def int_line(self) -> Tuple[int, ...]:
+        line = self.text.partition('\n')[0]
+        sep = ',' if ',' in line else ' '
+        return tuple(int(x) for x in line.split(sep))
+
+    @functools.cached_property
+    def all_ints(self) -> Union[array, Tuple[int, ...]]:
+        values = [int(x) for x in _int_re.findall(self.text)]
+        try:
+            return array('q', values)
+        except OverflowError:
+            # Something doesn't fit in 64 bits, Python ints don't have that problem
+            return tuple(values)
+
+    @functools.cached_property
+    def int_rows(self) -> Tuple[Tuple[int, ...], ...]:
+        # Newlines come out of the same pass as the numbers, so they're what splits the rows up
+        rows = []
+        row = []
+        for token in _int_or_newline_re.findall(self.text):
+            if token == '\n':
+                rows.append(tuple(row))
+                row = []
+            else:
+                row.append(int(token))
+
+        if row or (self.text and not self.text.endswith('\n')):
+            rows.append(tuple(row))
+
+        return tuple(rows)
+
+    @functools.cached_property
+    def grouped(self) -> Tuple[Tuple[str, ...], ...]:
+        current_group = []
+        groups = []
+        for line in self.lines:
+            if line == "":
+                if len(current_group) > 0:
+                    groups.append(tuple(current_group))
+                    current_group = []
+                continue
+            current_group.append(line)
+
+        groups.append(tuple(current_group))
+
+        return tuple(groups)
+
 
 class Input(object):
     _input_dir = Path(__file__).parent.parent.parent / "inputs"
+    # path -> ((mtime, size), file), so an input that gets rewritten is read again
+    _files: Dict[Path, Tuple[Tuple[int, int], _InputFile]] = {}
+    # Where parsed() keeps its pickles between runs, None to only keep them for the life of the process
+    parsed_cache_dir: Optional[Path] = Path(__file__).parent.parent.parent / ".cache" / "parsed"
 
     def __init__(self, name):
         self.name = name
 
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget every file read so far, so the next Input reads and splits its file again.
+        """
+        cls._files.clear()
+
     @property
     def file_path(self):
         return self._input_dir / self.name
@@ -21,39 +142,146 @@ class Input(object):
         self.file_path.parent.mkdir(exist_ok=True, parents=True)
         self.file_path.touch(exist_ok=True)
 
+    def _file(self) -> _InputFile:
+        path = self.file_path
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._files.get(path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, _InputFile(path.read_bytes()))
+            self._files[path] = cached
+
+        return cached[1]
+
+    def data(self) -> bytes:
+        return self._file().data
+
     def line(self) -> str:
-        with open(str(self.file_path), 'r') as fh:
-            return fh.readline()
+        first, newline, _ = self._file().text.partition('\n')
+        return first + newline
 
     def lines(self) -> List[str]:
-        with open(str(self.file_path), 'r') as fh:
-            return list(map(lambda line: line.rstrip('\n'), fh.readlines()))
+        return list(self._file().lines)
 
     def ints(self) -> List[int]:
-        return [int(x.strip()) for x in self.lines()]
+        return list(self._file().ints)
 
     def int(self) -> int:
         return int(self.line())
 
     def int_line(self) -> List[int]:
-        line = self.line()
-        sep = ',' if ',' in line else ' '
-        return [int(x) for x in line.split(sep)]
+        return list(self._file().int_line)
+
+    def all_ints(self) -> Union[array, List[int]]:
+        """
+        Every integer in the file, in order, as one flat array of signed 64-bit ints. If any of them is outside of
+        -2**63 to 2**63 - 1 it's a plain list instead.
+
+        A '-' right before the digits makes it negative, so ranges like 1-3 come out as 1, -3. Days with dash separated
+        ranges need to split those up themselves.
+        """
+        values = self._file().all_ints
+        if isinstance(values, array):
+            return array('q', values)
+        return list(values)
+
+    def int_rows(self) -> List[Tuple[int, ...]]:
+        """
+        The integers on each line, one tuple per line in lines(), anything that isn't a number ignored. Blank lines
+        are empty tuples.
+        """
+        return list(self._file().int_rows)
 
     def grouped(self):
+        return [list(group) for group in self._file().grouped]
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Same lines as lines(), handed out one at a time without building the list first.
+        """
+        return self._file().iter_lines()
+
+    def iter_ints(self) -> Iterator[int]:
+        return (int(line.strip()) for line in self.iter_lines())
+
+    def iter_groups(self) -> Iterator[List[str]]:
+        """
+        Same groups as grouped(), each one yielded as soon as the blank line after it is reached.
+        """
         current_group = []
-        groups = []
-        for line in self.lines():
+        for line in self.iter_lines():
             if line == "":
                 if len(current_group) > 0:
-                    groups.append(current_group)
+                    yield current_group
                     current_group = []
                 continue
             current_group.append(line)
 
-        groups.append(current_group)
+        yield current_group
+
+    @staticmethod
+    def _parser_key(parser: Callable) -> str:
+        # Imported here since the answer cache needs Input itself
+        from aoc.answer_cache import source_hash
+
+        # A partial parses differently depending on what's bound, so that goes in the key along with the function
+        bound = ''
+        while isinstance(parser, functools.partial):
+            bound += repr((parser.args, sorted(parser.keywords.items())))
+            parser = parser.func
+
+        module = getattr(parser, '__module__', None) or type(parser).__module__
+        name = getattr(parser, '__qualname__', None) or repr(parser)
+        code = getattr(parser, '__code__', None)
+        # Lambdas and nested functions share a qualname with their siblings, the line they start on tells them apart
+        line = code.co_firstlineno if code is not None else 0
+        key = f"{module}:{name}:{line}:{bound}:{source_hash(module)}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def parsed(self, parser: Callable[['Input'], T]) -> T:
+        """
+        parser(self), except the result is pickled and reused as long as neither the input nor the source of the
+        parser's module (or anything of ours it imports) changes. Handy when building the Grid/Graph/whatever costs as
+        much as solving. Every call unpickles a fresh copy, so the result is safe to modify.
+        """
+        file = self._file()
+        key = self._parser_key(parser)
+
+        data = file.parsed.get(key)
+        path = None
+        if data is None and self.parsed_cache_dir is not None:
+            path = self.parsed_cache_dir / self.name / f"{file.digest}-{key}.pickle"
+            try:
+                data = path.read_bytes()
+            except OSError:
+                pass
+
+        if data is not None:
+            try:
+                result = pickle.loads(data)
+                file.parsed[key] = data
+                return result
+            except Exception:
+                # Unpickling runs arbitrary class code that may have changed shape since, so just parse it again
+                data = None
+
+        result = parser(self)
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        file.parsed[key] = data
+
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Parallel runs can write the same entry, so write to a temp file and swap it in
+                fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as fh:
+                    fh.write(data)
+                os.replace(temp_name, path)
+            except OSError:
+                pass
 
-        return groups
+        return result
 
     def grid(self) -> Grid[str]:
-        return Grid.from_str(self.lines())
+        return Grid.from_str(self._file().lines)
@@ -31,12 +31,8 @@ class Intcode(object):
     }
 
     def __init__(self, file_name):
-        line = Input(file_name).line()
-        codes = line.split(',')
-
-        self._flash = {}
-        for index in range(len(codes)):
-            self._flash[index] = int(codes[index])
+        # Input keeps the parsed program around, so machines sharing a program (Y2019D23's 50 NICs) only parse it once
+        self._flash = dict(enumerate(Input(file_name).int_line()))
 
         self.ram = {}
         self.instruction_pointer = 0
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TypeVar, Generic, Any, Dict, List, Optional, Callable, Iterable, Tuple, Union
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class ShortestPath(Generic[T]):
+    cost: int
+    path: List[T]
+
+
+class IndexedHeap(Generic[T]):
+    """
+    A binary min heap that knows where every item is, so pushing an item that's already queued lowers its priority in
+    place instead of adding a second copy. Ties come out first in first out, like PriorityQueue.
+    """
+
+    def __init__(self):
+        # (priority, counter, item), counters are unique so comparing entries never gets as far as the item
+        self._heap: List[Tuple[int, int, T]] = []
+        self._position: Dict[T, int] = {}
+        self._counter = 0
+
+    @property
+    def empty(self) -> bool:
+        return len(self._heap) == 0
+
+    def push(self, item: T, priority: int) -> bool:
+        """
+        Queue item, or lower its priority if it's already queued. Returns False if it was already queued at the same
+        priority or lower, in which case nothing changes.
+        """
+        if item in self._position:
+            index = self._position[item]
+            if self._heap[index][0] <= priority:
+                return False
+        else:
+            index = len(self._heap)
+            self._heap.append(None)
+
+        # A fresh counter keeps decrease-key in the same order as pushing a second copy would
+        self._heap[index] = (priority, self._counter, item)
+        self._counter += 1
+        self._sift_up(index)
+        return True
+
+    def pop(self) -> T:
+        heap = self._heap
+        item = heap[0][2]
+        del self._position[item]
+
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+
+        return item
+
+    def priority(self, item: T) -> Optional[int]:
+        if item not in self._position:
+            return None
+        return self._heap[self._position[item]][0]
+
+    def _sift_up(self, index: int):
+        heap = self._heap
+        position = self._position
+        entry = heap[index]
+
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_entry = heap[parent]
+            if parent_entry < entry:
+                break
+
+            heap[index] = parent_entry
+            position[parent_entry[2]] = index
+            index = parent
+
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index: int):
+        heap = self._heap
+        position = self._position
+        size = len(heap)
+        entry = heap[index]
+
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+
+            right = child + 1
+            if right < size and heap[right] < heap[child]:
+                child = right
+
+            child_entry = heap[child]
+            if entry < child_entry:
+                break
+
+            heap[index] = child_entry
+            position[child_entry[2]] = index
+            index = child
+
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._position
+
+    def __bool__(self) -> bool:
+        return not self.empty
+
+    def __len__(self):
+        return len(self._heap)
+
+
+def _path(came_from: Dict[T, T], end: T) -> List[T]:
+    result = [end]
+    current = end
+    while current in came_from:
+        current = came_from[current]
+        result.append(current)
+
+    result.reverse()
+    return result
+
+
+def shortest_path(start: T,
+                  end: Union[T, Callable[[T], bool]],
+                  neighbors: Callable[[T], Iterable[Tuple[T, int]]],
+                  heuristic: Optional[Callable[[T], int]] = None,
+                  queue: Callable[[], Any] = IndexedHeap
+                  ) -> Optional[ShortestPath[T]]:
+    """
+    Dijkstra, or A* when given a heuristic, from start to end. end can be a node or a test for one.
+
+    neighbors gives (neighbor, weight) pairs with weight >= 0. The heuristic estimates the cost left from a node and
+    has to be consistent (never drop by more than the weight of an edge), which Manhattan distance on unit steps is.
+
+    queue makes the frontier, anything with push(item, priority)/pop(). IndexedHeap works for any weights. A
+    BucketQueue is faster when weights are small integers, since priorities then only ever go up.
+    """
+    is_end = end if callable(end) else None
+
+    frontier = queue()
+    frontier.push(start, 0)
+    cost_so_far: Dict[T, int] = {start: 0}
+    came_from: Dict[T, T] = {}
+    closed = set()
+
+    while frontier:
+        current = frontier.pop()
+        if current in closed:
+            continue  # Only queues without decrease-key leave these behind
+
+        if (current == end) if is_end is None else is_end(current):
+            return ShortestPath(cost_so_far[current], _path(came_from, current))
+
+        closed.add(current)
+        current_cost = cost_so_far[current]
+        for neighbor, weight in neighbors(current):
+            if neighbor in closed:
+                continue
+
+            new_cost = current_cost + weight
+            old_cost = cost_so_far.get(neighbor)
+            if old_cost is None or new_cost < old_cost:
+                cost_so_far[neighbor] = new_cost
+                came_from[neighbor] = current
+                priority = new_cost if heuristic is None else new_cost + heuristic(neighbor)
+                frontier.push(neighbor, priority)
+
+    return None
@@ -1,6 +1,7 @@
 import heapq
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TypeVar, Generic, List, Iterator
+from typing import TypeVar, Generic, List, Iterator, Dict, Deque, Iterable, Tuple
 
 T = TypeVar('T')
 
@@ -16,19 +17,16 @@ class PriorityQueue(Generic[T]):
     def __init__(self):
         self._elements: List[PrioritizedItem[T]] = []
         self._counter = 0
-        self._element_count = 0
 
     @property
     def empty(self) -> bool:
-        return self._element_count == 0
+        return len(self._elements) == 0
 
     def push(self, item: T, priority: int):
         heapq.heappush(self._elements, PrioritizedItem[T](priority, self._counter, item))
         self._counter += 1
-        self._element_count += 1
 
     def pop(self) -> T:
-        self._element_count -= 1
         return heapq.heappop(self._elements).item
 
     def __bool__(self) -> bool:
@@ -36,3 +34,108 @@ class PriorityQueue(Generic[T]):
 
     def __len__(self):
         return self._elements.__len__()
+
+
+class TuplePriorityQueue(Generic[T]):
+    """
+    PriorityQueue with the same first in first out ties, but the heap holds plain (priority, counter, item) tuples, so
+    nothing gets allocated per push beyond the tuple and heapq compares them in C.
+    """
+
+    def __init__(self):
+        self._elements: List[Tuple[int, int, T]] = []
+        self._counter = 0
+
+    @property
+    def empty(self) -> bool:
+        return len(self._elements) == 0
+
+    def push(self, item: T, priority: int):
+        heapq.heappush(self._elements, (priority, self._counter, item))
+        self._counter += 1
+
+    def push_many(self, items: Iterable[Tuple[T, int]]):
+        """
+        Push every (item, priority) at once, with one heapify instead of a heappush each.
+        """
+        counter = self._counter
+        elements = self._elements
+        for item, priority in items:
+            elements.append((priority, counter, item))
+            counter += 1
+
+        self._counter = counter
+        heapq.heapify(elements)
+
+    def pop(self) -> T:
+        return heapq.heappop(self._elements)[2]
+
+    def peek(self) -> T:
+        return self._elements[0][2]
+
+    def pushpop(self, item: T, priority: int) -> T:
+        """
+        push then pop, in one pass over the heap. Gives item straight back if nothing queued comes before it.
+        """
+        entry = (priority, self._counter, item)
+        self._counter += 1
+        return heapq.heappushpop(self._elements, entry)[2]
+
+    def __bool__(self) -> bool:
+        return not self.empty
+
+    def __len__(self):
+        return len(self._elements)
+
+
+class BucketQueue(Generic[T]):
+    """
+    Dial's bucket queue, for searches with small non-negative integer priorities that never go below the last one
+    popped (Dijkstra, or A* with a consistent heuristic). Each priority gets a FIFO bucket, and pop walks up from the
+    last priority popped, so a whole search costs O(V + E + C) for a largest priority C.
+
+    Pushing an item again doesn't replace the old entry, whoever pops needs to skip the ones it's already handled.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, Deque[T]] = {}
+        self._current = 0
+        self._element_count = 0
+
+    @property
+    def empty(self) -> bool:
+        return self._element_count == 0
+
+    def push(self, item: T, priority: int):
+        if priority < self._current:
+            raise ValueError(f"Priority {priority} is lower than {self._current}, which was already popped")
+
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = deque()
+        bucket.append(item)
+        self._element_count += 1
+
+    def pop(self) -> T:
+        if self._element_count == 0:
+            raise IndexError("pop from an empty BucketQueue")
+
+        buckets = self._buckets
+        current = self._current
+        while current not in buckets:
+            current += 1
+        self._current = current
+
+        bucket = buckets[current]
+        item = bucket.popleft()
+        if not bucket:
+            del buckets[current]
+
+        self._element_count -= 1
+        return item
+
+    def __bool__(self) -> bool:
+        return not self.empty
+
+    def __len__(self):
+        return self._element_count
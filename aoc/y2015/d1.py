@@ -15,15 +15,15 @@ class Y2015D1(object):
     def part1(self):
         result = self.floor
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.first_basement_index
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D1("2015/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
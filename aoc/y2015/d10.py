@@ -32,15 +32,15 @@ class Y2015D11(object):
     def part1(self):
         result = self.length_at_40
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.length_at_50
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D11("2015/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -12,12 +12,12 @@ class Y2015D11(object):
     def part1(self):
         result = self.next_good_password
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.next_next_good_password
 
-        print("Part 2:", result)
+        return result
 
     def _generator(self):
         password = self.current_password
@@ -59,5 +59,5 @@ class Y2015D11(object):
 
 if __name__ == '__main__':
     code = Y2015D11("2015/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -10,12 +10,12 @@ class Y2015D12(object):
     def part1(self):
         result = self._get_my_sum(self.document)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_my_sum(self.document, True)
 
-        print("Part 2:", result)
+        return result
 
     @classmethod
     def _get_my_sum(cls, document, ignore_red=False):
@@ -34,5 +34,5 @@ class Y2015D12(object):
 
 if __name__ == '__main__':
     code = Y2015D12("2015/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -35,7 +35,7 @@ class Y2015D13(object):
     def part1(self):
         result = self.graph.highest_tsp(loop=True)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         for person in self.all_people:
@@ -43,10 +43,10 @@ class Y2015D13(object):
 
         result = self.graph.highest_tsp(loop=True)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D13("2015/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -41,7 +41,7 @@ class Y2015D14(object):
         for reindeer in self.reindeers:
             result = max(result, reindeer.distance_at(2503))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         points = {}
@@ -58,10 +58,10 @@ class Y2015D14(object):
 
         result = max(points.values())
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D14("2015/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
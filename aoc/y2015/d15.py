@@ -56,15 +56,15 @@ class Y2015D15(object):
     def part1(self):
         result = self.best_recipe
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.bast_with_calorie_limitation
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D15("2015/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
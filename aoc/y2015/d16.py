@@ -43,7 +43,7 @@ class Y2015D16(object):
                 result = sue
                 break
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -61,10 +61,10 @@ class Y2015D16(object):
                 result = sue
                 break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D16("2015/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -25,15 +25,15 @@ class Y2015D17(object):
     def part1(self):
         result = self.num_combinations
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.num_with_min_containers
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D17("2015/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
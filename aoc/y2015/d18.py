@@ -17,7 +17,7 @@ class Y2015D18(object):
 
         result = len(grid.find('#'))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = self.initial_grid
@@ -27,7 +27,7 @@ class Y2015D18(object):
 
         result = len(grid.find('#'))
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _next(grid: Grid[str], lights_stuck=False) -> Grid[str]:
@@ -53,5 +53,5 @@ class Y2015D18(object):
 
 if __name__ == '__main__':
     code = Y2015D18("2015/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -32,7 +32,7 @@ class Y2015D19(object):
 
         result = len(distinct_molecules)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         molecule: str = self.medicine
@@ -54,10 +54,10 @@ class Y2015D19(object):
 
         result = steps
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D19("2015/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2015D2(object):
             l, w, h = present
             result += 2 * l * w + 2 * w * h + 2 * h * l + l * w
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -25,10 +25,10 @@ class Y2015D2(object):
             l, w, h = present
             result += 2 * l + 2 * w + l * w * h
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D2("2015/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
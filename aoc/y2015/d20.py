@@ -23,7 +23,7 @@ class Y2015D20(object):
                 result = house_num
                 break
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -34,10 +34,10 @@ class Y2015D20(object):
                 result = house_num
                 break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D20("2015/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
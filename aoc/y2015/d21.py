@@ -102,15 +102,15 @@ class Y2015D21(object):
     def part1(self):
         result = self.best_gold
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.worst_gold
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D21("2015/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from enum import Enum, auto
 
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 
 
 class Spell(Enum):
@@ -129,17 +129,17 @@ class Y2015D22(object):
         initial_battle_state = BattleState(self.boss_hp, self.boss_damage)
         result = self._fight(initial_battle_state)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         initial_battle_state = BattleState(self.boss_hp, self.boss_damage, hard_mode = True)
         result = self._fight(initial_battle_state)
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _fight(initial_battle_state):
-        queue: PriorityQueue[BattleState] = PriorityQueue[BattleState]()
+        queue: TuplePriorityQueue[BattleState] = TuplePriorityQueue[BattleState]()
         queue.push(initial_battle_state, 0)
         while not queue.empty:
             state: BattleState = queue.pop()
@@ -157,5 +157,5 @@ class Y2015D22(object):
 
 if __name__ == '__main__':
     code = Y2015D22("2015/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -65,7 +65,7 @@ class Y2015D23(object):
         self.computer.run()
         result = self.computer.registers[1]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.computer.reset()
@@ -73,10 +73,10 @@ class Y2015D23(object):
         self.computer.run()
         result = self.computer.registers[1]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D23("2015/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -13,14 +13,14 @@ class Y2015D24(object):
 
         result = self._best_quantum_entanglement(group_weight)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         group_weight = sum(self.packages) // 4
 
         result = self._best_quantum_entanglement(group_weight)
 
-        print("Part 2:", result)
+        return result
 
     def _best_quantum_entanglement(self, group_weight):
         possible_passenger_compartment_groups = []
@@ -42,5 +42,5 @@ class Y2015D24(object):
 
 if __name__ == '__main__':
     code = Y2015D24("2015/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -15,7 +15,7 @@ class Y2015D25(object):
         mod = 33554393
         result = (20151125 * pow(252533, power, mod)) % mod
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         pass
@@ -23,5 +23,5 @@ class Y2015D25(object):
 
 if __name__ == '__main__':
     code = Y2015D25("2015/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
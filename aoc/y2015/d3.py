@@ -18,7 +18,7 @@ class Y2015D3(object):
 
         result = len(grid.find(True))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = InfiniteGrid[bool]()
@@ -36,10 +36,10 @@ class Y2015D3(object):
 
         result = len(grid.find(True))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D3("2015/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
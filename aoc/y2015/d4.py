@@ -23,15 +23,15 @@ class Y2015D4(object):
     def part1(self):
         result = self.five_leading_zeros
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.six_leading_zeros
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D4("2015/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -13,7 +13,7 @@ class Y2015D5(object):
         for string in self.strings:
             result += 1 if self._nice_part1(string) else 0
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -21,7 +21,7 @@ class Y2015D5(object):
         for string in self.strings:
             result += 1 if self._nice_part2(string) else 0
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _nice_part1(string):
@@ -61,5 +61,5 @@ class Y2015D5(object):
 
 if __name__ == '__main__':
     code = Y2015D5("2015/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
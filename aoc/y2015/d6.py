@@ -28,12 +28,12 @@ class Y2015D6(object):
     def part1(self):
         result = sum(1 for value in self.bool_grid.values() if value)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum(value for value in self.int_grid.values())
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _range(line):
@@ -50,5 +50,5 @@ class Y2015D6(object):
 
 if __name__ == '__main__':
     code = Y2015D6("2015/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
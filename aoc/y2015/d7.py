@@ -82,14 +82,14 @@ class Y2015D7(object):
         state = self._compute_wires({})
         result = state['a']
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         state = self._compute_wires({})
         state = self._compute_wires({'b': state['a']})
         result = state['a']
 
-        print("Part 2:", result)
+        return result
 
     def _compute_wires(self, initial_state: Dict[str, int]) -> Dict[str, int]:
         state: Dict[str, int] = initial_state.copy()
@@ -108,5 +108,5 @@ class Y2015D7(object):
 
 if __name__ == '__main__':
     code = Y2015D7("2015/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
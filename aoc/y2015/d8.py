@@ -24,7 +24,7 @@ class Y2015D8(object):
 
             result += len(literal) - count
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -43,10 +43,10 @@ class Y2015D8(object):
 
             result += count - len(literal)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D8("2015/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
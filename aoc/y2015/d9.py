@@ -24,15 +24,15 @@ class Y2015D9(object):
     def part1(self):
         result = self.graph.tsp()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.graph.highest_tsp()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2015D9("2015/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -21,7 +21,7 @@ class Y2016D1(object):
 
         result = abs(turtle.coordinate.x) + abs(turtle.coordinate.y)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         seen = set()
@@ -44,10 +44,10 @@ class Y2016D1(object):
                     break
                 seen.add(turtle.coordinate)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D1("2016/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
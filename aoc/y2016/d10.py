@@ -85,15 +85,15 @@ class Y2016D10(object):
     def part1(self):
         result = self.result_part_1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.outputs[0] * self.outputs[1] * self.outputs[2]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D10("2016/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
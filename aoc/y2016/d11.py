@@ -8,7 +8,6 @@ from typing import FrozenSet, Set, Union, Optional, List, Dict
 from typing import Generator as TypeGenerator
 
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
 
 
 @dataclass(frozen=True)
@@ -196,7 +195,7 @@ class Y2016D11(object):
         best_floor.print()
         print()
 
-        print("Part 1:", result)
+        return result
 
     # TODO Improve this a lot. Right now, it takes ~7 hours to find a solution.
     def part2(self):
@@ -219,7 +218,7 @@ class Y2016D11(object):
 
         result = best_floor.steps
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def get_min_steps_to_top_floor(start_floors: Floors):
@@ -249,5 +248,5 @@ class Y2016D11(object):
 
 if __name__ == '__main__':
     code = Y2016D11("2016/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
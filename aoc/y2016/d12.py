@@ -12,7 +12,7 @@ class Y2016D12(object):
         self.computer.run()
         result = self.computer.registers[0]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.computer.reset()
@@ -20,10 +20,10 @@ class Y2016D12(object):
         self.computer.run()
         result = self.computer.registers[0]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D12("2016/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
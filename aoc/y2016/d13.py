@@ -29,16 +29,16 @@ class Y2016D13(object):
 
         result = len(path) - 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         flood_map = self.grid.flood_map(self.start, True, max_value=50)
         result = len(flood_map)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D13("2016/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
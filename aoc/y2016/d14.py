@@ -59,16 +59,16 @@ class Y2016D14(object):
         key_generator = KeyGenerator(self.salt)
         result = key_generator.last_index
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         key_generator = KeyGenerator(self.salt, key_stretching=True)
         result = key_generator.last_index
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D14("2016/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
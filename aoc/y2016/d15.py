@@ -33,7 +33,7 @@ class Y2016D15(object):
 
         result = crt.result
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         crt = ChineseRemainderTheorem()
@@ -50,10 +50,10 @@ class Y2016D15(object):
 
         result = crt.result
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D15("2016/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
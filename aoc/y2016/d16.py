@@ -33,15 +33,15 @@ class Y2016D16(object):
     def part1(self):
         result = self._get_checksum(272)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_checksum(35651584)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D16("2016/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -7,7 +7,7 @@ from typing import Set
 
 from aoc.util.coordinate import Coordinate, CoordinateSystem
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 
 
 @dataclass(frozen=True)
@@ -43,7 +43,7 @@ class Y2016D17(object):
         self.passcode = Input(file_name).line()
 
     def part1(self):
-        queue: PriorityQueue[SearchAttempt] = PriorityQueue[SearchAttempt]()
+        queue: TuplePriorityQueue[SearchAttempt] = TuplePriorityQueue[SearchAttempt]()
         queue.push(SearchAttempt(steps="", coordinate=Coordinate(0, 0, system=CoordinateSystem.X_RIGHT_Y_DOWN)), 0)
 
         result = None
@@ -58,7 +58,7 @@ class Y2016D17(object):
             for next_attempt in item.open_paths(self.passcode):
                 queue.push(next_attempt, len(next_attempt.steps))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         queue = Queue()
@@ -77,10 +77,10 @@ class Y2016D17(object):
             for next_attempt in item.open_paths(self.passcode):
                 queue.put(next_attempt)
 
-        print("Part 2:", len(result))
+        return len(result)
 
 
 if __name__ == '__main__':
     code = Y2016D17("2016/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -12,7 +12,7 @@ class Y2016D18(object):
         for _ in range(40):
             result += next(gen).count('.')
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -21,7 +21,7 @@ class Y2016D18(object):
         for _ in range(400000):
             result += next(gen).count('.')
 
-        print("Part 2:", result)
+        return result
 
     def _tile_generator(self):
         row = self.starting_row
@@ -52,5 +52,5 @@ class Y2016D18(object):
 
 if __name__ == '__main__':
     code = Y2016D18("2016/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
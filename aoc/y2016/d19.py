@@ -16,7 +16,7 @@ class Y2016D19(object):
         diff = self.num_elves - highest_power_of_two
         result = 2 * diff + 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         """
@@ -40,10 +40,10 @@ class Y2016D19(object):
 
         result = left[0] or right[0]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D19("2016/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
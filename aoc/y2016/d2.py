@@ -16,7 +16,7 @@ class Y2016D2(object):
 
         result = self._get_keycode(keypad)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         keypad: Grid[str] = Grid[str](5, 5)
@@ -36,7 +36,7 @@ class Y2016D2(object):
 
         result = self._get_keycode(keypad)
 
-        print("Part 2:", result)
+        return result
 
     def _get_keycode(self, keypad: Grid[str]):
         coordinate = Coordinate(1, 1, system=CoordinateSystem.X_RIGHT_Y_DOWN)
@@ -54,5 +54,5 @@ class Y2016D2(object):
 
 if __name__ == '__main__':
     code = Y2016D2("2016/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
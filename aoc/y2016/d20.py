@@ -27,7 +27,7 @@ class Y2016D20(object):
 
             result = end + 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -42,10 +42,10 @@ class Y2016D20(object):
 
             current = end + 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D20("2016/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
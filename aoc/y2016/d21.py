@@ -170,17 +170,17 @@ class Y2016D21(object):
         scrambler.scramble(self.operations)
         result = scrambler.password
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         scrambler = Scrambler("fbgdceah")
         scrambler.unscramble(self.operations)
         result = scrambler.password
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D21("2016/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -45,7 +45,7 @@ class Y2016D22(object):
 
             result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = self._get_grid()
@@ -66,7 +66,7 @@ class Y2016D22(object):
         # The +1 is for the last move to the right which moves our goal data into our target cell.
         result += 5 * (grid.width - 2) + 1
 
-        print("Part 2:", result)
+        return result
 
     def _get_grid(self):
         grid = InfiniteGrid[str]()
@@ -93,5 +93,5 @@ class Y2016D22(object):
 
 if __name__ == '__main__':
     code = Y2016D22("2016/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -13,17 +13,17 @@ class Y2016D23(object):
         self.assembunny.run()
         result = self.assembunny.registers[0]
 
-        print("Part 1:", result)
+        return result
 
     @staticmethod
     def part2():
         # My input was basically 12! + 95 * 91. I suspect for different inputs, the 91 and 95 are what changes.
         result = 479010245
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D23("2016/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -14,7 +14,7 @@ class Y2016D25(object):
         # Only run if you want to prove it produces the correct signal
         # self.assembunny.run()
 
-        print("Part 1:", result)
+        return result
 
     @staticmethod
     def part2():
@@ -23,5 +23,5 @@ class Y2016D25(object):
 
 if __name__ == '__main__':
     code = Y2016D25("2016/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
@@ -49,15 +49,15 @@ class Y2016D3(object):
     def part1(self):
         result = sum(1 for triangle in self.triangle_rows if triangle.valid)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum(1 for triangle in self.triangle_cols if triangle.valid)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D3("2016/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -45,15 +45,15 @@ class Y2016D4(object):
     def part1(self):
         result = sum(room.sector_id for room in self.valid_rooms)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = [room.sector_id for room in self.valid_rooms if room.decoded == "northpole object storage"].pop()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D4("2016/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -32,15 +32,15 @@ class Y2016D5(object):
     def part1(self):
         result = self.password_ordered
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.password_by_position
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D5("2016/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
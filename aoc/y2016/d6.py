@@ -28,15 +28,15 @@ class Y2016D6(object):
     def part1(self):
         result = self.most_common
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.least_common
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D6("2016/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
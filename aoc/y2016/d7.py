@@ -75,15 +75,15 @@ class Y2016D7(object):
     def part1(self):
         result = sum(1 for addr in self.addresses if addr.supports_tls)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum(1 for addr in self.addresses if addr.supports_ssl)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2016D7("2016/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
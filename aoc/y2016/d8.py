@@ -39,7 +39,7 @@ class Y2016D8(object):
     def part1(self):
         result = len(self.grid.find('#'))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         print("Part 2:")
@@ -49,5 +49,5 @@ class Y2016D8(object):
 
 if __name__ == '__main__':
     code = Y2016D8("2016/8.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
@@ -8,12 +8,12 @@ class Y2016Y9(object):
     def part1(self):
         result = self._decode_count(self.input, False)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._decode_count(self.input, True)
 
-        print("Part 2:", result)
+        return result
 
     @classmethod
     def _decode_count(cls, line, recursive) -> int:
@@ -46,5 +46,5 @@ class Y2016Y9(object):
 
 if __name__ == '__main__':
     code = Y2016Y9("2016/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2017D1(object):
             if current_digit == next_digit:
                 result += current_digit
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -30,10 +30,10 @@ class Y2017D1(object):
             if current_digit == next_digit:
                 result += current_digit
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D1("2017/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -28,15 +28,15 @@ class Y2017D10(object):
             skip_size += 1
 
         result = circle[0] * circle[1]
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = KnotHash(self.input).hex
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D10("2017/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -33,15 +33,15 @@ class Y2017D11(object):
     def part1(self):
         result = self._distance(self.coordinate)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.furthest_distance
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D11("2017/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -22,7 +22,7 @@ class Y2017D12(object):
     def part1(self):
         result = len(self._get_group_containing(0))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         groups = []
@@ -36,7 +36,7 @@ class Y2017D12(object):
 
         result = len(groups)
 
-        print("Part 2:", result)
+        return result
 
     def _get_group_containing(self, program) -> Set[int]:
         node_set: Set[int] = set()
@@ -57,5 +57,5 @@ class Y2017D12(object):
 
 if __name__ == '__main__':
     code = Y2017D12("2017/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
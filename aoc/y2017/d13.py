@@ -21,7 +21,7 @@ class Y2017D13(object):
             if _depth % ((_range - 1) * 2) == 0:
                 result += _depth * _range
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -36,10 +36,10 @@ class Y2017D13(object):
                 result = delay
                 break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D13("2017/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -21,7 +21,7 @@ class Y2017D14(object):
     def part1(self):
         result = len(self.coordinates)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         groups = []
@@ -44,10 +44,10 @@ class Y2017D14(object):
 
         result = len(groups)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D14("2017/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -30,7 +30,7 @@ class Y2017D15(object):
             if a_value == b_value:
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -45,7 +45,7 @@ class Y2017D15(object):
             if a_value == b_value:
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _generator(start, factor, consider_multiples_of=1):
@@ -58,5 +58,5 @@ class Y2017D15(object):
 
 if __name__ == '__main__':
     code = Y2017D15("2017/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -76,7 +76,7 @@ class Y2017D16(object):
 
         result = self.dance.programs
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.dance.reset()
@@ -98,10 +98,10 @@ class Y2017D16(object):
         needed_index = (loops_needed - original_instance) % loop_size
         result = [key for key, value in seen.items() if value == needed_index].pop()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D16("2017/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -21,7 +21,7 @@ class Y2017D17(object):
                 result = spinlock[i+1]
                 break
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         current_position = 0
@@ -33,10 +33,10 @@ class Y2017D17(object):
             if current_position == 1:
                 result = i+1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D17("2017/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
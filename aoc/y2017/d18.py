@@ -117,7 +117,7 @@ class Y2017D18(object):
         sound_code.run()
         result = sound_code.last_sound
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         a = PairCode(self.lines, 0)
@@ -137,7 +137,7 @@ class Y2017D18(object):
 
         result = b_sent
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _transfer_queues(sending: Queue, receiving: Queue) -> int:
@@ -152,5 +152,5 @@ class Y2017D18(object):
 
 if __name__ == '__main__':
     code = Y2017D18("2017/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -42,15 +42,15 @@ class Y2017D19(object):
     def part1(self):
         result = self.secret_message
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.step_count
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D19("2017/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -14,15 +14,15 @@ class Y2017D2(object):
     def part1(self):
         result = sum(max(row) - min(row) for row in self.rows)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum([x // y for x, y in itertools.product(row, row) if x != y and x % y == 0][0] for row in self.rows)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D2("2017/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -51,7 +51,7 @@ class Y2017D20(object):
         sorted_positions = sorted(new_positions, key=lambda x: abs(x[1]).distance(Vector(0, 0, 0)))
         result: int = sorted_positions[0][0]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         all_particles = set(self.particles)
@@ -73,10 +73,10 @@ class Y2017D20(object):
 
         result = len(all_particles)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D20("2017/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -130,15 +130,15 @@ class Y2017D21(object):
     def part1(self):
         result = self.count_at_5
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.count_at_18
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D21("2017/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -40,7 +40,7 @@ class Y2017D22(object):
 
             cleaner = cleaner.forward()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid: InfiniteGrid[bool] = self.grid.copy()
@@ -70,10 +70,10 @@ class Y2017D22(object):
 
             cleaner = cleaner.forward()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D22("2017/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
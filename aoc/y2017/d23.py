@@ -1,8 +1,6 @@
 import re
 from typing import List, Union
 
-import sympy
-
 from aoc.util.inputs import Input
 
 
@@ -67,10 +65,12 @@ class Y2017D23(object):
     def part1(self):
         result = self.coprocessor.mul_called
 
-        print("Part 1:", result)
+        return result
 
     @staticmethod
     def part2():
+        import sympy
+
         result = 0
 
         # The problem basically requires you to reverse engineer it.
@@ -79,10 +79,10 @@ class Y2017D23(object):
             if not sympy.isprime(i):
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D23("2017/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
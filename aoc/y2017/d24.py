@@ -93,15 +93,15 @@ class Y2017D24(object):
     def part1(self):
         result = self.strongest_overall_bridge
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.longest_bridge_strength
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D24("2017/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -104,7 +104,7 @@ class Y2017D25(object):
 
         result = self.machine.checksum
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         pass
@@ -112,5 +112,5 @@ class Y2017D25(object):
 
 if __name__ == '__main__':
     code = Y2017D25("2017/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
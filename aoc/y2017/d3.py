@@ -26,7 +26,7 @@ class Y2017D3(object):
         for _, coordinate in zip(range(self.input), self._spiral()):
             result = abs(coordinate.x) + abs(coordinate.y)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         def _magic_grid(g: MagicGrid[int], coordinate: Coordinate):
@@ -44,7 +44,7 @@ class Y2017D3(object):
                 result = value
                 break
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _spiral():
@@ -63,5 +63,5 @@ class Y2017D3(object):
 
 if __name__ == '__main__':
     code = Y2017D3("2017/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2017D4(object):
             if len(passphrase_list) == len(passphrase_set):
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -33,10 +33,10 @@ class Y2017D4(object):
             if not any_anagrams:
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D4("2017/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
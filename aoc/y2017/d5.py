@@ -18,7 +18,7 @@ class Y2017D5(object):
             pointer += value
             result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -36,10 +36,10 @@ class Y2017D5(object):
             pointer += value
             result += 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D5("2017/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -33,15 +33,15 @@ class Y2017D6(object):
     def part1(self):
         result = self.redistribution_cycles
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.cycle_size
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D6("2017/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -32,7 +32,7 @@ class Y2017D7(object):
     def part1(self):
         result = self.root_node
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -72,10 +72,10 @@ class Y2017D7(object):
 
         _get_total_weight(self.root_node)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D7("2017/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -51,15 +51,15 @@ class Y2017D8(object):
     def part1(self):
         result = self.cpu.largest_register
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.cpu.largest_register_ever
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D8("2017/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
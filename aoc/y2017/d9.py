@@ -40,15 +40,15 @@ class Y2017D9(object):
     def part1(self):
         result = self.garbage_collector.score
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.garbage_collector.ignored_count
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2017D9("2017/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
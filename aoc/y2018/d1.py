@@ -10,7 +10,7 @@ class Y2018D1(object):
     def part1(self):
         result = sum(self.frequencies)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -26,10 +26,10 @@ class Y2018D1(object):
                 else:
                     seen.add(result)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D1("2018/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
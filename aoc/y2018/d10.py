@@ -69,10 +69,10 @@ class Y2018D10(object):
     def part2(self):
         result = self.best_time
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D10("2018/10.txt")
     code.part1()
-    code.part2()
+    print("Part 2:", code.part2())
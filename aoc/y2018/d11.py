@@ -40,7 +40,7 @@ class Y2018D11(object):
                     max_power = power
                     result = f"{x},{y}"
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = None
@@ -54,10 +54,10 @@ class Y2018D11(object):
                         max_power = power
                         result = f"{x},{y},{size}"
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D11("2018/11.txt")
-    # code.part1()
-    code.part2()
+    # print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
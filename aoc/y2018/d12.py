@@ -53,7 +53,7 @@ class Y2018D12(object):
 
         result = pots.value()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         seen_pots = {}
@@ -69,10 +69,10 @@ class Y2018D12(object):
         value_change = latest_value - previous_value
         result = (50000000000 - generation) * value_change + latest_value
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D12("2018/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -122,16 +122,16 @@ class Y2018D13(object):
         crash = self.madness.crashes[0]
         result = f"{crash.x},{crash.y}"
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         last_cart = list(self.madness.carts)[0]
         result = f"{last_cart.coordinate.x},{last_cart.coordinate.y}"
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D13("2018/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -26,7 +26,7 @@ class Y2018D14(object):
         string = "".join(str(x) for x in recipe[input_value:input_value+10])
         result = string
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -54,10 +54,10 @@ class Y2018D14(object):
                 result = len(recipe) - match_length - 1
                 break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D14("2018/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
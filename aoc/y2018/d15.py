@@ -166,7 +166,7 @@ class Y2018D15(object):
     def part1(self):
         result = self.battle.run()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         outcomes = {}
@@ -185,10 +185,10 @@ class Y2018D15(object):
         print(boost_needed)
         result = outcomes[boost_needed]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D15("2018/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
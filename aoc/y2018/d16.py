@@ -44,14 +44,14 @@ class Y2018D16(object):
             if number_of_matches >= 3:
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         vm = WatchVM(self.program_code)
         vm.run()
         result = vm.registers[0]
 
-        print("Part 2:", result)
+        return result
 
     # Used to map out opcodes -> instructions the first time.
     # After that, they were encoded in the instruction class, itself for day 19
@@ -82,5 +82,5 @@ class Y2018D16(object):
 
 if __name__ == '__main__':
     code = Y2018D16("2018/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,14 +1,15 @@
 import re
 from typing import Tuple, List
 
-from aoc.util.grid import InfiniteGrid
+from aoc.util.coordinate import BoundingBox
+from aoc.util.grid import ChunkedGrid
 from aoc.util.inputs import Input
 
 
 class Y2018D17(object):
     def __init__(self, file_name):
         lines = Input(file_name).lines()
-        self.grid = InfiniteGrid[str]()
+        self.grid = ChunkedGrid[str](chunk_size=16)  # The clay is thin lines, bigger chunks would be mostly empty
 
         for line in lines:
             x_matched = re.match(r'x=(\d+), y=(\d+)..(\d+)', line)
@@ -19,15 +20,13 @@ class Y2018D17(object):
                 start_y = int(x_matched.group(2))
                 end_y = int(x_matched.group(3))
 
-                for y in range(start_y, end_y + 1):
-                    self.grid[x, y] = '#'
+                self.grid.fill('#', BoundingBox(x, start_y, x, end_y))
             elif y_matched is not None:
                 y = int(y_matched.group(1))
                 start_x = int(y_matched.group(2))
                 end_x = int(y_matched.group(3))
 
-                for x in range(start_x, end_x + 1):
-                    self.grid[x, y] = '#'
+                self.grid.fill('#', BoundingBox(start_x, y, end_x, y))
             else:
                 raise ValueError(f"Couldn't match the line!")
 
@@ -36,12 +35,12 @@ class Y2018D17(object):
     def part1(self):
         result = len(self.grid.find(lambda x: x in ['~', '|']))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = len(self.grid.find('~'))
 
-        print("Part 2:", result)
+        return result
 
     def _fill_grid_with_water(self):
         # Technically, it starts at 500, 0 but we don't count water outside of our bounding box
@@ -84,5 +83,5 @@ class Y2018D17(object):
 
 if __name__ == '__main__':
     code = Y2018D17("2018/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2018D19(object):
         self.vm.run()
         result = self.vm.registers[0]
 
-        print("Part 1:", result)
+        return result
 
     @staticmethod
     def part2():
@@ -27,10 +27,10 @@ class Y2018D19(object):
         number = 10551403
         result = sum(x for x in range(1, number + 1) if number % x == 0)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D19("2018/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -21,7 +21,7 @@ class Y2018D2(object):
 
         result = count_3 * count_2
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         lines = sorted(self.lines)
@@ -36,10 +36,10 @@ class Y2018D2(object):
                 result = "".join(x for x, y in zip(a, b) if x == y)
                 break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D2("2018/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -18,12 +18,12 @@ class Y2018D20(object):
     def part1(self):
         result = max(self.flood_map.values()) // 2
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum(1 for value in self.flood_map.values() if value >= 2000 and value % 2 == 0)
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _build_map(start, line) -> InfiniteGrid[str]:
@@ -79,5 +79,5 @@ class Y2018D20(object):
 
 if __name__ == '__main__':
     code = Y2018D20("2018/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
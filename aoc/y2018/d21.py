@@ -61,7 +61,7 @@ class Y2018D21(object):
         self._setup_breakpoint(_breakpoint)
         self.vm.run()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.vm.reset()
@@ -83,7 +83,7 @@ class Y2018D21(object):
         self._setup_breakpoint(_breakpoint)
         self.vm.run()
 
-        print("Part 2:", result)
+        return result
 
     def _setup_breakpoint(self, _breakpoint):
         if isinstance(self.vm, WatchVM):
@@ -103,5 +103,5 @@ class Y2018D21(object):
 
 if __name__ == '__main__':
     code = Y2018D21("2018/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
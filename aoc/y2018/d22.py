@@ -5,7 +5,7 @@ from typing import Set, Dict
 from aoc.util.coordinate import BoundingBox, Coordinate, CoordinateSystem
 from aoc.util.grid import Grid, MagicGrid
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 
 
 class Tool(Enum):
@@ -71,10 +71,10 @@ class Y2018D22(object):
                 if value == '|':
                     result += 2
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
-        queue: PriorityQueue[RescueAttempt] = PriorityQueue[RescueAttempt]()
+        queue: TuplePriorityQueue[RescueAttempt] = TuplePriorityQueue[RescueAttempt]()
         result = 0
         seen: Dict[RescueAttempt, int] = {}
 
@@ -132,10 +132,10 @@ class Y2018D22(object):
                     queue.push(new_attempt, new_attempt.minutes)
 
         self.grid.to_grid().print()
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D22("2018/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -3,8 +3,6 @@ import re
 from dataclasses import dataclass
 from typing import Tuple, Union
 
-from z3 import *
-
 from aoc.util.inputs import Input
 
 
@@ -45,9 +43,11 @@ class Y2018D23(object):
         nanobot: Nanobot
         result = sum(1 for nanobot in self.nanobots if biggest.in_range(nanobot))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
+        from z3 import If, Int, Ints, Optimize
+
         def z3_abs(num):
             return If(num >= 0, num, -num)
 
@@ -76,10 +76,10 @@ class Y2018D23(object):
         optimizer.check()
         result = optimizer.model()[distance_to_origin]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D23("2018/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -193,7 +193,7 @@ class Y2018D24(object):
         self.combat.war()
         result = self.combat.remaining_units
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         outcomes = {}
@@ -211,10 +211,10 @@ class Y2018D24(object):
 
         result = outcomes[smallest_boost]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D24("2018/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
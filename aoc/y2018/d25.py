@@ -60,7 +60,7 @@ class Y2018D25(object):
 
         result = len(constellations)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         pass
@@ -68,5 +68,5 @@ class Y2018D25(object):
 
 if __name__ == '__main__':
     code = Y2018D25("2018/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
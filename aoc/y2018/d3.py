@@ -32,7 +32,7 @@ class Y2018D3(object):
     def part1(self):
         result = len(self.overlapping_coordinates)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         overlapping_ids = set()
@@ -43,10 +43,10 @@ class Y2018D3(object):
         if len(result) != 1:
             raise ValueError("Didn't get one result!")
 
-        print("Part 2:", result.pop())
+        return result.pop()
 
 
 if __name__ == '__main__':
     code = Y2018D3("2018/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
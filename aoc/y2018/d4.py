@@ -58,7 +58,7 @@ class Y2018D4(object):
 
         result = worst_guard * worst_time
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         guards_to_times = {}
@@ -79,10 +79,10 @@ class Y2018D4(object):
         worst_time, _ = max(guards_to_times[worst_guard].items(), key=lambda x: x[1])
         result = worst_guard * worst_time
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D4("2018/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
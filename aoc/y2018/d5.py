@@ -13,7 +13,7 @@ class Y2018D5(object):
 
         result = len(polymer)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = len(self.polymer)
@@ -23,7 +23,7 @@ class Y2018D5(object):
             polymer = self._reduce_polymer(polymer)
             result = min(result, len(polymer))
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _reduce_polymer(polymer):
@@ -46,5 +46,5 @@ class Y2018D5(object):
 
 if __name__ == '__main__':
     code = Y2018D5("2018/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
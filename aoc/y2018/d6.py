@@ -64,7 +64,7 @@ class Y2018D6(object):
 
             result = max(result, len(self.grid.find(coordinate)))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -76,10 +76,10 @@ class Y2018D6(object):
             if total_distance < 10000:
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D6("2018/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
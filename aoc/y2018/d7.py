@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Set, Optional, Dict
 
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 from aoc.util.tasks import Tasking
 
 
@@ -32,11 +32,11 @@ class Y2018D7(object):
             result += min_element
             tasking.done(min_element)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         tasking = self.tasking.copy()
-        queue: PriorityQueue[WithTime] = PriorityQueue[WithTime]()
+        queue: TuplePriorityQueue[WithTime] = TuplePriorityQueue[WithTime]()
         for _ in range(5):
             queue.push(WithTime(None, 0), 0)
 
@@ -68,10 +68,10 @@ class Y2018D7(object):
 
         result = biggest_time
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D7("2018/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -50,7 +50,7 @@ class Y2018D8(object):
             for child in node.children:
                 queue.put(child)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         scores: Dict[TreeNode, int] = {}
@@ -75,11 +75,11 @@ class Y2018D8(object):
 
         result = _get_score(self._root)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D8("2018/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
 
@@ -70,17 +70,17 @@ class Y2018D9(object):
         game.play()
         result = game.highest_score()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         game = Game(self.players, self.last_marble * 100)
         game.play()
         result = game.highest_score()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2018D9("2018/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -22,15 +22,15 @@ class Y2019D1(object):
     def part1(self):
         fuel_needed = sum(map(lambda x: self._fuel_for_mass(x), self.input))
 
-        print("Part 1:", fuel_needed)
+        return fuel_needed
 
     def part2(self):
         fuel_needed = sum(map(lambda x: self._fuel_for_mass_total(x), self.input))
 
-        print("Part 2:", fuel_needed)
+        return fuel_needed
 
 
 if __name__ == '__main__':
     code = Y2019D1("2019/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
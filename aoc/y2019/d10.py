@@ -25,7 +25,7 @@ class Y2019D10(object):
     def part1(self):
         result = len(self._asteroids_visible_from(self.monitoring_station))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = None
@@ -44,7 +44,7 @@ class Y2019D10(object):
                     result = asteroid.x * 100 + asteroid.y
                     break
 
-        print("Part 2:", result)
+        return result
 
     def _get_angle_for_position(self, asteroid: Coordinate) -> float:
         d_x = asteroid.x - self.monitoring_station.x
@@ -93,5 +93,5 @@ class Y2019D10(object):
 
 if __name__ == '__main__':
     code = Y2019D10("2019/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
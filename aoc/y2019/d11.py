@@ -44,7 +44,7 @@ class Y2019D11(object):
         painted_tiles = self._paint()
         result = len(painted_tiles)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.grid.clear()
@@ -56,5 +56,5 @@ class Y2019D11(object):
 
 if __name__ == '__main__':
     code = Y2019D11("2019/11.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
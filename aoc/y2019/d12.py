@@ -41,7 +41,7 @@ class Y2019D12(object):
         kinetic = [self._energy(velocity) for velocity in self.velocities]
 
         result = sum([p * k for p, k in zip(potential, kinetic)])
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.reset()
@@ -72,7 +72,7 @@ class Y2019D12(object):
                 lcm_z = steps
 
         # TODO Maybe upgrade to python 3.9 to use builtin lcm
-        print("Part 2:", self._lcm(lcm_x, self._lcm(lcm_y, lcm_z)))
+        return self._lcm(lcm_x, self._lcm(lcm_y, lcm_z))
 
     @staticmethod
     def _lcm(x, y):
@@ -93,5 +93,5 @@ class Y2019D12(object):
 
 if __name__ == '__main__':
     code = Y2019D12("2019/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
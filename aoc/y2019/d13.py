@@ -52,7 +52,7 @@ class Y2019D13(object):
         self._get_game_update()
         result = len(self.grid.find(Tile.BLOCK))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.reset()
@@ -74,10 +74,10 @@ class Y2019D13(object):
 
             self._get_game_update()
 
-        print("Part 2:", self.score)
+        return self.score
 
 
 if __name__ == '__main__':
     code = Y2019D13("2019/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -40,7 +40,7 @@ class Y2019D14(object):
     def part1(self):
         result = self._get_ore_cost(1)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         max_ore = 1000000000000
@@ -54,7 +54,7 @@ class Y2019D14(object):
 
         result = search.latest(1, lambda x: x*2)
 
-        print("Part 2:", result)
+        return result
 
     def _get_ore_cost(self, fuel) -> int:
         needed = {'FUEL': fuel}
@@ -95,5 +95,5 @@ class Y2019D14(object):
 
 if __name__ == '__main__':
     code = Y2019D14("2019/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -90,7 +90,7 @@ class Y2019D15(object):
         # -1 is because path includes start and they want "steps to oxygen"
         result = len(graph.find_path(start, oxygen, CoordinateHeuristic())) - 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self._map_out_grid()
@@ -108,10 +108,10 @@ class Y2019D15(object):
             minutes += 1
             empty_tiles = self.grid.find(Tile.EMPTY)
 
-        print("Part 2:", minutes)
+        return minutes
 
 
 if __name__ == '__main__':
     code = Y2019D15("2019/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
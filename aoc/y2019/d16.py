@@ -29,7 +29,7 @@ class Y2019D16(object):
 
         result = "".join(str(x) for x in phase[:8])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         phase = self.input * 10000
@@ -47,13 +47,13 @@ class Y2019D16(object):
 
         result = "".join(str(x) for x in phase[:8])
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2019D16("2019/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
 
 """
 There's a shortcut for part 2 that we have to use. We rely in a few observations:
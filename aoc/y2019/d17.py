@@ -22,7 +22,7 @@ class Y2019D17(object):
             if intersecting:
                 result += scaffold.x * scaffold.y
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.computer.reset()
@@ -43,10 +43,10 @@ class Y2019D17(object):
         grid = Grid.from_str(map_string)
         result = self.computer.output()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2019D17("2019/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
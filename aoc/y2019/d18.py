@@ -6,7 +6,7 @@ from aoc.util import alphabet
 from aoc.util.coordinate import Coordinate
 from aoc.util.grid import Grid, GridLocation
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 
 
 @dataclass(frozen=True)
@@ -38,7 +38,7 @@ class Y2019D18(object):
         grid = self.grid.copy()
         result = self._get_all_keys(grid)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = self.grid.copy()
@@ -54,7 +54,7 @@ class Y2019D18(object):
         grid[robot.down().right()] = '@'
         result = self._get_all_keys(grid)
 
-        print("Part 2:", result)
+        return result
 
     def _get_all_keys(self, grid: Grid[str]):
         all_keys = {}
@@ -70,7 +70,7 @@ class Y2019D18(object):
 
         initial_search = SearchAttempt(steps=0, robots=frozenset(robot_positions), keys=frozenset())
 
-        queue: PriorityQueue[SearchAttempt] = PriorityQueue[SearchAttempt]()
+        queue: TuplePriorityQueue[SearchAttempt] = TuplePriorityQueue[SearchAttempt]()
         queue.push(initial_search, initial_search.steps)
         seen: Dict[Coordinate, Set[FrozenSet[str]]] = {}
 
@@ -157,5 +157,5 @@ class Y2019D18(object):
 
 if __name__ == '__main__':
     code = Y2019D18("2019/18.txt")
-    # code.part1()
-    code.part2()
+    # print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -25,7 +25,7 @@ class Y2019D19(object):
                 if self._is_beam(x, y):
                     result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         square_side = 100
@@ -54,7 +54,7 @@ class Y2019D19(object):
         found_x = end_cache[found_y] - square_side + 1
         result = found_x * 10000 + found_y
 
-        print("Part 2:", result)
+        return result
 
     def _find_beam_right(self, start_x: int, y: int, max_search_x=10000):
         seen_beam = False
@@ -70,5 +70,5 @@ class Y2019D19(object):
 
 if __name__ == '__main__':
     code = Y2019D19("2019/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -12,7 +12,7 @@ class Y2019D2(object):
         self.computer.ram[2] = 2
         self.computer.run()
 
-        print("Part 1:", self.computer.ram[0])
+        return self.computer.ram[0]
 
     def part2(self):
         result = 0
@@ -27,10 +27,10 @@ class Y2019D2(object):
                     result = 100 * noun + verb
                     break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2019D2("2019/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
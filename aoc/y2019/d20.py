@@ -32,7 +32,7 @@ class Y2019D20(object):
 
         result = len(graph.flood_find(aa, zz)) - 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         base_graph = self.grid.to_graph('.')
@@ -60,7 +60,7 @@ class Y2019D20(object):
 
         result = len(graph.flood_find(aa, zz)) - 1
 
-        print("Part 2:", result)
+        return result
 
     def _get_portals(self) -> Dict[str, List[Coordinate]]:
         result: Dict[str, List[Coordinate]] = {}
@@ -106,8 +106,8 @@ class Y2019D20(object):
 
 if __name__ == '__main__':
     code = Y2019D20("2019/20.txt")
-    # code.part1()
+    # print("Part 1:", code.part1())
     start = time.time_ns()
-    code.part2()
+    print("Part 2:", code.part2())
     end = time.time_ns()
     print(end-start)
@@ -16,7 +16,7 @@ class Y2019D21(object):
             "WALK\n"
         )
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._run(
@@ -29,7 +29,7 @@ class Y2019D21(object):
             "RUN\n"
         )
 
-        print("Part 2:", result)
+        return result
 
     def _run(self, *program: str):
         self.computer.reset()
@@ -49,5 +49,5 @@ class Y2019D21(object):
 
 if __name__ == '__main__':
     code = Y2019D21("2019/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
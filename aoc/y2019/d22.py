@@ -53,7 +53,7 @@ class Y2019D22(object):
                 result = i
                 break
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         deck = Deck(119315717514047)
@@ -61,7 +61,7 @@ class Y2019D22(object):
         deck = deck.shuffle(101741582076661)
         result = deck[2020]
 
-        print("Part 2:", result)
+        return result
 
     def _shuffle(self, deck: Deck) -> Deck:
         for operation in self.operations:
@@ -78,5 +78,5 @@ class Y2019D22(object):
 
 if __name__ == '__main__':
     code = Y2019D22("2019/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
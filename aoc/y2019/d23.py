@@ -30,7 +30,7 @@ class Y2019D23(object):
             raise ValueError("Something screwed up")
         result = queue.get().y
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self._reset_network()
@@ -54,7 +54,7 @@ class Y2019D23(object):
 
             self.queues[0].put(last_packet)
 
-        print("Part 2:", result)
+        return result
 
     def _run_network(self):
         any_sent = True
@@ -91,5 +91,5 @@ class Y2019D23(object):
 
 if __name__ == '__main__':
     code = Y2019D23("2019/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
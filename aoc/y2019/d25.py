@@ -156,7 +156,7 @@ class Y2019D25(object):
         output = self.computer.output_str()
         result = re.search(r"(\d+)", output).group(1)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         pass
@@ -164,5 +164,5 @@ class Y2019D25(object):
 
 if __name__ == '__main__':
     code = Y2019D25("2019/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
@@ -29,7 +29,7 @@ class Y2019D3(object):
     def part1(self):
         result = min(self.intersections, key=lambda coord: coord.x + coord.y)
 
-        print("Part 1:", result.x + result.y)
+        return result.x + result.y
 
     def part2(self):
         result = len(self.line_a) + len(self.line_b)
@@ -43,10 +43,10 @@ class Y2019D3(object):
                 result = total
 
         # The +2 is because we don't include the index in either list
-        print("Part 2:", result + 2)
+        return result + 2
 
 
 if __name__ == '__main__':
     code = Y2019D3("2019/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -18,7 +18,7 @@ class Y2019D4(object):
             if valid:
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -30,7 +30,7 @@ class Y2019D4(object):
             if valid:
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _two_adjacent_digits(password):
@@ -71,5 +71,5 @@ class Y2019D4(object):
 
 if __name__ == '__main__':
     code = Y2019D4("2019/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
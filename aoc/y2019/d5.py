@@ -19,11 +19,11 @@ class Y2019D5(object):
         is_valid_output = len(list(filter(None, outputs))) == 1 and outputs[-1] > 0
 
         if is_valid_output:
-            print("Part 1:", outputs[-1])
-        else:
-            print("INVALID!")
-            for output in outputs:
-                print(output)
+            return outputs[-1]
+
+        print("INVALID!")
+        for output in outputs:
+            print(output)
 
     def part2(self):
         self.computer.reset()
@@ -31,10 +31,10 @@ class Y2019D5(object):
         self.computer.input(5)
         result = self.computer.output()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2019D5("2019/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
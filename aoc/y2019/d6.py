@@ -26,7 +26,7 @@ class Y2019D6(object):
         for obj in self.orbits.keys():
             result += len(self._orbit_chain(obj)) - 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         you = self._orbit_chain('YOU')
@@ -39,10 +39,10 @@ class Y2019D6(object):
 
         result = len(you[index:]) + len(san[index:]) - 2
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2019D6("2019/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
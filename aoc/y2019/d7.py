@@ -51,7 +51,7 @@ class Y2019D7(object):
 
             result = max(result, self.comp_e.output())
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -78,10 +78,10 @@ class Y2019D7(object):
 
             result = max(result, self.comp_e.output())
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2019D7("2019/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
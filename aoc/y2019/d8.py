@@ -55,7 +55,7 @@ class Y2019D8(object):
                 num_zeros = num_zeros_in_layer
                 result = layer.count('1') * layer.count('2')
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.layers[0]
@@ -69,5 +69,5 @@ class Y2019D8(object):
 
 if __name__ == '__main__':
     code = Y2019D8("2019/8.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
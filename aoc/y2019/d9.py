@@ -16,21 +16,21 @@ class Y2019D9(object):
             outputs.append(self.computer.output())
 
         if len(outputs) == 1:
-            print("Part 1:", outputs[-1])
-        else:
-            print("Something went wrong, invalid output:")
-            for output in outputs:
-                print(output)
+            return outputs[-1]
+
+        print("Something went wrong, invalid output:")
+        for output in outputs:
+            print(output)
 
     def part2(self):
         self.computer.reset()
         self.computer.run()
         self.computer.input(2)
 
-        print("Part 2:", self.computer.output())
+        return self.computer.output()
 
 
 if __name__ == '__main__':
     code = Y2019D9("2019/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -3,7 +3,7 @@ from aoc.util.inputs import Input
 
 class Y2020D1(object):
     def __init__(self, file_name):
-        self.input = [int(x) for x in Input(file_name).lines()]
+        self.input = Input(file_name).ints()
 
     def part1(self):
         result = 0
@@ -12,7 +12,7 @@ class Y2020D1(object):
                 if x+y == 2020:
                     result = x*y
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -25,10 +25,10 @@ class Y2020D1(object):
                     if x+y+z == 2020:
                         result = x*y*z
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D1("2020/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
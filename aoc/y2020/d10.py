@@ -3,7 +3,7 @@ from aoc.util.inputs import Input
 
 class Y2020D10(object):
     def __init__(self, file_name):
-        self.adapters = sorted([int(x) for x in Input(file_name).lines()])
+        self.adapters = sorted(Input(file_name).iter_ints())
         self.device_jolts = max(self.adapters) + 3
 
     def part1(self):
@@ -18,7 +18,7 @@ class Y2020D10(object):
 
         result = differences[1] * differences[3]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         # Use dynamic programming to figure out possibilities starting from outlet
@@ -38,10 +38,10 @@ class Y2020D10(object):
 
         result = possibility_map[self.device_jolts - 3]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D10("2020/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
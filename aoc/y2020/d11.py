@@ -23,7 +23,7 @@ class Y2020D11(object):
 
         result = len(last_state)
 
-        print("Part 1:", result)
+        return result
 
     @staticmethod
     def _mutate1(grid: Grid[str]) -> Grid[str]:
@@ -55,7 +55,7 @@ class Y2020D11(object):
 
         result = len(last_state)
 
-        print("Part 2:", result)
+        return result
 
     @classmethod
     def _mutate2(cls, grid: Grid[str]) -> Grid[str]:
@@ -95,5 +95,5 @@ class Y2020D11(object):
 
 if __name__ == '__main__':
     code = Y2020D11("2020/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
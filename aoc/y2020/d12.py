@@ -29,7 +29,7 @@ class Y2020D12(object):
 
         result = ship.coordinate.manhattan(Coordinate(0, 0))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         waypoint = Coordinate(10, 1)
@@ -57,10 +57,10 @@ class Y2020D12(object):
 
         result = ship.manhattan(Coordinate(0, 0))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D12("2020/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -26,7 +26,7 @@ class Y2020D13(object):
                     result = bus
 
         result = result * (test_time - self.earliest_time)
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         crt = ChineseRemainderTheorem()
@@ -38,10 +38,10 @@ class Y2020D13(object):
 
         result = crt.result
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D13("2020/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
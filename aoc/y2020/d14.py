@@ -28,7 +28,7 @@ class Y2020D14(object):
 
         result = sum(memory.values())
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         memory = {}
@@ -63,10 +63,10 @@ class Y2020D14(object):
 
         result = sum(memory.values())
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D14("2020/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
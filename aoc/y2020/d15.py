@@ -11,12 +11,12 @@ class Y2020D15(object):
     def part1(self):
         result = self.play_game(2020)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.play_game(30000000)
 
-        print("Part 2:", result)
+        return result
 
     def play_game(self, last_turn):
         game_last: Dict[int, int] = {}
@@ -45,5 +45,5 @@ class Y2020D15(object):
 
 if __name__ == '__main__':
     code = Y2020D15("2020/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
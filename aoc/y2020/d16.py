@@ -52,7 +52,7 @@ class Y2020D16(object):
                 if not ticket_field_valid:
                     result += ticket_field
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         valid_tickets = [x for x in self.nearby_tickets if self._is_valid_ticket(x)]
@@ -83,7 +83,7 @@ class Y2020D16(object):
         departure_values = [self.my_ticket[x] for x in departure_fields]
         result = reduce(lambda x, y: x*y, departure_values)
 
-        print("Part 2:", result)
+        return result
 
     def _is_valid_ticket(self, ticket):
         for ticket_field in ticket:
@@ -99,5 +99,5 @@ class Y2020D16(object):
 
 if __name__ == '__main__':
     code = Y2020D16("2020/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,6 +1,4 @@
-import itertools
-from functools import reduce
-
+from aoc.util.automaton import LifeRule, SparseAutomaton, moore
 from aoc.util.grid import Grid
 from aoc.util.inputs import Input
 
@@ -12,56 +10,26 @@ class Y2020D17(object):
     def part1(self):
         result = self._get_sixth_cycle_count(3)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_sixth_cycle_count(4)
 
-        print("Part 2:", result)
+        return result
 
     def _get_sixth_cycle_count(self, dimensions):
-        grid = set()
-
-        for coordinate, item in self.base_grid.items():
-            if item == '#':
-                grid.add((coordinate.x, coordinate.y) + tuple([0]*(dimensions-2)))
-
-        for i in range(6):
-            grid = self._mutate(grid)
-
-        return len(grid)
-
-    def _mutate(self, grid):
-        result = set()
+        active = [
+            (coordinate.x, coordinate.y) + tuple([0] * (dimensions - 2))
+            for coordinate in self.base_grid.find('#')
+        ]
 
-        min_list = reduce(lambda acc, element: [min(x, y) for x, y in zip(acc, element)], grid)
-        max_list = reduce(lambda acc, element: [max(x, y) for x, y in zip(acc, element)], grid)
+        cubes = SparseAutomaton(active, LifeRule(born={3}, survive={2, 3}), moore(dimensions))
+        cubes.run(6)
 
-        iterables = [list(range(x - 1, y + 2)) for x, y in zip(min_list, max_list)]
-
-        for coordinate in itertools.product(*iterables):
-            neighbor_count = self._neighbor_count(grid, coordinate)
-
-            if coordinate in grid and 2 <= neighbor_count <= 3:
-                result.add(coordinate)
-            if coordinate not in grid and neighbor_count == 3:
-                result.add(coordinate)
-
-        return result
-
-    @staticmethod
-    def _neighbor_count(grid, coordinate):
-        size = len(coordinate)
-        result = 0
-        for diff in itertools.product(range(-1, 2), repeat=size):
-            new_coordinate = tuple(sum(x) for x in zip(diff, coordinate))
-            if new_coordinate != coordinate and new_coordinate in grid:
-                result += 1
-
-        return result
+        return len(cubes)
 
 
 if __name__ == '__main__':
     code = Y2020D17("2020/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
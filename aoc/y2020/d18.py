@@ -31,12 +31,12 @@ class Y2020D18(object):
     def part1(self):
         result = sum([self._evaluate(x, PrecedenceRules.LEFT_TO_RIGHT) for x in self.expressions])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum([self._evaluate(x, PrecedenceRules.PLUS_IS_MIGHTY) for x in self.expressions])
 
-        print("Part 2:", result)
+        return result
 
     @classmethod
     def _get_subexpression(cls, expression, starting_index):
@@ -79,5 +79,5 @@ class Y2020D18(object):
 
 if __name__ == '__main__':
     code = Y2020D18("2020/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
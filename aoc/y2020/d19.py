@@ -43,16 +43,16 @@ class Y2020D19(object):
         regex = f'^{self._c2r(self.rules[0], 0, False)}$'
         result = sum(1 for message in self.messages if re.match(regex, message) is not None)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         regex = f'^{self._c2r(self.rules[0], 0, True)}$'
         result = sum(1 for message in self.messages if re.match(regex, message) is not None)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D19("2020/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -34,7 +34,7 @@ class Y2020D2(object):
             if password.min <= count <= password.max:
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -46,10 +46,10 @@ class Y2020D2(object):
             if (first_equals and not second_equals) or (second_equals and not first_equals):
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D2("2020/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
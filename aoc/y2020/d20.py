@@ -194,7 +194,7 @@ class Y2020D20(object):
             self.image_tiles[self.image_tiles.width-1, 0].num * \
             self.image_tiles[self.image_tiles.width-1, self.image_tiles.height-1].num
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -220,7 +220,7 @@ class Y2020D20(object):
                 result = len(non_monster_pixels)
                 break
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _find_sea_monster(all_pixels: Set[Coordinate]) -> Set[Coordinate]:
@@ -245,5 +245,5 @@ class Y2020D20(object):
 
 if __name__ == '__main__':
     code = Y2020D20("2020/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
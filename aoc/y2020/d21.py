@@ -51,7 +51,7 @@ class Y2020D21(object):
             ingredients = good_ingredients.intersection(food.ingredients)
             result += len(ingredients)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = []
@@ -60,10 +60,10 @@ class Y2020D21(object):
 
         result = ",".join(result)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D21("2020/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
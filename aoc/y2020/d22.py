@@ -83,7 +83,7 @@ class Y2020D22(object):
 
         result = self._deck_score(winning_deck)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         combat = RecursiveCombat()
@@ -91,7 +91,7 @@ class Y2020D22(object):
 
         result = self._deck_score(deck)
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _deck_score(winning_deck):
@@ -104,5 +104,5 @@ class Y2020D22(object):
 
 if __name__ == '__main__':
     code = Y2020D22("2020/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -85,17 +85,17 @@ class Y2020D23(object):
         one_location = node_str.find('1')
         result = node_str[one_location+1:] + node_str[:one_location]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         game = CrabGame(self.input, crab_is_an_asshole=True)
         game.play(10000000)
         result = game.next_two_cups_product
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D23("2020/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
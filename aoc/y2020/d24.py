@@ -1,5 +1,4 @@
-from typing import Set
-
+from aoc.util.automaton import HEX, LifeRule, SparseAutomaton
 from aoc.util.coordinate import Coordinate
 from aoc.util.grid import InfiniteGrid
 from aoc.util.inputs import Input
@@ -43,51 +42,23 @@ class Y2020D24(object):
     def part1(self):
         result = len(self.grid.find(True))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
-        grid = self.grid
-        for i in range(100):
-            grid = self._mutate(grid)
-            print(i, len(grid.find(True)))
-
-        result = len(grid.find(True))
-
-        print("Part 2:", result)
-
-    @staticmethod
-    def _neighbors(coordinate: Coordinate) -> Set[Coordinate]:
-        return {
-            coordinate.left().up(),
-            coordinate.up(),
-            coordinate.down(),
-            coordinate.right().down(),
-            coordinate.left(),
-            coordinate.right()
-        }
-
-    def _mutate(self, grid: InfiniteGrid[bool]) -> InfiniteGrid[bool]:
-        new_grid = grid.copy()
-
-        black_tiles = set(grid.find(True))
-        to_check_tiles = set(neighbor for coordinate in black_tiles for neighbor in self._neighbors(coordinate))
-        to_check_tiles = to_check_tiles.union(black_tiles)
-
-        for coordinate in to_check_tiles:
-            tile_is_black = bool(grid[coordinate])  # None or False are both False so cast to bool
-
-            black_neighbor_tiles = sum(1 for neighbor in self._neighbors(coordinate) if bool(grid[neighbor]))
-
-            if tile_is_black and (black_neighbor_tiles == 0 or black_neighbor_tiles > 2):
-                new_grid[coordinate] = False
-            elif not tile_is_black and black_neighbor_tiles == 2:
-                new_grid[coordinate] = True
+        # Same neighbors as left().up(), up(), down(), right().down(), left(), right() in the grid's X_RIGHT_Y_UP
+        tiles = SparseAutomaton(
+            ((coordinate.x, coordinate.y) for coordinate in self.grid.find(True)),
+            LifeRule(born={2}, survive={1, 2}),
+            HEX
+        )
+        tiles.run(100)
 
-        return new_grid
+        result = len(tiles)
 
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D24("2020/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
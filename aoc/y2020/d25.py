@@ -22,7 +22,7 @@ class Y2020D25(object):
             if value == self.pub2:
                 result = pow(self.pub1, loop_count, self.magic)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         pass
@@ -30,5 +30,5 @@ class Y2020D25(object):
 
 if __name__ == '__main__':
     code = Y2020D25("2020/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
@@ -9,7 +9,7 @@ class Y2020D3(object):
     def part1(self):
         result = self._get_slope_tree_count(3, 1)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_slope_tree_count(1, 1) * \
@@ -18,7 +18,7 @@ class Y2020D3(object):
             self._get_slope_tree_count(7, 1) * \
             self._get_slope_tree_count(1, 2)
 
-        print("Part 2:", result)
+        return result
 
     def _get_slope_tree_count(self, right, down):
         result = 0
@@ -31,5 +31,5 @@ class Y2020D3(object):
 
 if __name__ == '__main__':
     code = Y2020D3("2020/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
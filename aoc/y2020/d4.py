@@ -103,20 +103,20 @@ class Passport(object):
 
 class Y2020D4(object):
     def __init__(self, file_name):
-        self.passports = [Passport.from_string(" ".join(x)) for x in Input(file_name).grouped()]
+        self.passports = [Passport.from_string(" ".join(x)) for x in Input(file_name).iter_groups()]
 
     def part1(self):
         result = len([1 for passport in self.passports if passport.has_required_fields])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = len([1 for passport in self.passports if passport.is_valid])
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D4("2020/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -45,7 +45,7 @@ class Y2020D5(object):
     def part1(self):
         result = self.seats_ids[-1]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         min_id = self.seats_ids[0]
@@ -57,10 +57,10 @@ class Y2020D5(object):
             if i not in self.seats_ids:
                 result = i
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D5("2020/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
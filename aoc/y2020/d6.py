@@ -4,7 +4,7 @@ from aoc.util.inputs import Input
 
 class Y2020D6(object):
     def __init__(self, file_name):
-        self.groups = [[set(person) for person in group] for group in Input(file_name).grouped()]
+        self.groups = [[set(person) for person in group] for group in Input(file_name).iter_groups()]
 
     def part1(self):
         result = 0
@@ -16,7 +16,7 @@ class Y2020D6(object):
 
             result += len(all_set)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -28,10 +28,10 @@ class Y2020D6(object):
 
             result += len(all_set)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D6("2020/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
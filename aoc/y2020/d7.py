@@ -45,7 +45,7 @@ class Y2020D7(object):
                     bags_that_can_hold_shiny_gold.add(holding_bag.name)
                     something_changed = True
 
-        print("Part 1:", len(bags_that_can_hold_shiny_gold))
+        return len(bags_that_can_hold_shiny_gold)
 
     def part2(self):
         bag_dictionary = dict([(bag.name, bag) for bag in self.bags])
@@ -67,10 +67,10 @@ class Y2020D7(object):
 
         result = _get_bag_needed_count("shiny gold")
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D7("2020/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -70,7 +70,7 @@ class Y2020D8(object):
         program.run()
         result = program.accumulator
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -90,10 +90,10 @@ class Y2020D8(object):
                 result = program.accumulator
                 break
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D8("2020/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -3,7 +3,7 @@ from aoc.util.inputs import Input
 
 class Y2020D9(object):
     def __init__(self, file_name):
-        self.input = [int(x) for x in Input(file_name).lines()]
+        self.input = Input(file_name).ints()
         preamble = 25
 
         for i in range(preamble, len(self.input)):
@@ -18,7 +18,7 @@ class Y2020D9(object):
     def part1(self):
         result = self.bad_number
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         current_sum = self.input[0]
@@ -38,10 +38,10 @@ class Y2020D9(object):
 
         result = min(new_range) + max(new_range)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2020D9("2020/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2021D1(object):
                 result += 1
             current = item
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -34,10 +34,10 @@ class Y2021D1(object):
             if second > first:
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D1("2021/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -68,13 +68,13 @@ class Y2021D10(object):
         self._incomplete_points_total = sorted(incomplete_points_list)[len(incomplete_points_list) // 2]
 
     def part1(self):
-        print("Part 1:", self._bad_close_points_total)
+        return self._bad_close_points_total
 
     def part2(self):
-        print("Part 2:", self._incomplete_points_total)
+        return self._incomplete_points_total
 
 
 if __name__ == '__main__':
     code = Y2021D10("2021/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2021D11(object):
         for _ in range(100):
             result += self._step(grid)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = self._grid.copy()
@@ -28,7 +28,7 @@ class Y2021D11(object):
                 result = step
                 break
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _step(grid: InfiniteGrid[int]) -> int:
@@ -72,5 +72,5 @@ class Y2021D11(object):
 
 if __name__ == '__main__':
     code = Y2021D11("2021/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
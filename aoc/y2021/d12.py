@@ -59,7 +59,7 @@ class Y2021D12(object):
 
         result = len(good_paths)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         good_paths: Set[str] = set()
@@ -93,10 +93,10 @@ class Y2021D12(object):
 
         result = len(good_paths)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D12("2021/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -62,7 +62,7 @@ class Y2021D13(object):
     def part1(self):
         result = self._points_after_one
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         print("Part 2:")
@@ -72,5 +72,5 @@ class Y2021D13(object):
 
 if __name__ == '__main__':
     code = Y2021D13("2021/13.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
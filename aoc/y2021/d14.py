@@ -58,13 +58,13 @@ class Y2021D14(object):
         self._poly = Polymerization(start[0], pairs_map)
 
     def part1(self):
-        print("Part 1:", self._poly.find(10))
+        return self._poly.find(10)
 
     def part2(self):
-        print("Part 2:", self._poly.find(40))
+        return self._poly.find(40)
 
 
 if __name__ == '__main__':
     code = Y2021D14("2021/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,9 +1,8 @@
-from typing import Dict, Optional
-
 from aoc.util.coordinate import Coordinate, CoordinateSystem
 from aoc.util.grid import InfiniteGrid
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.pathfinding import shortest_path
+from aoc.util.queue import BucketQueue
 
 
 class Y2021D15(object):
@@ -23,10 +22,9 @@ class Y2021D15(object):
         )
 
     def part1(self):
-        path = self.find_path(self._grid, self.start, self.end)
-        result = sum(self._grid[x] for x in path if x != self.start)
+        result = self.lowest_risk(self._grid, self.start, self.end)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         new_grid: InfiniteGrid[int] = self._grid.copy()
@@ -60,53 +58,21 @@ class Y2021D15(object):
             y=new_grid.max_y,
             system=CoordinateSystem.X_RIGHT_Y_DOWN
         )
-        path = self.find_path(new_grid, self.start, new_end)
-        result = sum(new_grid[x] for x in path if x != self.start)
-
-        print("Part 2:", result)
-
-    def find_path(self, grid: InfiniteGrid[int],
-                  start: Coordinate,
-                  end: Coordinate):
-        frontier: PriorityQueue[Coordinate] = PriorityQueue[Coordinate]()
-        frontier.push(start, 0)
-        came_from: Dict[Coordinate, Optional[Coordinate]] = {}
-        cost_so_far: Dict[Coordinate, int] = {}
-
-        came_from[start] = None
-        cost_so_far[start] = 0
-
-        while frontier:
-            current: Coordinate = frontier.pop()
-
-            if current == end:
-                source = end
-                result = []
+        result = self.lowest_risk(new_grid, self.start, new_end)
 
-                while source is not None:
-                    result.insert(0, source)
-                    source = came_from[source]
-
-                return result
+        return result
 
+    @staticmethod
+    def lowest_risk(grid: InfiniteGrid[int], start: Coordinate, end: Coordinate) -> int:
+        def neighbors(current: Coordinate):
             for neighbor in current.neighbors():
-                if neighbor not in grid:
-                    continue
-
-                # if grid[neighbor] not in walkable:
-                #     continue
-
-                new_cost = cost_so_far[current] + grid[neighbor]
-
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost
+                if neighbor in grid:
+                    yield neighbor, grid[neighbor]
 
-                    frontier.push(neighbor, priority)
-                    came_from[neighbor] = current
+        return shortest_path(start, end, neighbors, queue=BucketQueue).cost
 
 
 if __name__ == '__main__':
     code = Y2021D15("2021/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -138,15 +138,15 @@ class Y2021D16(object):
     def part1(self):
         result = self._packet.sum_version
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._packet.value
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D16("2021/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
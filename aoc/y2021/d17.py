@@ -102,15 +102,15 @@ class Y2021D17(object):
     def part1(self):
         result = self.max_y
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.hitting_velocity_count
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D17("2021/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -208,7 +208,7 @@ class Y2021D18(object):
 
         result = number.magnitude
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -222,10 +222,10 @@ class Y2021D18(object):
             # print(left, right, s, magnitude)
             result = max(result, magnitude)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D18("2021/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -97,7 +97,7 @@ class Y2021D19(object):
 
         result = len(all_beacons)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -108,7 +108,7 @@ class Y2021D19(object):
 
             result = max(result, left.manhattan(right))
 
-        print("Part 2:", result)
+        return result
 
     def _reorient(self,
                   new_scanner_number: int,
@@ -247,5 +247,5 @@ class Y2021D19(object):
 
 if __name__ == '__main__':
     code = Y2021D19("2021/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -25,7 +25,7 @@ class Y2021D2(object):
 
         result = depth * horizontal
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         depth = horizontal = aim = 0
@@ -41,10 +41,10 @@ class Y2021D2(object):
                 aim -= int(match.group(1))
         result = depth * horizontal
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D2("2021/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -14,14 +14,14 @@ class Y2021D20(object):
 
         result = len(grid.find('#'))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = self._enhance_times(50)
 
         result = len(grid.find('#'))
 
-        print("Part 2:", result)
+        return result
 
     def _enhance_times(self, times: int) -> InfiniteGrid[str]:
         grid = self._grid.copy()
@@ -75,5 +75,5 @@ class Y2021D20(object):
 
 if __name__ == '__main__':
     code = Y2021D20("2021/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
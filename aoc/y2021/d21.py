@@ -74,7 +74,7 @@ class Y2021D21(object):
 
         result = min(player_scores.values()) * dice.times_rolled
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         player_1_total_wins = 0
@@ -129,10 +129,10 @@ class Y2021D21(object):
 
         result = max(player_1_total_wins, player_2_total_wins)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D21("2021/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
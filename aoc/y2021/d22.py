@@ -1,4 +1,3 @@
-import re
 from collections import Counter
 from dataclasses import dataclass
 from typing import Optional, Dict
@@ -36,23 +35,13 @@ class Cube(object):
 
 
 class Y2021D22(object):
-    command_regex = re.compile(r'(on|off) x=(-?\d+)..(-?\d+),y=(-?\d+)..(-?\d+),z=(-?\d+)..(-?\d+)')
-
     def __init__(self, file_name):
-        lines = Input(file_name).lines()
+        data = Input(file_name)
         self._cubes: Dict[Cube, bool] = {}  # Assumes ordered dictionary which is true as of python 3.7
 
-        for line in lines:
-            match = self.command_regex.match(line)
-            turn_on: bool = match.group(1) == "on"
-            cube = Cube(
-                min_x=int(match.group(2)),
-                max_x=int(match.group(3)),
-                min_y=int(match.group(4)),
-                max_y=int(match.group(5)),
-                min_z=int(match.group(6)),
-                max_z=int(match.group(7))
-            )
+        for line, (min_x, max_x, min_y, max_y, min_z, max_z) in zip(data.lines(), data.int_rows()):
+            turn_on: bool = line.startswith("on")
+            cube = Cube(min_x=min_x, max_x=max_x, min_y=min_y, max_y=max_y, min_z=min_z, max_z=max_z)
             self._cubes[cube] = turn_on
 
     def part1(self):
@@ -61,12 +50,12 @@ class Y2021D22(object):
         cubes: Dict[Cube, bool] = dict((key, value) for key, value in cubes.items() if key is not None)
         result = self._cube_count(cubes)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._cube_count(self._cubes)
 
-        print("Part 2:", result)
+        return result
 
     # Based on https://en.wikipedia.org/wiki/Inclusion–exclusion_principle
     @staticmethod
@@ -93,5 +82,5 @@ class Y2021D22(object):
 
 if __name__ == '__main__':
     code = Y2021D22("2021/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -5,7 +5,7 @@ from aoc.util.coordinate import Coordinate, CoordinateSystem
 from aoc.util.graph import Edge, Graph
 from aoc.util.grid import Grid
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 
 
 # State assumes the hallway and where the burrows are the same everywhere
@@ -144,19 +144,19 @@ class Y2021D23(object):
     def part1(self):
         result = self._find_min_cost(self._starting_state)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._find_min_cost(self._starting_state.expand())
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _find_min_cost(starting_state):
         result = 0
 
         seen: Set[State] = {starting_state}
-        queue: PriorityQueue[State] = PriorityQueue[State]()
+        queue: TuplePriorityQueue[State] = TuplePriorityQueue[State]()
         queue.push(starting_state, starting_state.cost)
 
         while not queue.empty:
@@ -182,5 +182,5 @@ class Y2021D23(object):
 
 if __name__ == '__main__':
     code = Y2021D23("2021/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,8 +1,6 @@
 import re
 from typing import Dict
 
-from z3 import Int, IntVal, ArithRef, If, Optimize, And
-
 from aoc.util.inputs import Input
 
 
@@ -15,6 +13,8 @@ class Y2021D24(object):
     _re_eql = re.compile(r'eql ([wxyz]) ([wxyz]|-?\d+)')
 
     def __init__(self, file_name):
+        from z3 import Int, IntVal, Optimize
+
         self.solver = Optimize()
 
         inputs = [Int(f'model_{i}') for i in range(14)]
@@ -47,7 +47,7 @@ class Y2021D24(object):
 
         self.solver.pop()
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         self.solver.push()
@@ -58,10 +58,10 @@ class Y2021D24(object):
 
         self.solver.pop()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D24("2021/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
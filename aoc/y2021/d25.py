@@ -29,7 +29,7 @@ class Y2021D25(object):
             if not changed_east and not changed_south:
                 break
 
-        print("Part 1:", result)
+        return result
 
     @staticmethod
     def _mutate(grid: Grid[str], moving: Moving) -> (bool, Grid[str]):
@@ -57,4 +57,4 @@ class Y2021D25(object):
 
 if __name__ == '__main__':
     code = Y2021D25("2021/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
@@ -21,7 +21,7 @@ class Y2021D3(object):
 
         result = gamma * epsilon
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         oxygen_generator = self._get_filtered_value(self._input, lambda n0, n1: "1" if n1 >= n0 else "0")
@@ -29,7 +29,7 @@ class Y2021D3(object):
 
         result = int(oxygen_generator, 2) * int(co2_scrubbing, 2)
 
-        print("Part 2:", result)
+        return result
 
     def _get_filtered_value(self, _in: List[str], func: Callable[[int, int], str]) -> str:
         num_zeros = len([x for x in _in if x[0] == "0"])
@@ -45,5 +45,5 @@ class Y2021D3(object):
 
 if __name__ == '__main__':
     code = Y2021D3("2021/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -73,7 +73,7 @@ class Y2021D4(object):
             if result != 0:
                 break
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         for board in self.boards:
@@ -96,10 +96,10 @@ class Y2021D4(object):
 
         result = sum(last_winning_board.unmarked()) * last_winning_choice
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D4("2021/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
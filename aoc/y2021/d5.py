@@ -61,7 +61,7 @@ class Y2021D5(object):
 
         result = len(grid.find(lambda _: _ > 1))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = InfiniteGrid[int]()
@@ -101,10 +101,10 @@ class Y2021D5(object):
 
         result = len(grid.find(lambda _: _ > 1))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D5("2021/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
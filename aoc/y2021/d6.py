@@ -11,12 +11,12 @@ class Y2021D6(object):
     def part1(self):
         result = self._count_fish_after_day(80)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._count_fish_after_day(256)
 
-        print("Part 2:", result)
+        return result
 
     def _count_fish_after_day(self, end_day: int) -> int:
         new_fish_after_day: Dict[int, int] = {}
@@ -39,5 +39,5 @@ class Y2021D6(object):
 
 if __name__ == '__main__':
     code = Y2021D6("2021/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,12 +1,12 @@
 from typing import List
 
-from z3 import Int, Optimize, If
-
 from aoc.util.inputs import Input
 from aoc.util.search import MinSearch
 
 
 def z3_abs(num):
+    from z3 import If
+
     return If(num >= 0, num, -num)
 
 
@@ -18,16 +18,16 @@ class Y2021D7(object):
         search = MinSearch(lambda i: sum([abs(x - i) for x in self._crabs]))
         result = search.test(search.min(0))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         search = MinSearch(lambda i: sum([(abs(x - i) * (abs(x - i) + 1)) // 2 for x in self._crabs]))
         result = search.test(search.min(0))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D7("2021/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
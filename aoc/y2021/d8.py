@@ -2,8 +2,6 @@ import itertools
 from dataclasses import dataclass
 from typing import Dict, List, Set, Optional
 
-from z3 import Solver, Int, Or, And, Distinct
-
 from aoc.util.inputs import Input
 
 
@@ -62,7 +60,7 @@ class Y2021D8(object):
                 if len(element) in [2, 4, 3, 7]:
                     result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -74,7 +72,7 @@ class Y2021D8(object):
             tail: str = tail.strip()
             result += segment.parse(tail)
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _get_segment(line: str) -> Segment:
@@ -151,5 +149,5 @@ class Y2021D8(object):
 
 if __name__ == '__main__':
     code = Y2021D8("2021/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
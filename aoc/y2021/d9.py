@@ -30,7 +30,7 @@ class Y2021D9(object):
         for coordinate in self._low_points:
             result += self._grid[coordinate] + 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         basin_sizes = []
@@ -43,10 +43,10 @@ class Y2021D9(object):
 
         result = math.prod(basin_sizes)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2021D9("2021/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
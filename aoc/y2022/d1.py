@@ -9,16 +9,16 @@ class Y2022D1(object):
     def part1(self):
         result = max(self._snacks_per)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         s = sorted(self._snacks_per)
         result = sum(s[-3:])
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D1("2022/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -49,7 +49,7 @@ class Y2022D10(object):
     def part1(self):
         result = self.computer.signal_sum
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         print("Part 2:")
@@ -58,5 +58,5 @@ class Y2022D10(object):
 
 if __name__ == '__main__':
     code = Y2022D10("2022/10.txt")
-    code.part1()
+    print("Part 1:", code.part1())
     code.part2()
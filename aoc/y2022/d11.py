@@ -107,15 +107,15 @@ class Y2022D11(object):
     def part1(self):
         result = self.dance_monkey_dance(rounds=20, divide_by_3=True)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.dance_monkey_dance(rounds=10_000, divide_by_3=False)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D11("2022/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
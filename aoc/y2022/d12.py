@@ -31,7 +31,7 @@ class Y2022D12(object):
         path = self.graph.find_path(self.start, self.end, self.ch)
         result = len(path) - 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 1e24  # Big number is big
@@ -42,10 +42,10 @@ class Y2022D12(object):
                 continue
             result = min(result, len(path) - 1)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D12("2022/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
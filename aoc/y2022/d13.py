@@ -59,7 +59,7 @@ class Y2022D14(object):
             if o_result == OrderResult.ORDERED:
                 result += index + 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         divider_2 = [[2]]
@@ -84,10 +84,10 @@ class Y2022D14(object):
         index_6 = all_packets.index(divider_6) + 1
         result = index_2 * index_6
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D14("2022/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -73,7 +73,7 @@ class Y2022D14(object):
         self._fill_with_sand(grid)
         result = len(grid.find(self.sand))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid = self.base_grid.copy()
@@ -87,10 +87,10 @@ class Y2022D14(object):
 
         result = len(grid.find(self.sand))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D14("2022/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
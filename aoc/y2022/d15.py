@@ -1,30 +1,16 @@
-import re
-
-from z3 import Solver, Ints, Abs
-
 from aoc.util.inputs import Input
 
 
 class Y2022D15(object):
     def __init__(self, file_name):
-        lines = Input(file_name).lines()
         self.mapping = {}
 
-        line_regex = re.compile(r'Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)')
-
         self.min_x = 1e24
         self.max_x = -1e24
         self.min_y = 1e24
         self.max_y = -1e24
 
-        for line in lines:
-            match = line_regex.match(line)
-            s_x, s_y, b_x, b_y = match.groups()
-            s_x = int(s_x)
-            s_y = int(s_y)
-            b_x = int(b_x)
-            b_y = int(b_y)
-
+        for s_x, s_y, b_x, b_y in Input(file_name).int_rows():
             self.mapping[s_x, s_y] = (b_x, b_y)
 
     def part1(self):
@@ -42,9 +28,11 @@ class Y2022D15(object):
                 invalid_row.add(sensor[0] + diff_x)
         result = len(invalid_row)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
+        from z3 import Solver, Ints, Abs
+
         solver = Solver()
 
         distress_x, distress_y = Ints('distress_x distress_y')
@@ -75,10 +63,10 @@ class Y2022D15(object):
 
         result = model[distress_x].as_long() * 4000000 + model[distress_y].as_long()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D15("2022/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -116,7 +116,7 @@ class Y2022D16(object):
         states = self._get_all_states(30)
         result = max(s.pressure_released for s in states)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         states: set[State] = self._get_all_states(26)
@@ -138,10 +138,10 @@ class Y2022D16(object):
             total_pressure_released = opened_to_max_value[s_human] + opened_to_max_value[s_elephant]
             result = max(result, total_pressure_released)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D16("2022/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
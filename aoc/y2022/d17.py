@@ -1,7 +1,5 @@
 import string
 
-from tqdm.auto import tqdm
-
 from aoc.util.coordinate import Coordinate, CoordinateSystem
 from aoc.util.cycle_finder import CycleFinder
 from aoc.util.grid import InfiniteGrid
@@ -155,15 +153,15 @@ class Y2022D17(object):
         # TODO This code does not seem to work for the example in part 1. I get 3069 instead of 3068.
         result = self._drop_rocks(2022)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._drop_rocks(1000000000000)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D17("2022/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -144,7 +144,7 @@ class Y2022D18(object):
     def part1(self):
         result = self._get_exposed_sides(self.cubes)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
 
@@ -157,10 +157,10 @@ class Y2022D18(object):
 
         result = self._get_exposed_sides(cubes_under_test)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D18("2022/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
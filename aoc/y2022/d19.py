@@ -4,8 +4,6 @@ from dataclasses import dataclass, field
 from queue import Queue
 from typing import Dict, Set
 
-from tqdm.auto import tqdm
-
 from aoc.util.inputs import Input
 
 
@@ -213,7 +211,7 @@ class Y2022D19(object):
             # print(blueprint_id, best_geodes)
             result += blueprint_id * best_geodes
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 1
@@ -222,10 +220,10 @@ class Y2022D19(object):
             # print(blueprint_id, best_geodes)
             result *= best_geodes
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D19("2022/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -48,7 +48,7 @@ class Y2022D2(object):
             their_play, my_play = game.split(' ')
             result += self._score_dictionary[their_play][my_play]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -57,10 +57,10 @@ class Y2022D2(object):
             their_play, my_play = game.split(' ')
             result += self._end_dictionary[their_play][my_play]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D2("2022/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
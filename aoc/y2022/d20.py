@@ -47,7 +47,7 @@ class Y2022D20(object):
 
         result = a + b + c
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         circular_buffer_zero = self._get_zero()
@@ -63,10 +63,10 @@ class Y2022D20(object):
 
         result = a + b + c
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D20("2022/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,12 +1,15 @@
+from __future__ import annotations
+
 import re
 from dataclasses import dataclass, field
 from queue import Queue
-from typing import Optional
-
-from z3 import Solver, Int, ArithRef, Const, IntVal
+from typing import Optional, TYPE_CHECKING
 
 from aoc.util.inputs import Input
 
+if TYPE_CHECKING:
+    from z3 import ArithRef
+
 
 @dataclass
 class Monkey:
@@ -47,6 +50,8 @@ class Monkey:
         return has_name
 
     def int_ref(self) -> ArithRef:
+        from z3 import Int, IntVal
+
         if self.name == 'humn':
             return Int('humn')
 
@@ -104,12 +109,14 @@ class Y2022D21(object):
     def part1(self):
         result = self.root.value
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         left = self.root.left
         right = self.root.right
 
+        from z3 import Solver
+
         solver = Solver()
 
         solver.add(left.int_ref() == right.int_ref())
@@ -118,10 +125,10 @@ class Y2022D21(object):
         # Get the humn variable declaration and cast it to a long. I don't know how to do that with the string humn.
         result = model[model.decls()[0]].as_long()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D21("2022/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
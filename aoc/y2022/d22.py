@@ -429,16 +429,16 @@ class Y2022D22(object):
         teleporter = SimpleTeleporter(self.grid)
         result = teleporter.run_instructions(self.instructions)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         teleporter = CubeTeleporter(self.grid)
         result = teleporter.run_instructions(self.instructions)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D22("2022/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -94,15 +94,15 @@ class Y2022D23(object):
     def part1(self):
         result = self.round_10_empty_ground
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.first_round_no_elf_movement
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D23("2022/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -171,16 +171,16 @@ class Y2022D24(object):
     def part1(self):
         result = self.first_pass_through
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         # Can't believe an elf left their snacks. I bet it's that massive elf nerd Geoffrey
         result = self.total_journey
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D24("2022/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
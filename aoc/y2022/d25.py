@@ -78,15 +78,15 @@ class Y2022D25(object):
     def part1(self):
         result = to_snafu(self.sum)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D25("2022/25.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -24,7 +24,7 @@ class Y2022D3(object):
             common = list(set(first).intersection(set(second)))[0]
             result += self._get_score(common)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -34,10 +34,10 @@ class Y2022D3(object):
             common = list(set(a).intersection(set(b)).intersection(set(c)))[0]
             result += self._get_score(common)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D3("2022/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -43,15 +43,15 @@ class Y2022D4(object):
     def part1(self):
         result = sum([1 for x in self._pairs if x.fully_contains])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum([1 for x in self._pairs if x.overlaps])
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D4("2022/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
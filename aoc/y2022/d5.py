@@ -61,7 +61,7 @@ class Y2022D5(object):
 
         result = ''.join([stack[-1] for stack in my_stacks.values()])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         my_stacks = self._copy()
@@ -75,10 +75,10 @@ class Y2022D5(object):
 
         result = ''.join([stack[-1] for stack in my_stacks.values()])
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D5("2022/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
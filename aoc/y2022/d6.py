@@ -13,15 +13,15 @@ class Y2022D6(object):
     def part1(self):
         result = self._get_start_of(4)  # Packet
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_start_of(14)  # Message
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D6("2022/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -86,7 +86,7 @@ class Y2022D7(object):
             if d.size <= limit:
                 result += d.size
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
 
@@ -111,10 +111,10 @@ class Y2022D7(object):
             if d.size < result:
                 result = d.size
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D7("2022/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -54,7 +54,7 @@ class Y2022D8(object):
                         invisible_trees.remove(coordinate)
         result = len(self.tree_grid.keys()) - len(invisible_trees)
 
-        print("Part 1:", result)
+        return result
 
     def _dist_count(self, c: Coordinate, func: Callable[[Coordinate], Coordinate]) -> int:
         initial_value = self.tree_grid[c]
@@ -84,10 +84,10 @@ class Y2022D8(object):
             if scenic_score > result:
                 result = scenic_score
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2022D8("2022/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
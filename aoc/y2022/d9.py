@@ -10,12 +10,12 @@ class Y2022D9(object):
     def part1(self):
         result = self.get_tail_coverage(2)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.get_tail_coverage(10)
 
-        print("Part 2:", result)
+        return result
 
     def get_tail_coverage(self, rope_length: int) -> int:
         move_grid = InfiniteGrid[str]()
@@ -84,5 +84,5 @@ class Y2022D9(object):
 
 if __name__ == '__main__':
     code = Y2022D9("2022/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
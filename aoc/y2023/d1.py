@@ -12,7 +12,7 @@ class Y2023D1(object):
             digits = list(self._get_digits(line))
             result += int(digits[0]) * 10 + int(digits[-1])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -22,7 +22,7 @@ class Y2023D1(object):
             addition = int(digits[0]) * 10 + int(digits[-1])
             result += addition
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _get_digits(line, include_words=False):
@@ -49,5 +49,5 @@ class Y2023D1(object):
 
 if __name__ == '__main__':
     code = Y2023D1("2023/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
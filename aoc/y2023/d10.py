@@ -173,15 +173,15 @@ class Y2023D10(object):
     def part1(self):
         result = len(self._loop_coordinates) // 2
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._enclosed
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D10("2023/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
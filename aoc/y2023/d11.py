@@ -11,12 +11,12 @@ class Y2023D1(object):
     def part1(self):
         result = self._get_expansion_at_scale(2)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_expansion_at_scale(1000000)
 
-        print("Part 2:", result)
+        return result
 
     def _get_expansion_at_scale(self, scale: int) -> int:
 
@@ -62,5 +62,5 @@ class Y2023D1(object):
 
 if __name__ == '__main__':
     code = Y2023D1("2023/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -144,7 +144,7 @@ class Y2023D12(object):
         for row in self.rows:
             result += self._find_valid_combos(row)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -152,7 +152,7 @@ class Y2023D12(object):
         for row in self.rows:
             result += self._find_valid_combos(row.unfolded())
 
-        print("Part 2:", result)
+        return result
 
     def _find_valid_combos(self, row: SpringRow) -> int:
         if row in self._cache:
@@ -176,5 +176,5 @@ class Y2023D12(object):
 
 if __name__ == '__main__':
     code = Y2023D12("2023/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -33,7 +33,7 @@ class Y2023D13(object):
         for grid in self.grids:
             result += self._get_reflection_value(grid)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -41,7 +41,7 @@ class Y2023D13(object):
         for grid in self.grids:
             result += self._get_reflection_value(grid, with_smudge=True)
 
-        print("Part 2:", result)
+        return result
 
     def _get_reflection_value(self, grid: Grid[str], with_smudge=False) -> int:
         results = []
@@ -100,5 +100,5 @@ class Y2023D13(object):
 
 if __name__ == '__main__':
     code = Y2023D13("2023/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
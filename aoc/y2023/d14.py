@@ -16,7 +16,7 @@ class Y2023D14(object):
 
         result = self._calculate_load(round_rocks)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         round_rocks = set(self.round_rocks)
@@ -44,7 +44,7 @@ class Y2023D14(object):
 
             index += 1
 
-        print("Part 2:", result)
+        return result
 
     def _roll(self,
               round_rock_set: set[Coordinate],
@@ -98,5 +98,5 @@ class Y2023D14(object):
 
 if __name__ == '__main__':
     code = Y2023D14("2023/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
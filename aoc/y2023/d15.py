@@ -57,7 +57,7 @@ class Y2023D15(object):
     def part1(self):
         result = sum(i.value_hash for i in self._initialization_sequence)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -101,10 +101,10 @@ class Y2023D15(object):
         for box, lenses in boxes.items():
             for slot, init in lenses.items():
                 result += (box + 1) * slot * init.focal_length
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D15("2023/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -16,7 +16,7 @@ class Y2023D16(object):
 
         result = self._get_energized(initial)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -41,7 +41,7 @@ class Y2023D16(object):
                 coordinate=Coordinate(col, self.grid.height - 1, CoordinateSystem.X_RIGHT_Y_DOWN)
             )))
 
-        print("Part 2:", result)
+        return result
 
     def _get_energized(self, initial: Turtle):
         grid = self.grid.copy()
@@ -88,5 +88,5 @@ class Y2023D16(object):
 
 if __name__ == '__main__':
     code = Y2023D16("2023/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 
 from aoc.util.coordinate import Coordinate, TurtleDirection, CoordinateSystem
-from aoc.util.graph import Graph, Heuristic
+from aoc.util.graph import Graph
 from aoc.util.inputs import Input
+from aoc.util.queue import BucketQueue
 
 
 @dataclass(frozen=True)
@@ -11,11 +12,6 @@ class CoordinatedDirection:
     direction: TurtleDirection
 
 
-class CoordinatedDirectionHeuristic(Heuristic[CoordinatedDirection]):
-    def __call__(self, start: CoordinatedDirection, end: CoordinatedDirection) -> int:
-        return end.coordinate.manhattan(start.coordinate)
-
-
 class Y2023D17(object):
     def __init__(self, file_name):
         self.grid = Input(file_name).grid()
@@ -23,12 +19,12 @@ class Y2023D17(object):
     def part1(self):
         result = self._get_path_cost(1, 3)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_path_cost(4, 10)
 
-        print("Part 2:", result)
+        return result
 
     def _get_path_cost(self, min_step: int, max_step: int) -> int:
         graph: Graph[CoordinatedDirection] = Graph(directional=True)
@@ -132,12 +128,11 @@ class Y2023D17(object):
         graph.add(start=start, end=start_right, weight=0)
         graph.add(start=start, end=start_down, weight=0)
 
-        heuristic = CoordinatedDirectionHeuristic()
-        path = graph.find_path(start, fake_end, heuristic)
-        return graph.get_weight(path)
+        # Plain Dijkstra, the zero weight edges into fake_end would let a Manhattan distance heuristic drop priorities
+        return graph.shortest_path(start, fake_end, queue=BucketQueue).cost
 
 
 if __name__ == '__main__':
     code = Y2023D17("2023/17.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
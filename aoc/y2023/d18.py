@@ -49,13 +49,13 @@ class Y2023D18(object):
     def part1(self):
         result = self._get_size_of_dig_plan(self.dig_plan)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         dig_plan = [dp.hex_plan for dp in self.dig_plan]
         result = self._get_size_of_dig_plan(dig_plan)
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _get_size_of_dig_plan(dig_plan: list[DigPlan]) -> int:
@@ -89,5 +89,5 @@ class Y2023D18(object):
 
 if __name__ == '__main__':
     code = Y2023D18("2023/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -251,7 +251,7 @@ class Y2023D19(object):
             if workflow_name == 'A':
                 result += part.x + part.m + part.a + part.s
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -269,10 +269,10 @@ class Y2023D19(object):
                     continue
                 q.put(new_pr)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D19("2023/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
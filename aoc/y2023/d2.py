@@ -64,7 +64,7 @@ class Y2023D2(object):
             if not invalid_game:
                 result += game.game_number
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -75,10 +75,10 @@ class Y2023D2(object):
             min_required_blue = max(x.blue for x in game.draws)
             result += min_required_red * min_required_green * min_required_blue
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D2("2023/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -145,7 +145,7 @@ class Y2023D20(object):
     def part1(self):
         result = self.machine.press_button(1000)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -153,10 +153,10 @@ class Y2023D20(object):
             self.machine.press_button_once()
             result = self.machine.get_rx_timing()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D20("2023/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
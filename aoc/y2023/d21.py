@@ -18,7 +18,7 @@ class Y2023D21(object):
         self.step(64)
         result = len(self._steps[64])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         # 26501365 is 65 + 131 * 202300 and 131 is our grid size
@@ -46,8 +46,6 @@ class Y2023D21(object):
         x = 202300
         result = a * pow(x, 2) + b * x + c
 
-        print("Part 2:", result)
-
         """
         Here's the math I don't want to think about again:
         Start with:
@@ -80,6 +78,8 @@ class Y2023D21(object):
         c = y0 - a * x0^2 + b * x0
         """
 
+        return result
+
     def step(self, until: Optional[int] = None):
         last_step = max(self._steps.keys())
         if until is not None and last_step >= until:
@@ -110,5 +110,5 @@ class Y2023D21(object):
 
 if __name__ == '__main__':
     code = Y2023D21("2023/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
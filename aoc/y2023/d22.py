@@ -7,7 +7,7 @@ from queue import Queue
 from typing import Self
 
 from aoc.util.inputs import Input
-from aoc.util.queue import PriorityQueue
+from aoc.util.queue import TuplePriorityQueue
 
 
 @dataclass(frozen=True)
@@ -70,7 +70,7 @@ class Y2023D22(object):
     def __init__(self, file_name):
         lines = Input(file_name).lines()
 
-        q: PriorityQueue[Block] = PriorityQueue()
+        q: TuplePriorityQueue[Block] = TuplePriorityQueue()
 
         line_re = re.compile(r'(\d+),(\d+),(\d+)~(\d+),(\d+),(\d+)')
         for line in lines:
@@ -118,7 +118,7 @@ class Y2023D22(object):
     def part1(self):
         result = len(self.blocks) - len(self.cannot_disintegrate)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -135,10 +135,10 @@ class Y2023D22(object):
 
             result += len(would_fall) - 1  # - 1 because we counted block in the beginning to make the algorithm work
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D22("2023/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
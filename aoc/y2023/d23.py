@@ -5,62 +5,69 @@ from aoc.util.inputs import Input
 
 class Y2023D23(object):
     def __init__(self, file_name):
-        grid = Input(file_name).grid()
+        # Building and compressing both graphs is most of the work, so it's cached between runs
+        self.icy_hike, self.horrible_hike, self.start, self.end = Input(file_name).parsed(Y2023D23._parse)
+
+    @staticmethod
+    def _parse(data: Input):
+        grid = data.grid()
 
         walkable = ['.', '>', '<', '^', 'v']
-        self.icy_hike: Graph[Coordinate] = grid.to_graph(*walkable, directional=True)
-        self.horrible_hike: Graph[Coordinate] = grid.to_graph(*walkable)
+        icy_hike: Graph[Coordinate] = grid.to_graph(*walkable, directional=True)
+        horrible_hike: Graph[Coordinate] = grid.to_graph(*walkable)
 
         # We can only go downhill, so we rip up any uphill paths
         for coordinate in grid.find('>'):
             before = coordinate.left()
             after = coordinate.right()
-            self.icy_hike.remove_node_link(after, coordinate)
-            self.icy_hike.remove_node_link(coordinate, before)
+            icy_hike.remove_node_link(after, coordinate)
+            icy_hike.remove_node_link(coordinate, before)
 
         for coordinate in grid.find('<'):
             before = coordinate.right()
             after = coordinate.left()
-            self.icy_hike.remove_node_link(after, coordinate)
-            self.icy_hike.remove_node_link(coordinate, before)
+            icy_hike.remove_node_link(after, coordinate)
+            icy_hike.remove_node_link(coordinate, before)
 
         for coordinate in grid.find('^'):
             before = coordinate.down()
             after = coordinate.up()
-            self.icy_hike.remove_node_link(after, coordinate)
-            self.icy_hike.remove_node_link(coordinate, before)
+            icy_hike.remove_node_link(after, coordinate)
+            icy_hike.remove_node_link(coordinate, before)
 
         for coordinate in grid.find('v'):
             before = coordinate.up()
             after = coordinate.down()
-            self.icy_hike.remove_node_link(after, coordinate)
-            self.icy_hike.remove_node_link(coordinate, before)
+            icy_hike.remove_node_link(after, coordinate)
+            icy_hike.remove_node_link(coordinate, before)
 
         all_valid_walkable = grid.find(lambda i: i in walkable)
-        self.start = [c for c in all_valid_walkable if c.y == 0][0]
-        self.end = [c for c in all_valid_walkable if c.y == grid.height - 1][0]
+        start = [c for c in all_valid_walkable if c.y == 0][0]
+        end = [c for c in all_valid_walkable if c.y == grid.height - 1][0]
 
         # Let's simplify our graph. We only care about a point if we have 3 ways to get to it (or start/end)
-        we_care_about_you: set[Coordinate] = {self.start, self.end}
+        we_care_about_you: set[Coordinate] = {start, end}
         for coordinate in all_valid_walkable:
             if sum(grid[n] in walkable for n in coordinate.neighbors()) > 2:
                 we_care_about_you.add(coordinate)
 
-        self.icy_hike.compress(*we_care_about_you, keep_logic=CompressionWhatToKeep.ALL)
-        self.horrible_hike.compress(*we_care_about_you, keep_logic=CompressionWhatToKeep.ALL)
+        icy_hike.compress(*we_care_about_you, keep_logic=CompressionWhatToKeep.ALL)
+        horrible_hike.compress(*we_care_about_you, keep_logic=CompressionWhatToKeep.ALL)
+
+        return icy_hike, horrible_hike, start, end
 
     def part1(self):
         result = self.icy_hike.get_weight(self.icy_hike.flood_find_max(self.start, self.end))
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.horrible_hike.get_weight(self.horrible_hike.flood_find_max(self.start, self.end))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D23("2023/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -3,8 +3,6 @@ from dataclasses import dataclass
 from itertools import permutations, combinations
 from typing import Optional
 
-from z3 import Solver, Int, And
-
 from aoc.util.inputs import Input
 
 
@@ -74,9 +72,11 @@ class Y2023D24(object):
             if min_value < intersection.x < max_value and min_value < intersection.y < max_value:
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
+        from z3 import Solver, Int, And
+
         # I don't remember how to solve this system of equations, so Z3 to the rescue
         s = Solver()
 
@@ -99,10 +99,10 @@ class Y2023D24(object):
         model = s.model()
         result = model[rock_x].as_long() + model[rock_y].as_long() + model[rock_z].as_long()
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D24("2023/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
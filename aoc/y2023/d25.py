@@ -30,9 +30,9 @@ class Y2023D25(object):
     def part1(self):
         result = prod(len(sep.all_nodes) for sep in self.graph.separate())
 
-        print("Part 1:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D25("2023/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
@@ -42,7 +42,7 @@ class Y2023D3(object):
 
     def part1(self):
         result = sum(sum(x) for x in self.adjacent_map.values())
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -56,10 +56,10 @@ class Y2023D3(object):
 
             result += prod(values)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D3("2023/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -61,7 +61,7 @@ class Y2023D4(object):
     def part1(self):
         result = sum(card.worth for card in self.cards)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         scratchcards = Counter()
@@ -75,10 +75,10 @@ class Y2023D4(object):
 
         result = sum(v for v in scratchcards.values())
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2023D4("2023/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from tqdm import tqdm
-
 from aoc.util.inputs import Input
 
 
@@ -149,7 +147,7 @@ class Y2023D5(object):
 
             result = min_location if result is None else min(result, min_location)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = None
@@ -161,7 +159,7 @@ class Y2023D5(object):
 
             result = min_location if result is None else min(result, min_location)
 
-        print("Part 2:", result)
+        return result
 
     def _get_min_location(self, seed_range):
         soil = self.seed_to_soil_map.chop(seed_range)
@@ -178,5 +176,5 @@ class Y2023D5(object):
 
 if __name__ == '__main__':
     code = Y2023D5("2023/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
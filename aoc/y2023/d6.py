@@ -19,7 +19,7 @@ class Y2023D6(object):
     def part1(self):
         result = self._race(self.times, self.distances)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         times = [int(''.join(str(x) for x in self.times))]
@@ -27,7 +27,7 @@ class Y2023D6(object):
 
         result = self._race(times, distances)
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _race(times, distances):
@@ -45,5 +45,5 @@ class Y2023D6(object):
 
 if __name__ == '__main__':
     code = Y2023D6("2023/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -108,12 +108,12 @@ class Y2023D7(object):
     def part1(self):
         result = self.determine_score(self.hands)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self.determine_score([h.make_wild for h in self.hands])
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def determine_score(hands):
@@ -126,5 +126,5 @@ class Y2023D7(object):
 
 if __name__ == '__main__':
     code = Y2023D7("2023/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
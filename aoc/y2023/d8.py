@@ -23,7 +23,7 @@ class Y2023D8(object):
     def part1(self):
         result = self._find_steps_required('AAA', lambda n: n == 'ZZZ')
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         nodes_ending_with_a = [node for node in self.left.keys() if node[-1] == 'A']
@@ -36,7 +36,7 @@ class Y2023D8(object):
 
         result = math.lcm(*steps_taken)
 
-        print("Part 2:", result)
+        return result
 
     def _find_steps_required(self, current_node, test):
         steps_taken = 0
@@ -55,5 +55,5 @@ class Y2023D8(object):
 
 if __name__ == '__main__':
     code = Y2023D8("2023/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
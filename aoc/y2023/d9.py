@@ -15,7 +15,7 @@ class Y2023D9(object):
         for measurement in self.measurements:
             result += self._find_next_measurement(measurement, backwards=False)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -23,7 +23,7 @@ class Y2023D9(object):
         for measurement in self.measurements:
             result += self._find_next_measurement(measurement, backwards=True)
 
-        print("Part 2:", result)
+        return result
 
     def _find_next_measurement(self, measurement: list[int], backwards: bool) -> int:
         all_are_zeros = all([x == 0 for x in measurement])
@@ -41,5 +41,5 @@ class Y2023D9(object):
 
 if __name__ == '__main__':
     code = Y2023D9("2023/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
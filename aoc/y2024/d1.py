@@ -32,7 +32,7 @@ class Y2024D1(object):
             left_copy.remove(left)
             right_copy.remove(right)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         c = Counter(self._right_location_ids)
@@ -42,10 +42,10 @@ class Y2024D1(object):
         for left in self._left_location_ids:
             result += left * c[left]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D1("2024/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
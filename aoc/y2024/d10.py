@@ -27,12 +27,12 @@ class Y2024D10(object):
     def part1(self):
         result = sum(len(nines) for nines in self._nines.values())
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum(self._get_rating(zero) for zero in self._graphs.keys())
 
-        print("Part 2:", result)
+        return result
 
     def _get_rating(self, zero_coordinate: Coordinate) -> int:
         sub_graph = self._graphs[zero_coordinate]
@@ -62,5 +62,5 @@ class Y2024D10(object):
 
 if __name__ == '__main__':
     code = Y2024D10("2024/10.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -76,16 +76,16 @@ class Y2024D11(object):
         blinker = StoneBlinker(25)
         result = sum(blinker(x) for x in self._stones)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         blinker = StoneBlinker(75)
         result = sum(blinker(x) for x in self._stones)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D11("2024/11.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
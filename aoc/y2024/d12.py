@@ -95,7 +95,7 @@ class Y2024D12(object):
 
             result += perimeter * area
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -117,10 +117,10 @@ class Y2024D12(object):
 
             result += perimeter * area
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D12("2024/12.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -97,7 +97,7 @@ class Y2024D13(object):
             if presses is not None:
                 result += presses
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -107,10 +107,10 @@ class Y2024D13(object):
             if presses is not None:
                 result += presses
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D13("2024/13.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
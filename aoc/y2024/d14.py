@@ -8,8 +8,6 @@ from itertools import count
 from pathlib import Path
 from typing import Tuple
 
-from PIL import Image, ImageDraw
-
 from aoc.util.coordinate import Coordinate, CoordinateSystem
 from aoc.util.inputs import Input
 
@@ -74,7 +72,7 @@ class Y2024D14(object):
                 c[GridQuadrant.BOTTOM_RIGHT] += 1
 
         result = reduce(lambda x, y: x * y, c.values())
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         # This is how I first found what the tree looked like and where it was.
@@ -101,9 +99,11 @@ class Y2024D14(object):
                 break
 
 
-        print("Part 2:", result)
+        return result
 
     def _write_out_images(self):
+        from PIL import Image, ImageDraw
+
         scratch_dir = Path(__file__).parent.parent.parent / "scratch" / "2024" / "14"
         scratch_dir.mkdir(parents=True, exist_ok=True)
         for i in range(0, 10000):
@@ -118,5 +118,5 @@ class Y2024D14(object):
 
 if __name__ == '__main__':
     code = Y2024D14("2024/14.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -46,7 +46,7 @@ class Y2024D15(object):
         boxes = grid.find('O')
         result = sum(b.y * 100 + b.x for b in boxes)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         wide_grid = Grid[str](2 * self._grid_start.width, self._grid_start.height)
@@ -128,10 +128,10 @@ class Y2024D15(object):
         boxes = wide_grid.find('[')
         result = sum(b.y * 100 + b.x for b in boxes)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D15("2024/15.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -5,6 +5,7 @@ from aoc.util.coordinate import Coordinate, Turtle, TurtleDirection
 from aoc.util.graph import Graph, TurtleHeuristic
 from aoc.util.grid import Grid
 from aoc.util.inputs import Input
+from aoc.util.queue import BucketQueue
 
 
 class Y2024D16(object):
@@ -24,17 +25,17 @@ class Y2024D16(object):
         return self._graph.find_path(starting_node, self._ending_turtle, heuristic)
 
     def part1(self):
-        path = self._find_path_from_node(self._starting_turtle)
-        result = self._graph.get_weight(path)
+        shortest = self._graph.shortest_path(self._starting_turtle, self._ending_turtle, TurtleHeuristic(), BucketQueue)
+        result = shortest.cost
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         all_nodes = self._graph.get_all_nodes_with_shortest_path(self._starting_turtle, self._find_path_from_node)
         all_coordinates = set(t.coordinate for t in all_nodes)
         result = len(all_coordinates)
 
-        print("Part 2:", result)
+        return result
 
     def _graph_from_grid(self) -> Graph[Turtle]:
         graph: Graph[Turtle] = Graph(directional=True)
@@ -97,5 +98,5 @@ class Y2024D16(object):
 
 if __name__ == '__main__':
     code = Y2024D16("2024/16.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
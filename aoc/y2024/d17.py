@@ -1,12 +1,14 @@
+from __future__ import annotations
+
 import re
 from queue import Queue
-from typing import Callable, Optional
-
-import z3
-from z3 import Solver, Int, BitVec, ULT
+from typing import Callable, Optional, TYPE_CHECKING
 
 from aoc.util.inputs import Input
 
+if TYPE_CHECKING:
+    from z3 import BitVec, Int
+
 OutputCallback = Callable[[int], None]
 
 
@@ -71,6 +73,8 @@ class Z3Computer:
     _bit_length = 64
 
     def __init__(self, program: list[int], b: int, c: int, max_a: Optional[int] = None):
+        from z3 import Solver, BitVec, ULT
+
         self._solver = Solver()
         self._program = program
         self._initial_a: BitVec = BitVec("a", self._bit_length)
@@ -89,6 +93,8 @@ class Z3Computer:
         self._solver.add(self._register_c == c)
 
     def run(self) -> Optional[int]:
+        import z3
+
         for iteration_count in range(len(self._program)):
             for instruction_pointer in range(0, len(self._program), 2):
                 opcode = self._program[instruction_pointer]
@@ -161,7 +167,7 @@ class Y2024D17(object):
 
         result = ",".join(str(x) for x in computer.run())
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         max_a = None
@@ -178,7 +184,7 @@ class Y2024D17(object):
             else:
                 max_a = run_result  # New max_a!
 
-        print("Part 2:", result)
+        return result
 
     def part2_not_z3(self):
         result = 0
@@ -202,11 +208,11 @@ class Y2024D17(object):
                 if good_candidate:
                     q.put(option)
 
-        print("Part 2 [not z3]:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D17("2024/17.txt")
-    code.part1()
-    code.part2()
-    code.part2_not_z3()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
+    print("Part 2 [not z3]:", code.part2_not_z3())
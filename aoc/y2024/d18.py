@@ -1,5 +1,3 @@
-from tqdm import tqdm
-
 from aoc.util.coordinate import Coordinate, CoordinateSystem
 from aoc.util.grid import Grid
 from aoc.util.inputs import Input
@@ -29,7 +27,7 @@ class Y2024D18(object):
         )
         result = len(path) - 1  # steps required, not coordinates
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         grid: Grid[str] = Grid(self.grid_end + 1, self.grid_end + 1)
@@ -58,10 +56,10 @@ class Y2024D18(object):
 
 
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D18("2024/18.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -27,12 +27,12 @@ class Y2024D19(object):
     def part1(self):
         result = sum(1 for t in self._wanted_towels if self._arrangement_count(t) > 0)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = sum(self._arrangement_count(t) for t in self._wanted_towels)
 
-        print("Part 2:", result)
+        return result
 
     @functools.cache
     def _arrangement_count(self, towel: str) -> int:
@@ -59,5 +59,5 @@ class Y2024D19(object):
 
 if __name__ == '__main__':
     code = Y2024D19("2024/19.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -15,7 +15,7 @@ class Y2024D2(object):
             if self._is_report_safe(report):
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -30,7 +30,7 @@ class Y2024D2(object):
             if any_safe:
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _is_report_safe(report: list[int]) -> bool:
@@ -48,5 +48,5 @@ class Y2024D2(object):
 
 if __name__ == '__main__':
     code = Y2024D2("2024/2.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -14,12 +14,12 @@ class Y2024D20(object):
     def part1(self):
         result = self._get_total_shortcuts(2, 100)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._get_total_shortcuts(20, 100)
 
-        print("Part 2:", result)
+        return result
 
     def _get_total_shortcuts(self, picosecond_jump: int, time_savings_needed: int) -> int:
         result = 0
@@ -45,5 +45,5 @@ class Y2024D20(object):
 
 if __name__ == '__main__':
     code = Y2024D20("2024/20.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
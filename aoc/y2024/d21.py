@@ -62,7 +62,7 @@ class Y2024D21(object):
             entry_cost = self._get_entry_cost(numpad_entry, 2)
             result += entry_cost
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -70,7 +70,7 @@ class Y2024D21(object):
             entry_cost = self._get_entry_cost(numpad_entry, 25)
             result += entry_cost
 
-        print("Part 2:", result)
+        return result
 
     def _get_entry_cost(self, numpad_entry: str, robot_levels: int) -> int:
         keypad_cost = self._keypad_cost(numpad_entry, robot_levels)
@@ -128,5 +128,5 @@ class Y2024D21(object):
 
 if __name__ == '__main__':
     code = Y2024D21("2024/21.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
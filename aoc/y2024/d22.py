@@ -18,7 +18,7 @@ class Y2024D22(object):
                 secret = next_secret
             result += secret
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         buyer_total_best = Counter()
@@ -40,7 +40,7 @@ class Y2024D22(object):
         most_common = buyer_total_best.most_common(1)[0]
         result = most_common[1]
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     @functools.cache
@@ -61,5 +61,5 @@ class Y2024D22(object):
 
 if __name__ == '__main__':
     code = Y2024D22("2024/22.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
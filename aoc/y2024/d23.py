@@ -56,16 +56,16 @@ class Y2024D23(object):
             if a[0] == 't' or b[0] == 't' or c[0] == 't':
                 result += 1
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         network = max(self._computer_networks, key=lambda n: len(n))
         result = ",".join(sorted(list(network)))
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D23("2024/23.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
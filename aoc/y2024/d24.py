@@ -366,7 +366,7 @@ class Y2024D24(object):
     def part1(self):
         result = self._incorrect_adder.result
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = None
@@ -411,7 +411,7 @@ class Y2024D24(object):
                 union = swappable.union({(a, b)})
                 q.put(union)
 
-        print("Part 2:", result)
+        return result
 
     def _make_full_adder(self) -> list[BinaryGate]:
         carry = Constant(False)
@@ -477,5 +477,5 @@ class Y2024D24(object):
 
 if __name__ == '__main__':
     code = Y2024D24("2024/24.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -35,9 +35,9 @@ class Y2024D25(object):
 
         print(result)
 
-        print("Part 1:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D25("2024/25.txt")
-    code.part1()
+    print("Part 1:", code.part1())
@@ -19,7 +19,7 @@ class Y2024D3(object):
             for a, b in search:
                 result += int(a) * int(b)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -50,10 +50,10 @@ class Y2024D3(object):
                         result += int(multiply_match.group(1)) * int(multiply_match.group(2))
                     position = multiply_match.span()[-1]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D3("2024/3.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
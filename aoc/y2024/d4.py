@@ -50,7 +50,7 @@ class Y2024D4(object):
 
         result = c["XMAS"] + c["SAMX"]
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         bounding_box: BoundingBox = self._grid.bounding_box
@@ -70,10 +70,10 @@ class Y2024D4(object):
 
         result = c["MSAMS"] + c["MMASS"] + c["SSAMM"] + c["SMASM"]
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D4("2024/4.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -36,15 +36,15 @@ class Y2024D5(object):
     def part1(self):
         result = self._correct_update_count
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._incorrect_update_count
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D5("2024/5.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -1,5 +1,3 @@
-from tqdm import tqdm
-
 from aoc.util.coordinate import Turtle, TurtleDirection, Coordinate
 from aoc.util.inputs import Input
 
@@ -24,7 +22,7 @@ class Y2024D6(object):
     def part1(self):
         result = len(self._valid_coordinates)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -36,7 +34,7 @@ class Y2024D6(object):
             if self._causes_a_loop(coordinate):
                 result += 1
 
-        print("Part 2:", result)
+        return result
 
     def _causes_a_loop(self, obstacle: Coordinate) -> bool:
         new_grid = self._grid.copy()
@@ -60,5 +58,5 @@ class Y2024D6(object):
 
 if __name__ == '__main__':
     code = Y2024D6("2024/6.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -2,8 +2,6 @@ import operator
 from dataclasses import dataclass
 from itertools import product
 
-from tqdm import tqdm
-
 from aoc.util.inputs import Input
 
 
@@ -15,16 +13,10 @@ class Calibration:
 
 class Y2024D7(object):
     def __init__(self, file_name):
-        lines = Input(file_name).lines()
-
-        self._calibrations: list[Calibration] = []
-        for line in lines:
-            result, numbers = line.split(':')
-
-            self._calibrations.append(Calibration(
-                result=int(result.strip()),
-                values=[int(x) for x in numbers.strip().split()]
-            ))
+        self._calibrations: list[Calibration] = [
+            Calibration(result=result, values=list(values))
+            for result, *values in Input(file_name).int_rows()
+        ]
 
     def part1(self):
         result = 0
@@ -33,7 +25,7 @@ class Y2024D7(object):
             if self._is_valid_result(calibration):
                 result += calibration.result
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = 0
@@ -42,7 +34,7 @@ class Y2024D7(object):
             if self._is_valid_result(calibration, True):
                 result += calibration.result
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def _is_valid_result(calibration: Calibration, support_concat=False) -> bool:
@@ -69,5 +61,5 @@ class Y2024D7(object):
 
 if __name__ == '__main__':
     code = Y2024D7("2024/7.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
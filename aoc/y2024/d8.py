@@ -31,7 +31,7 @@ class Y2024D8(object):
                     antinodes.add(antinode_b)
         result = len(antinodes)
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         antinodes = set()
@@ -52,10 +52,10 @@ class Y2024D8(object):
 
         result = len(antinodes)
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2024D8("2024/8.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
@@ -57,7 +57,7 @@ class Y2024D9(object):
 
         result = sum([block_id * file_number for (block_id, file_number) in disk_map.items()])
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         disk_map = self._disk_map.copy()
@@ -97,7 +97,7 @@ class Y2024D9(object):
 
         result = sum([block_id * file_number for (block_id, file_number) in disk_map.items()])
 
-        print("Part 2:", result)
+        return result
 
     @staticmethod
     def disk_print(disk_map: dict[int, int]):
@@ -111,5 +111,5 @@ class Y2024D9(object):
 
 if __name__ == '__main__':
     code = Y2024D9("2024/9.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
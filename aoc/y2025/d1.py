@@ -45,15 +45,15 @@ class Y2025D1(object):
     def part1(self):
         result = self._dial.exactly_zero_counter
 
-        print("Part 1:", result)
+        return result
 
     def part2(self):
         result = self._dial.touches_zero_counter
 
-        print("Part 2:", result)
+        return result
 
 
 if __name__ == '__main__':
     code = Y2025D1("2025/1.txt")
-    code.part1()
-    code.part2()
+    print("Part 1:", code.part1())
+    print("Part 2:", code.part2())
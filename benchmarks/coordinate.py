@@ -0,0 +1,92 @@
+"""
+Coordinate against the frozen dataclass it replaced. Run with:
+
+    python -m benchmarks.coordinate
+"""
+from __future__ import annotations
+
+import timeit
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+from aoc.util.coordinate import Coordinate, CoordinateSystem
+
+
+@dataclass(frozen=True)
+class DataclassCoordinate(object):
+    """
+    The old Coordinate, trimmed down to what's measured here.
+    """
+    x: int
+    y: int
+    system: CoordinateSystem = CoordinateSystem.X_RIGHT_Y_UP
+
+    def right(self, count=1) -> DataclassCoordinate:
+        return DataclassCoordinate(self.x + self.system.dx * count, self.y, system=self.system)
+
+    def left(self, count=1) -> DataclassCoordinate:
+        return DataclassCoordinate(self.x - self.system.dx * count, self.y, system=self.system)
+
+    def up(self, count=1) -> DataclassCoordinate:
+        return DataclassCoordinate(self.x, self.y + self.system.dy * count, system=self.system)
+
+    def down(self, count=1) -> DataclassCoordinate:
+        return DataclassCoordinate(self.x, self.y - self.system.dy * count, system=self.system)
+
+    def neighbors(self):
+        return [self.up(), self.down(), self.left(), self.right()]
+
+    def neighbors8(self):
+        return [
+            self.up(),
+            self.down(),
+            self.left(),
+            self.right(),
+            self.up().left(),
+            self.up().right(),
+            self.down().left(),
+            self.down().right(),
+        ]
+
+
+def _cases(cls) -> List[Tuple[str, Callable[[], object]]]:
+    system = CoordinateSystem.X_RIGHT_Y_DOWN
+    points = [cls(x, y, system=system) for y in range(100) for x in range(100)]
+    lookup = {point: True for point in points}
+    probes = [cls(x, y, system=system) for y in range(100) for x in range(100)]
+
+    def flood():
+        # A plain BFS over a 100x100 open grid, about what most grid days spend their time on
+        start = cls(0, 0, system=system)
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for point in frontier:
+                for neighbor in point.neighbors():
+                    if neighbor in lookup and neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return seen
+
+    return [
+        ('construct', lambda: [cls(x, y, system=system) for y in range(100) for x in range(100)]),
+        ('neighbors', lambda: [point.neighbors() for point in points]),
+        ('neighbors8', lambda: [point.neighbors8() for point in points]),
+        ('dict lookup', lambda: [lookup[probe] for probe in probes]),
+        ('set build', lambda: set(probes)),
+        ('flood', flood),
+    ]
+
+
+def main(number: int = 20):
+    print(f"{'':<12} {'dataclass':>12} {'Coordinate':>12} {'speedup':>8}")
+    for (name, old), (_, new) in zip(_cases(DataclassCoordinate), _cases(Coordinate)):
+        old_time = min(timeit.repeat(old, number=number, repeat=3)) / number
+        new_time = min(timeit.repeat(new, number=number, repeat=3)) / number
+        print(f"{name:<12} {old_time * 1000:10.3f}ms {new_time * 1000:10.3f}ms {old_time / new_time:7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
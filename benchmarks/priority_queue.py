@@ -0,0 +1,75 @@
+"""
+TuplePriorityQueue against the dataclass backed PriorityQueue. Run with:
+
+    python -m benchmarks.priority_queue
+"""
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Callable, List, Tuple
+
+from aoc.util.queue import PriorityQueue, TuplePriorityQueue
+
+SIZE = 10_000
+
+
+def _cases(cls) -> List[Tuple[str, Callable[[], object]]]:
+    rng = random.Random(0)
+    priorities = [rng.randrange(1000) for _ in range(SIZE)]
+    pairs = [(i, priority) for i, priority in enumerate(priorities)]
+
+    def push():
+        queue = cls()
+        for item, priority in pairs:
+            queue.push(item, priority)
+        return queue
+
+    full = push()
+
+    def pop():
+        # Copy the filled heap rather than pushing again, so this is only the pops
+        queue = cls()
+        queue._elements = list(full._elements)
+        while queue:
+            queue.pop()
+
+    def push_many():
+        queue = cls()
+        if hasattr(queue, 'push_many'):
+            queue.push_many(pairs)
+        else:
+            for item, priority in pairs:
+                queue.push(item, priority)
+        return queue
+
+    def search():
+        # Dijkstra shaped traffic: pop one, push a few slightly worse ones
+        queue = cls()
+        queue.push(0, 0)
+        pushed = 1
+        while queue and pushed < SIZE:
+            item = queue.pop()
+            for step in (1, 2, 3):
+                queue.push(item + step, item + step)
+                pushed += 1
+
+    return [
+        ('push', push),
+        ('pop', pop),
+        ('push_many', push_many),
+        ('search', search),
+    ]
+
+
+def main(number: int = 20):
+    print(f"{'':<12} {'dataclass':>12} {'tuple':>12} {'speedup':>8}")
+    for (name, old), (_, new) in zip(_cases(PriorityQueue), _cases(TuplePriorityQueue)):
+        old_time = min(timeit.repeat(old, number=number, repeat=3)) / number
+        new_time = min(timeit.repeat(new, number=number, repeat=3)) / number
+        print(f"{name:<12} {old_time / SIZE * 1e9:10.0f}ns {new_time / SIZE * 1e9:10.0f}ns "
+              f"{old_time / new_time:7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+import pickle
+import unittest
+
+from aoc.util.grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+    def test_pickle_keeps_unset_cells_unset(self):
+        grid = Grid.from_str(['#.', '.#'])
+        del grid[1, 0]
+
+        copy = pickle.loads(pickle.dumps(grid))
+
+        self.assertNotIn((1, 0), copy)
+        self.assertIsNone(copy[1, 0])
+        self.assertEqual(3, len(copy.keys()))
+        self.assertEqual(grid.items(), copy.items())
+
+
+if __name__ == '__main__':
+    unittest.main()